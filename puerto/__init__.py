@@ -0,0 +1,77 @@
+"""
+Sistema de gestión de embarcaciones para puerto deportivo
+Las clases del modelo se importan siempre; los subsistemas (NumPy, persistencia, servidores,
+procesos) se importan la primera vez que se usa uno de sus nombres
+"""
+
+import importlib
+
+from .embarcacion import Embarcacion
+from .excepciones import IllegalArgumentException
+from .i_navegable import INavegable
+from .i_regateable import IRegateable
+from .lancha import Lancha
+from .oyente_embarcacion import OyenteEmbarcacion
+from .simbolos import TablaSimbolos
+from .velero import Velero
+
+
+# Nombre público -> módulo que lo define, importado bajo demanda
+_PEREZOSOS = {
+    "EscritorArchivo": "archivo",
+    "LectorArchivo": "archivo",
+    "AgregadosFlota": "agregados",
+    "GestorAmarres": "amarres",
+    "PlanAsignacion": "asignacion",
+    "planificar": "asignacion",
+    "repartir_tripulacion": "asignacion",
+    "ClasificacionElo": "clasificacion",
+    "TablaPuntuaciones": "clasificacion",
+    "Campo": "consultas",
+    "Consulta": "consultas",
+    "IndiceHash": "consultas",
+    "Predicado": "consultas",
+    "ConjuntoCambios": "diferencias",
+    "diferenciar": "diferencias",
+    "BusEventos": "eventos",
+    "FlotaDistribuida": "flota_distribuida",
+    "GeneradorCarga": "generador",
+    "generar_ficheros": "generador",
+    "generar_flota": "generador",
+    "HistorialNavegacion": "historial",
+    "LectorFlota": "memoria_compartida",
+    "PublicadorFlota": "memoria_compartida",
+    "ExportadorMetricas": "metricas",
+    "MetricasMetodos": "metricas",
+    "ModeloPolar": "polar",
+    "SimulacionViento": "polar",
+    "DetectorProximidad": "proximidad",
+    "PlanificadorRepostaje": "repostaje",
+    "PlanificadorRutas": "rutas",
+    "FlotaEmpaquetada": "serializacion",
+    "escribir_flota": "serializacion",
+    "leer_flota": "serializacion",
+    "ServidorTelemetria": "telemetria",
+    "TransaccionSalidas": "transaccion",
+    "iniciar_navegacion_lote": "transaccion",
+}
+
+__all__ = [
+    "Embarcacion", "IllegalArgumentException", "INavegable", "IRegateable", "Lancha",
+    "OyenteEmbarcacion", "TablaSimbolos", "Velero",
+] + sorted(_PEREZOSOS)
+
+
+def __getattr__(nombre):
+    modulo = _PEREZOSOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    
+    # Se guarda en el paquete para que las siguientes búsquedas no pasen por aquí
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PEREZOSOS))
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Punto de entrada: python -m puerto <orden> [argumentos]
+"""
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+Agregados incrementales de la flota
+Sumas y recuentos por (tipo, rumbo) y ventanas horarias, actualizados en cada cambio de estado
+para que cualquier métrica se consulte en O(1)
+"""
+
+import time
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .oyente_embarcacion import OyenteEmbarcacion
+
+
+class AgregadosFlota(OyenteEmbarcacion):
+    """Motor de agregados: se registra como oyente de Embarcacion"""
+    
+    DURACION_VENTANA = 3600
+    MAX_VENTANAS = 48
+    
+    def __init__(self, barcos=None, reloj=None):
+        """Constructor de AgregadosFlota (barcos: flota ya existente con la que inicializar)"""
+        
+        self._reloj = reloj if reloj is not None else time.time
+        
+        # (tipo, rumbo) -> [barcos navegando, suma de velocidades]; None actúa de comodín
+        self._navegacion = {}
+        
+        # tipo -> [barcos, combustible, horas navegadas]; None es el total de la flota
+        self._totales = {}
+        
+        # inicio de ventana -> {tipo: [horas, sesiones]}; las horas de cada sesión se reparten entre
+        # las ventanas que abarca y la sesión cuenta en la ventana en que termina
+        self._ventanas = {}
+        
+        if barcos is not None:
+            for barco in barcos:
+                self.al_crear(barco)
+                self._sumar_horas(type(barco).__name__, barco._tiempo_total_navegacion)
+                if barco._navegando:
+                    self.al_iniciar_navegacion(barco)
+    
+    # ========== ALTA Y BAJA EN EL OYENTE ==========
+    
+    def conectar(self):
+        """Empieza a recibir los cambios de todas las embarcaciones"""
+        Embarcacion.registrar_oyente(self)
+        return self
+    
+    def desconectar(self):
+        Embarcacion.eliminar_oyente(self)
+    
+    # ========== ACTUALIZACIÓN INCREMENTAL ==========
+    
+    def _sumar_navegacion(self, tipo, rumbo, barcos, velocidad):
+        navegacion = self._navegacion
+        for clave in ((tipo, rumbo), (tipo, None), (None, rumbo), (None, None)):
+            acumulado = navegacion.get(clave)
+            if acumulado is None:
+                acumulado = navegacion[clave] = [0, 0]
+            acumulado[0] += barcos
+            acumulado[1] += velocidad
+    
+    def _sumar_totales(self, tipo, barcos, combustible):
+        for clave in (tipo, None):
+            acumulado = self._totales.get(clave)
+            if acumulado is None:
+                acumulado = self._totales[clave] = [0, 0, 0.0]
+            acumulado[0] += barcos
+            acumulado[1] += combustible
+    
+    def _sumar_horas(self, tipo, horas):
+        for clave in (tipo, None):
+            acumulado = self._totales.get(clave)
+            if acumulado is None:
+                acumulado = self._totales[clave] = [0, 0, 0.0]
+            acumulado[2] += horas
+    
+    @staticmethod
+    def _inicio_ventana(instante):
+        return int(instante // AgregadosFlota.DURACION_VENTANA) * AgregadosFlota.DURACION_VENTANA
+    
+    def _ventana(self, inicio):
+        ventana = self._ventanas.get(inicio)
+        if ventana is None:
+            ventana = self._ventanas[inicio] = {}
+            # Solo se conservan las últimas MAX_VENTANAS ventanas: se descarta la más antigua
+            if len(self._ventanas) > AgregadosFlota.MAX_VENTANAS:
+                del self._ventanas[min(self._ventanas)]
+        return ventana
+    
+    def _sumar_ventana(self, inicio, tipo, horas, sesiones):
+        ventana = self._ventana(inicio)
+        for clave in (tipo, None):
+            acumulado = ventana.get(clave)
+            if acumulado is None:
+                acumulado = ventana[clave] = [0.0, 0]
+            acumulado[0] += horas
+            acumulado[1] += sesiones
+    
+    def _repartir_sesion(self, tipo, tiempo_navegando):
+        """Reparte las horas de una sesión que termina ahora (según el reloj) entre las ventanas que abarca"""
+        
+        duracion = AgregadosFlota.DURACION_VENTANA
+        fin = self._reloj()
+        inicio = fin - tiempo_navegando * 3600
+        
+        # Las ventanas anteriores a las que se conservan no reciben horas
+        ventana_fin = self._inicio_ventana(fin)
+        ventana = max(self._inicio_ventana(inicio), ventana_fin - (AgregadosFlota.MAX_VENTANAS - 1) * duracion)
+        while ventana < ventana_fin:
+            horas = (ventana + duracion - max(inicio, ventana)) / 3600
+            if horas > 0:
+                self._sumar_ventana(ventana, tipo, horas, 0)
+            ventana += duracion
+        
+        self._sumar_ventana(ventana_fin, tipo, (fin - max(inicio, ventana_fin)) / 3600, 1)
+    
+    def al_crear(self, barco):
+        combustible = barco._cantidad_combustible if isinstance(barco, Lancha) else 0
+        self._sumar_totales(type(barco).__name__, 1, combustible)
+    
+    def al_iniciar_navegacion(self, barco):
+        self._sumar_navegacion(type(barco).__name__, barco._rumbo, 1, barco._velocidad)
+    
+    def al_iniciar_navegacion_lote(self, barcos):
+        # Se agrupa por (tipo, rumbo) para tocar cada acumulado una sola vez
+        grupos = {}
+        for barco in barcos:
+            clave = (type(barco).__name__, barco._rumbo)
+            acumulado = grupos.get(clave)
+            if acumulado is None:
+                acumulado = grupos[clave] = [0, 0]
+            acumulado[0] += 1
+            acumulado[1] += barco._velocidad
+        for (tipo, rumbo), (num, velocidad) in grupos.items():
+            self._sumar_navegacion(tipo, rumbo, num, velocidad)
+    
+    def al_cambiar_rumbo(self, barco, rumbo_anterior):
+        tipo = type(barco).__name__
+        self._sumar_navegacion(tipo, rumbo_anterior, -1, -barco._velocidad)
+        self._sumar_navegacion(tipo, barco._rumbo, 1, barco._velocidad)
+    
+    def al_cambiar_velocidad(self, barco, velocidad_anterior):
+        self._sumar_navegacion(type(barco).__name__, barco._rumbo, 0, barco._velocidad - velocidad_anterior)
+    
+    def al_parar_navegacion(self, barco, tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido):
+        tipo = type(barco).__name__
+        self._sumar_navegacion(tipo, rumbo, -1, -velocidad)
+        self._sumar_totales(tipo, 0, -combustible_consumido)
+        self._sumar_horas(tipo, tiempo_navegando)
+        self._repartir_sesion(tipo, tiempo_navegando)
+    
+    def al_repostar(self, barco, cantidad):
+        self._sumar_totales(type(barco).__name__, 0, cantidad)
+    
+    # ========== CONSULTAS O(1) ==========
+    
+    @staticmethod
+    def _tipo(tipo):
+        """Acepta la clase (Lancha, Velero) o su nombre"""
+        return tipo.__name__ if isinstance(tipo, type) else tipo
+    
+    def barcos_navegando(self, tipo=None, rumbo=None):
+        acumulado = self._navegacion.get((self._tipo(tipo), rumbo))
+        return acumulado[0] if acumulado else 0
+    
+    def velocidad_media(self, tipo=None, rumbo=None):
+        acumulado = self._navegacion.get((self._tipo(tipo), rumbo))
+        if not acumulado or acumulado[0] == 0:
+            return 0.0
+        return acumulado[1] / acumulado[0]
+    
+    def navegando_por_rumbo(self):
+        """(tipo, rumbo, barcos navegando) de cada combinación concreta registrada"""
+        return [
+            (tipo, rumbo, valores[0]) for (tipo, rumbo), valores in list(self._navegacion.items())
+            if tipo is not None and rumbo is not None
+        ]
+    
+    def num_barcos(self, tipo=None):
+        acumulado = self._totales.get(self._tipo(tipo))
+        return acumulado[0] if acumulado else 0
+    
+    def combustible_total(self):
+        acumulado = self._totales.get(Lancha.__name__)
+        return acumulado[1] if acumulado else 0
+    
+    def horas_navegadas(self, tipo=None):
+        acumulado = self._totales.get(self._tipo(tipo))
+        return acumulado[2] if acumulado else 0.0
+    
+    def horas_en_ventana(self, tipo=None, instante=None):
+        """Horas navegadas dentro de la ventana horaria del instante (por defecto, la actual) por sesiones ya terminadas"""
+        
+        if instante is None:
+            instante = self._reloj()
+        inicio = self._inicio_ventana(instante)
+        
+        acumulado = self._ventanas.get(inicio, {}).get(self._tipo(tipo))
+        return acumulado[0] if acumulado else 0.0
+    
+    def sesiones_en_ventana(self, tipo=None, instante=None):
+        """Sesiones terminadas en la ventana horaria del instante (por defecto, la actual)"""
+        
+        if instante is None:
+            instante = self._reloj()
+        inicio = self._inicio_ventana(instante)
+        
+        acumulado = self._ventanas.get(inicio, {}).get(self._tipo(tipo))
+        return acumulado[1] if acumulado else 0
+    
+    def resumen(self):
+        """Todas las métricas del panel en un diccionario"""
+        
+        return {
+            "num_barcos": self.num_barcos(),
+            "barcos_navegando": self.barcos_navegando(),
+            "barcos_navegando_por_rumbo": {
+                rumbo: valores[0] for (tipo, rumbo), valores in self._navegacion.items()
+                if tipo is None and rumbo is not None and valores[0]
+            },
+            "velocidad_media_lanchas": self.velocidad_media(Lancha),
+            "combustible_total": self.combustible_total(),
+            "horas_navegadas": self.horas_navegadas(),
+            "horas_hora_actual": self.horas_en_ventana(),
+        }
\ No newline at end of file
@@ -0,0 +1,312 @@
+"""
+Asignación de amarres
+Los amarres libres de cada clase de tamaño se guardan en montículos ordenados por número de
+amarre, así que asignar un amarre a un barco que llega y liberarlo cuando sale cuesta O(log n)
+"""
+
+import heapq
+import random
+import time
+import weakref
+from bisect import bisect_left
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .oyente_embarcacion import OyenteEmbarcacion
+from .velero import Velero
+
+
+CLASES = ("pequeño", "mediano", "grande", "extra")
+
+# Tamaño máximo de cada clase salvo la última (sin límite)
+LIMITES_CLASE = (6, 10, 16)
+
+# Peso de cada motor y de cada mástil en el tamaño del barco, además de su tripulación máxima
+PESO_MOTOR = 2
+PESO_MASTIL = 3
+
+
+def tamaño_barco(barco):
+    """Tamaño estimado del barco a partir de su tripulación máxima y sus motores o mástiles"""
+    
+    tamaño = barco._num_max_tripulantes
+    if isinstance(barco, Lancha):
+        tamaño += PESO_MOTOR * barco._num_motores
+    elif isinstance(barco, Velero):
+        tamaño += PESO_MASTIL * barco._num_mastiles
+    return tamaño
+
+
+def clase_barco(barco):
+    """Índice en CLASES de la clase de amarre más pequeña en la que cabe el barco"""
+    return bisect_left(LIMITES_CLASE, tamaño_barco(barco))
+
+
+class _Ocupante(weakref.ref):
+    """Referencia débil al barco amarrado que recuerda su amarre"""
+    
+    __slots__ = ("amarre", "clave")
+    
+    def __new__(cls, barco, al_desaparecer, amarre, clave):
+        return super().__new__(cls, barco, al_desaparecer)
+    
+    def __init__(self, barco, al_desaparecer, amarre, clave):
+        super().__init__(barco, al_desaparecer)
+        self.amarre = amarre
+        self.clave = clave
+
+
+class GestorAmarres(OyenteEmbarcacion):
+    """Amarres del puerto: asigna uno al barco que vuelve y lo libera cuando sale"""
+    
+    def __init__(self, amarres_por_clase):
+        """Constructor de GestorAmarres (amarres_por_clase: número de amarres de cada clase de CLASES)"""
+        
+        amarres_por_clase = list(amarres_por_clase)
+        
+        # Validaciones
+        if len(amarres_por_clase) != len(CLASES):
+            raise ValueError(f"Se necesita el número de amarres de cada clase: {', '.join(CLASES)}.")
+        
+        if any(num < 0 for num in amarres_por_clase):
+            raise ValueError("El número de amarres de una clase no puede ser negativo.")
+        
+        # Los amarres se numeran seguidos, de la clase más pequeña a la más grande
+        self._clase_amarre = []
+        self._libres = []
+        for clase, num in enumerate(amarres_por_clase):
+            primero = len(self._clase_amarre)
+            self._clase_amarre.extend([clase] * num)
+            
+            # Una lista ordenada ya es un montículo válido
+            self._libres.append(list(range(primero, primero + num)))
+        
+        # Referencias débiles: un barco amarrado que deja de existir libera su amarre
+        self._ocupante = [None] * len(self._clase_amarre)
+        self._amarre_de = {}
+        self._num_rechazados = 0
+        self._num_sin_amarre_inicial = 0
+        self._al_desaparecer = self._abandonado
+    
+    # ========== ALTA Y BAJA EN EL OYENTE ==========
+    
+    def conectar(self):
+        """Asigna y libera amarres automáticamente al parar e iniciar la navegación"""
+        Embarcacion.registrar_oyente(self)
+        return self
+    
+    def desconectar(self):
+        Embarcacion.eliminar_oyente(self)
+    
+    def al_parar_navegacion(self, barco, tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido):
+        self.asignar(barco)
+    
+    def al_iniciar_navegacion(self, barco):
+        self.liberar(barco)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_amarres(self):
+        return len(self._clase_amarre)
+    
+    def get_num_ocupados(self):
+        return len(self._amarre_de)
+    
+    def get_num_libres(self, clase=None):
+        if clase is None:
+            return sum(len(libres) for libres in self._libres)
+        return len(self._libres[clase])
+    
+    def get_num_rechazados(self):
+        """Barcos que volvieron sin encontrar amarre de su clase o mayor"""
+        return self._num_rechazados
+    
+    def get_num_sin_amarre_inicial(self):
+        """Barcos en puerto que se quedaron sin amarre al cargarlos con amarrar()"""
+        return self._num_sin_amarre_inicial
+    
+    def get_amarre(self, barco):
+        return self._amarre_de.get(id(barco))
+    
+    def get_ocupante(self, amarre):
+        ocupante = self._ocupante[amarre]
+        return ocupante() if ocupante is not None else None
+    
+    def get_clase_amarre(self, amarre):
+        return self._clase_amarre[amarre]
+    
+    # ========== ASIGNACIÓN ==========
+    
+    def asignar(self, barco):
+        """
+        Amarre libre de menor número en la clase más pequeña en la que cabe el barco, o en la
+        siguiente con hueco. Devuelve el número de amarre o None si el puerto está lleno para él.
+        """
+        
+        amarre = self._tomar(barco)
+        if amarre is None:
+            self._num_rechazados += 1
+        return amarre
+    
+    def _tomar(self, barco):
+        if barco is None:
+            raise ValueError("El barco a amarrar no existe.")
+        
+        clave = id(barco)
+        amarre = self._amarre_de.get(clave)
+        if amarre is not None:
+            return amarre
+        
+        for libres in self._libres[clase_barco(barco):]:
+            if libres:
+                amarre = heapq.heappop(libres)
+                self._amarre_de[clave] = amarre
+                self._ocupante[amarre] = _Ocupante(barco, self._al_desaparecer, amarre, clave)
+                return amarre
+        return None
+    
+    def liberar(self, barco):
+        """Deja libre el amarre del barco y lo devuelve (None si no tenía)"""
+        
+        amarre = self._amarre_de.pop(id(barco), None)
+        if amarre is not None:
+            self._soltar(amarre)
+        return amarre
+    
+    def _soltar(self, amarre):
+        self._ocupante[amarre] = None
+        heapq.heappush(self._libres[self._clase_amarre[amarre]], amarre)
+    
+    def _abandonado(self, ocupante):
+        # El barco amarrado se ha liberado de memoria sin salir: su amarre vuelve a estar libre
+        if self._ocupante[ocupante.amarre] is ocupante:
+            del self._amarre_de[ocupante.clave]
+            self._soltar(ocupante.amarre)
+    
+    def amarrar(self, barcos):
+        """
+        Asigna amarre a los barcos que están en puerto (al arrancar); devuelve cuántos quedan sin él.
+        Estos no cuentan como rechazados, que son solo los que vuelven y no encuentran hueco.
+        """
+        
+        sin_amarre = 0
+        for barco in barcos:
+            if not barco._navegando and self._tomar(barco) is None:
+                sin_amarre += 1
+        self._num_sin_amarre_inicial += sin_amarre
+        return sin_amarre
+    
+    # ========== PLANIFICACIÓN ==========
+    
+    def planificar(self, llegadas):
+        """
+        llegadas: (barco, llegada, salida prevista) en horas. Simula en orden de llegada, a partir de
+        los amarres libres ahora, liberando cada amarre en la salida prevista de su barco. Devuelve
+        el amarre de cada llegada (None si no habrá hueco), en el orden recibido. No cambia el estado.
+        """
+        
+        libres = [list(montículo) for montículo in self._libres]
+        salidas = []
+        plan = [None] * len(llegadas)
+        
+        orden = sorted(range(len(llegadas)), key=lambda i: llegadas[i][1])
+        for i in orden:
+            barco, llegada, salida_prevista = llegadas[i]
+            if salida_prevista < llegada:
+                raise ValueError(f"La salida prevista de {barco.get_nombre_barco()} es anterior a su llegada.")
+            
+            # Amarres que quedan libres antes de esta llegada
+            while salidas and salidas[0][0] <= llegada:
+                _, amarre = heapq.heappop(salidas)
+                heapq.heappush(libres[self._clase_amarre[amarre]], amarre)
+            
+            for montículo in libres[clase_barco(barco):]:
+                if montículo:
+                    amarre = heapq.heappop(montículo)
+                    heapq.heappush(salidas, (salida_prevista, amarre))
+                    plan[i] = amarre
+                    break
+        
+        return plan
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(amarres_por_clase=(20_000, 15_000, 10_000, 5_000), num_barcos=55_000, num_operaciones=200_000, semilla=1):
+    """Asignación y liberación frente a buscar el primer amarre libre recorriendo la lista"""
+    
+    generador = random.Random(semilla)
+    
+    # Flota con tamaños variados: lotes de lanchas y veleros de distintas características
+    barcos = []
+    for i in range(10):
+        barcos += Lancha.crear_lote(num_barcos // 20, 2 + i, 1 + i % 2, prefijo=f"Amarre L{i}")
+        barcos += Velero.crear_lote(num_barcos // 20, 1 + i % 3, 2 + i, prefijo=f"Amarre V{i}")
+    generador.shuffle(barcos)
+    
+    gestor = GestorAmarres(amarres_por_clase)
+    inicio = time.perf_counter()
+    sin_amarre = gestor.amarrar(barcos)
+    carga = time.perf_counter() - inicio
+    
+    # Salidas y llegadas alternas de barcos al azar
+    amarrados = [barco for barco in barcos if gestor.get_amarre(barco) is not None]
+    fuera = [barco for barco in barcos if gestor.get_amarre(barco) is None]
+    operaciones = [(generador.randrange(len(amarrados)), generador.randrange(len(fuera)))
+                   for _ in range(num_operaciones // 2)]
+    
+    def jornada(asignar, liberar, operaciones):
+        dentro, afuera = list(amarrados), list(fuera)
+        inicio = time.perf_counter()
+        for sale, entra in operaciones:
+            barco = dentro[sale]
+            liberar(barco)
+            dentro[sale], afuera[entra] = afuera[entra], barco
+            asignar(dentro[sale])
+        return (time.perf_counter() - inicio) / (2 * len(operaciones))
+    
+    # Referencia: recorrer los amarres hasta el primero libre de clase suficiente, desde el mismo estado
+    ocupados = [ocupante is not None for ocupante in gestor._ocupante]
+    amarre_de = dict(gestor._amarre_de)
+    clase_amarre = gestor._clase_amarre
+    
+    por_montículos = jornada(gestor.asignar, gestor.liberar, operaciones)
+    
+    def asignar_recorriendo(barco):
+        clase = clase_barco(barco)
+        for amarre, ocupado in enumerate(ocupados):
+            if not ocupado and clase_amarre[amarre] >= clase:
+                ocupados[amarre] = True
+                amarre_de[id(barco)] = amarre
+                return amarre
+        return None
+    
+    def liberar_recorriendo(barco):
+        amarre = amarre_de.pop(id(barco), None)
+        if amarre is not None:
+            ocupados[amarre] = False
+    
+    # Con el puerto casi lleno cada búsqueda recorre decenas de miles de amarres: basta una muestra
+    recorriendo = jornada(asignar_recorriendo, liberar_recorriendo, operaciones[:num_operaciones // 100])
+    
+    # Plan de un día de llegadas previstas sobre un puerto vacío
+    vacio = GestorAmarres(amarres_por_clase)
+    llegadas = []
+    for barco in barcos:
+        llegada = generador.uniform(0, 24)
+        llegadas.append((barco, llegada, llegada + generador.uniform(1, 12)))
+    inicio = time.perf_counter()
+    plan = vacio.planificar(llegadas)
+    planificacion = time.perf_counter() - inicio
+    
+    print(f"{gestor.get_num_amarres()} amarres, {len(barcos)} barcos: carga inicial en {carga * 1000:.0f} ms "
+          f"({sin_amarre} sin amarre)")
+    print(f"  salida + llegada: {por_montículos * 1e6:.2f} µs por operación con montículos, "
+          f"{recorriendo * 1e6:.1f} µs recorriendo la lista")
+    print(f"  plan de {len(llegadas)} llegadas previstas en {planificacion * 1000:.0f} ms, "
+          f"{sum(amarre is None for amarre in plan)} sin hueco")
+    return por_montículos
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
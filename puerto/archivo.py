@@ -0,0 +1,426 @@
+"""
+Archivo histórico comprimido
+Guarda registros con marca de tiempo (como las sesiones del historial) en bloques
+comprimidos con zlib y un índice de bloques al final, para leer solo los de un intervalo
+
+Formato del fichero:
+
+    MAGIA (4 bytes) | bloque 0 | bloque 1 | ... | pie | COLA
+
+    Bloque: columnas del bloque, cada una como [valores (I), decimales (B)] + datos, comprimidas
+    juntas con zlib
+        tiempo   diferencias sucesivas en unidades de 1/ESCALA_TIEMPO s (q), la primera absoluta;
+                 si todas las diferencias son múltiplos de 10^decimales se guardan divididas
+        texto    código del diccionario de la columna (I)
+        entero   valor (q)
+        real     valor * 10^decimales como entero (q) si todos los valores del bloque tienen como
+                 mucho MAX_DECIMALES decimales; si no, decimales = SIN_ESCALA y el valor tal cual (d)
+    Los bytes de cada columna se reordenan por posición dentro del valor (primero todos los
+    bytes 0, luego todos los 1...) para que zlib encuentre las repeticiones.
+
+    Pie: JSON comprimido con el esquema, los diccionarios de cada columna de texto y el índice
+    de bloques [desplazamiento, longitud, registros, tiempo mínimo, tiempo máximo]
+    COLA: desplazamiento del pie (Q), longitud del pie (Q), MAGIA
+"""
+
+import json
+import struct
+import time
+import zlib
+from array import array
+from itertools import accumulate
+
+from .historial import CAMPOS_SESION
+from .serializacion import _numero
+
+
+MAGIA = b"ARCH"
+VERSION = 1
+ESCALA_TIEMPO = 1000
+MAX_DECIMALES = 4
+SIN_ESCALA = 255
+COLA = struct.Struct("<QQ4s")
+COLUMNA = struct.Struct("<IB")
+
+TIEMPO = "tiempo"
+TEXTO = "texto"
+ENTERO = "entero"
+REAL = "real"
+
+_FORMATOS = {TIEMPO: "q", TEXTO: "I", ENTERO: "q", REAL: "q"}
+
+# Tipos de Python que admite cada tipo de campo (un bool no cuenta como número)
+_VALORES = {TIEMPO: (int, float), TEXTO: (str,), ENTERO: (int,), REAL: (int, float)}
+
+# El primer campo de cada esquema es la marca de tiempo
+ESQUEMA_SESIONES = tuple(zip(CAMPOS_SESION, (TIEMPO, TEXTO, TEXTO, TEXTO, ENTERO, REAL, REAL, REAL, TEXTO)))
+
+
+def _barajar(datos, ancho):
+    """Agrupa los bytes de cada posición de los valores de ancho bytes"""
+    return b"".join(datos[posicion::ancho] for posicion in range(ancho))
+
+
+def _desbarajar(datos, ancho):
+    resultado = bytearray(len(datos))
+    num = len(datos) // ancho
+    for posicion in range(ancho):
+        resultado[posicion::ancho] = datos[posicion * num:(posicion + 1) * num]
+    return resultado
+
+
+def _escalar(valores):
+    """(decimales, enteros) con los menos decimales que representan exactamente todos los valores"""
+    
+    for decimales in range(MAX_DECIMALES + 1):
+        escala = 10 ** decimales
+        enteros = [round(valor * escala) for valor in valores]
+        if all(entero / escala == valor for entero, valor in zip(enteros, valores)):
+            if all(-2 ** 53 < entero < 2 ** 53 for entero in enteros):
+                return decimales, array("q", enteros)
+            break
+    return SIN_ESCALA, array("d", valores)
+
+
+def _validar_esquema(esquema):
+    esquema = tuple((campo, tipo) for campo, tipo in esquema)
+    if not esquema or esquema[0][1] != TIEMPO:
+        raise ValueError("El primer campo del esquema debe ser la marca de tiempo.")
+    for campo, tipo in esquema:
+        if tipo not in _FORMATOS:
+            raise ValueError(f"Tipo de campo desconocido: {tipo} (campo {campo}).")
+    return esquema
+
+
+# ========== ESCRITURA ==========
+
+class EscritorArchivo:
+    """Añade registros (tuplas en el orden del esquema) y los vuelca en bloques comprimidos"""
+    
+    def __init__(self, ruta, esquema=ESQUEMA_SESIONES, tam_bloque=16384, nivel=6):
+        """Constructor de EscritorArchivo"""
+        
+        if tam_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser mayor que cero.")
+        
+        if not 0 <= nivel <= 9:
+            raise ValueError("El nivel de compresión debe estar entre 0 y 9.")
+        
+        self._esquema = _validar_esquema(esquema)
+        self._tam_bloque = tam_bloque
+        self._nivel = nivel
+        
+        # Diccionario de cada columna de texto: valor -> código, en orden de aparición
+        self._diccionarios = {campo: {} for campo, tipo in self._esquema if tipo == TEXTO}
+        
+        self._valores = [_VALORES[tipo] for _, tipo in self._esquema]
+        self._pendientes = []
+        self._indice = []
+        self._num_registros = 0
+        self._fichero = open(ruta, "wb")
+        self._fichero.write(MAGIA)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_registros(self):
+        return self._num_registros
+    
+    def get_num_bloques(self):
+        return len(self._indice)
+    
+    # ========== ESCRITURA ==========
+    
+    def añadir(self, registro):
+        if self._fichero is None:
+            raise ValueError("El archivo ya está cerrado.")
+        if len(registro) != len(self._esquema):
+            raise ValueError(f"El registro tiene {len(registro)} campos y el esquema {len(self._esquema)}.")
+        
+        # Un valor mal tipado se rechaza aquí y no al volcar el bloque, que perdería los demás registros
+        for valor, tipos, (campo, tipo) in zip(registro, self._valores, self._esquema):
+            if type(valor) not in tipos:
+                raise ValueError(f"El campo {campo} debe ser de tipo {tipo}, no {type(valor).__name__}.")
+        
+        self._pendientes.append(registro)
+        self._num_registros += 1
+        if len(self._pendientes) >= self._tam_bloque:
+            self._volcar_bloque()
+    
+    def añadir_muchos(self, registros):
+        for registro in registros:
+            self.añadir(registro)
+    
+    def _volcar_bloque(self):
+        columnas = list(zip(*self._pendientes))
+        partes = []
+        tiempos = None
+        
+        for (campo, tipo), valores in zip(self._esquema, columnas):
+            decimales = 0
+            if tipo == TIEMPO:
+                tiempos = [round(valor * ESCALA_TIEMPO) for valor in valores]
+                diferencias = [b - a for a, b in zip(tiempos, tiempos[1:])]
+                
+                # Marcas redondeadas (a segundos, por ejemplo) dejan diferencias con ceros a la derecha
+                while decimales < 9 and diferencias and all(d % 10 ** (decimales + 1) == 0 for d in diferencias):
+                    decimales += 1
+                divisor = 10 ** decimales
+                datos = array("q", [tiempos[0]] + [d // divisor for d in diferencias])
+            elif tipo == TEXTO:
+                diccionario = self._diccionarios[campo]
+                codigos = []
+                for valor in valores:
+                    codigo = diccionario.get(valor)
+                    if codigo is None:
+                        codigo = diccionario[valor] = len(diccionario)
+                    codigos.append(codigo)
+                datos = array("I", codigos)
+            elif tipo == REAL:
+                decimales, datos = _escalar(valores)
+            else:
+                datos = array(_FORMATOS[tipo], valores)
+            
+            partes.append(COLUMNA.pack(len(datos), decimales))
+            partes.append(_barajar(datos.tobytes(), datos.itemsize))
+        
+        comprimido = zlib.compress(b"".join(partes), self._nivel)
+        desplazamiento = self._fichero.tell()
+        self._fichero.write(comprimido)
+        self._indice.append([desplazamiento, len(comprimido), len(self._pendientes), min(tiempos), max(tiempos)])
+        self._pendientes = []
+    
+    def cerrar(self):
+        """
+        Vuelca el último bloque y escribe el pie con el índice. Aunque falle el volcado, el pie se
+        escribe con los bloques ya volcados y el fichero se cierra; después se propaga el error.
+        """
+        
+        if self._fichero is None:
+            return
+        try:
+            if self._pendientes:
+                self._volcar_bloque()
+        finally:
+            try:
+                self._escribir_pie()
+            finally:
+                self._fichero.close()
+                self._fichero = None
+    
+    def _escribir_pie(self):
+        pie = zlib.compress(json.dumps({
+            "version": VERSION,
+            "escala_tiempo": ESCALA_TIEMPO,
+            "esquema": self._esquema,
+            "diccionarios": {campo: list(diccionario) for campo, diccionario in self._diccionarios.items()},
+            "bloques": self._indice,
+        }, ensure_ascii=False).encode("utf-8"), self._nivel)
+        
+        desplazamiento = self._fichero.tell()
+        self._fichero.write(pie)
+        self._fichero.write(COLA.pack(desplazamiento, len(pie), MAGIA))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ========== LECTURA ==========
+
+class LectorArchivo:
+    """Lee el índice del pie y descomprime solo los bloques que solapan el intervalo pedido"""
+    
+    def __init__(self, ruta):
+        """Constructor de LectorArchivo"""
+        
+        self._fichero = open(ruta, "rb")
+        try:
+            if self._fichero.read(len(MAGIA)) != MAGIA:
+                raise ValueError(f"{ruta} no es un archivo histórico.")
+            
+            self._fichero.seek(-COLA.size, 2)
+            desplazamiento, longitud, magia = COLA.unpack(self._fichero.read(COLA.size))
+            if magia != MAGIA:
+                raise ValueError(f"{ruta} está incompleto: falta el pie (¿no se cerró el escritor?).")
+            
+            self._fichero.seek(desplazamiento)
+            pie = json.loads(zlib.decompress(self._fichero.read(longitud)))
+        except Exception:
+            self._fichero.close()
+            raise
+        
+        if pie["version"] != VERSION:
+            raise ValueError(f"Versión de archivo no soportada: {pie['version']}.")
+        
+        self._escala = pie["escala_tiempo"]
+        self._esquema = tuple((campo, tipo) for campo, tipo in pie["esquema"])
+        self._diccionarios = pie["diccionarios"]
+        self._bloques = pie["bloques"]
+        self._num_bloques_leidos = 0
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_esquema(self):
+        return self._esquema
+    
+    def get_num_bloques(self):
+        return len(self._bloques)
+    
+    def get_num_bloques_leidos(self):
+        return self._num_bloques_leidos
+    
+    def __len__(self):
+        return sum(bloque[2] for bloque in self._bloques)
+    
+    def intervalo(self):
+        """(primer instante, último instante) del archivo, o None si está vacío"""
+        if not self._bloques:
+            return None
+        return (min(bloque[3] for bloque in self._bloques) / self._escala,
+                max(bloque[4] for bloque in self._bloques) / self._escala)
+    
+    # ========== LECTURA ==========
+    
+    def leer(self, desde=None, hasta=None):
+        """Registros con desde <= instante < hasta, de bloque en bloque y en el orden en que se escribieron"""
+        
+        minimo = round(desde * self._escala) if desde is not None else None
+        maximo = round(hasta * self._escala) if hasta is not None else None
+        
+        for desplazamiento, longitud, _, tiempo_min, tiempo_max in self._bloques:
+            if (minimo is not None and tiempo_max < minimo) or (maximo is not None and tiempo_min >= maximo):
+                continue
+            
+            registros = self._leer_bloque(desplazamiento, longitud)
+            if (minimo is None or tiempo_min >= minimo) and (maximo is None or tiempo_max < maximo):
+                yield from registros
+            else:
+                for registro in registros:
+                    instante = round(registro[0] * self._escala)
+                    if (minimo is None or instante >= minimo) and (maximo is None or instante < maximo):
+                        yield registro
+    
+    def _leer_bloque(self, desplazamiento, longitud):
+        self._fichero.seek(desplazamiento)
+        datos = memoryview(zlib.decompress(self._fichero.read(longitud)))
+        self._num_bloques_leidos += 1
+        
+        columnas = []
+        posicion = 0
+        for campo, tipo in self._esquema:
+            num, decimales = COLUMNA.unpack_from(datos, posicion)
+            posicion += COLUMNA.size
+            valores = array("d" if decimales == SIN_ESCALA else _FORMATOS[tipo])
+            tamaño = num * valores.itemsize
+            valores.frombytes(_desbarajar(datos[posicion:posicion + tamaño], valores.itemsize))
+            posicion += tamaño
+            
+            if tipo == TIEMPO:
+                if decimales:
+                    factor = 10 ** decimales
+                    valores = [valores[0]] + [diferencia * factor for diferencia in valores[1:]]
+                columnas.append([tiempo / self._escala for tiempo in accumulate(valores)])
+            elif tipo == TEXTO:
+                tabla = self._diccionarios[campo]
+                columnas.append([tabla[codigo] for codigo in valores])
+            elif tipo == REAL and decimales == SIN_ESCALA:
+                columnas.append([_numero(valor) for valor in valores])
+            elif tipo == REAL and decimales:
+                escala = 10 ** decimales
+                columnas.append([_numero(valor / escala) for valor in valores])
+            else:
+                columnas.append(valores.tolist())
+        
+        return list(zip(*columnas))
+    
+    def cerrar(self):
+        self._fichero.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+def archivar_diario(ruta_diario, ruta_archivo, tam_bloque=16384):
+    """Convierte un diario de sesiones de HistorialNavegacion en un archivo; devuelve cuántas"""
+    
+    from .historial import HistorialNavegacion
+    
+    with EscritorArchivo(ruta_archivo, ESQUEMA_SESIONES, tam_bloque) as escritor:
+        escritor.añadir_muchos(HistorialNavegacion.leer_diario(ruta_diario))
+        return escritor.get_num_registros()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_sesiones=1_000_000, num_barcos=20_000, num_patrones=2_000, semilla=1):
+    """Tamaño frente al diario JSON, velocidad de escritura y lectura de un intervalo"""
+    
+    import os
+    import random
+    import tempfile
+    
+    generador = random.Random(semilla)
+    inicio_periodo = 1_700_000_000
+    rumbos = ("norte", "sur", "este", "oeste", "ceñida", "empopada")
+    
+    def sesiones():
+        instante = inicio_periodo
+        for _ in range(num_sesiones):
+            instante += generador.randint(1, 60)
+            barco = generador.randrange(num_barcos)
+            lancha = barco % 2 == 0
+            horas = round(generador.uniform(0.1, 8), 2)
+            velocidad = generador.randint(10, 60) if lancha else generador.randint(2, 20)
+            yield (
+                instante, f"Barco {barco}", "Lancha" if lancha else "Velero",
+                f"Patrón {generador.randrange(num_patrones)}", generador.randint(1, 8), horas,
+                int(velocidad * horas * 0.1) if lancha else 0, velocidad, generador.choice(rumbos),
+            )
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_diario = os.path.join(directorio, "sesiones.jsonl")
+        ruta_archivo = os.path.join(directorio, "sesiones.arch")
+        
+        with open(ruta_diario, "w", encoding="utf-8") as fichero:
+            for sesion in sesiones():
+                fichero.write(json.dumps(sesion, ensure_ascii=False) + "\n")
+        
+        inicio = time.perf_counter()
+        archivar_diario(ruta_diario, ruta_archivo)
+        escritura = time.perf_counter() - inicio
+        
+        tam_diario = os.path.getsize(ruta_diario)
+        tam_archivo = os.path.getsize(ruta_archivo)
+        
+        with LectorArchivo(ruta_archivo) as lector:
+            primero, ultimo = lector.intervalo()
+            inicio = time.perf_counter()
+            todos = sum(1 for _ in lector.leer())
+            lectura = time.perf_counter() - inicio
+            
+            # Una hora del centro del periodo
+            desde = (primero + ultimo) / 2
+            leidos = lector.get_num_bloques_leidos()
+            inicio = time.perf_counter()
+            en_rango = list(lector.leer(desde, desde + 3600))
+            rango = time.perf_counter() - inicio
+            bloques_rango = lector.get_num_bloques_leidos() - leidos
+            
+            assert todos == num_sesiones
+            assert all(desde <= sesion[0] < desde + 3600 for sesion in en_rango)
+            num_bloques = lector.get_num_bloques()
+    
+    print(f"{num_sesiones} sesiones: diario {tam_diario / 2 ** 20:.1f} MB, archivo {tam_archivo / 2 ** 20:.1f} MB "
+          f"({tam_diario / tam_archivo:.1f}x menor)")
+    print(f"  escritura {num_sesiones / escritura:,.0f} sesiones/s, lectura completa {num_sesiones / lectura:,.0f} sesiones/s")
+    print(f"  una hora: {len(en_rango)} sesiones en {rango * 1000:.1f} ms, {bloques_rango} de {num_bloques} bloques leídos")
+    return tam_diario / tam_archivo
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Presupuesto de arranque
+Mide en procesos nuevos cuánto cuesta importar el paquete y la línea de órdenes, y comprueba
+que los subsistemas pesados no se cargan hasta que se usan
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+# Segundos que puede tardar la importación (sin contar el arranque del intérprete)
+PRESUPUESTO_ARRANQUE = {
+    "puerto": 0.020,
+    "puerto.cli": 0.040,
+}
+
+# Módulos que no deben cargarse al importar el paquete ni la línea de órdenes
+MODULOS_PESADOS = (
+    "numpy", "asyncio", "multiprocessing", "concurrent.futures", "http.server",
+    "pickle", "cProfile", "tracemalloc",
+)
+
+_PROGRAMA = """
+import sys, time
+inicio = time.perf_counter()
+import {modulo}
+duracion = time.perf_counter() - inicio
+print(duracion)
+print(",".join(m for m in {pesados!r} if m in sys.modules))
+"""
+
+
+def medir_importacion(modulo="puerto", repeticiones=10):
+    """Mediana de la duración de import modulo en un intérprete recién arrancado y los módulos pesados cargados"""
+    
+    if repeticiones < 1:
+        raise ValueError("Se necesita al menos una repetición.")
+    
+    programa = _PROGRAMA.format(modulo=modulo, pesados=MODULOS_PESADOS)
+    duraciones = []
+    pesados = set()
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", programa], capture_output=True, text=True, check=True).stdout
+        duracion, cargados = salida.splitlines()
+        duraciones.append(float(duracion))
+        pesados.update(filter(None, cargados.split(",")))
+    return statistics.median(duraciones), sorted(pesados)
+
+
+def comprobar_arranque(repeticiones=10, presupuesto=None):
+    """Mide cada módulo del presupuesto; lanza RuntimeError si alguno se pasa o carga un subsistema pesado"""
+    
+    presupuesto = presupuesto if presupuesto is not None else PRESUPUESTO_ARRANQUE
+    resultados = {}
+    for modulo, limite in presupuesto.items():
+        duracion, pesados = medir_importacion(modulo, repeticiones)
+        resultados[modulo] = duracion
+        if pesados:
+            raise RuntimeError(f"Importar {modulo} carga módulos pesados: {', '.join(pesados)}.")
+        if duracion > limite:
+            raise RuntimeError(f"Importar {modulo} tarda {duracion * 1000:.1f} ms, por encima del presupuesto "
+                               f"de {limite * 1000:.1f} ms.")
+    return resultados
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(repeticiones=10):
+    """Tiempo de importación en frío frente al presupuesto"""
+    
+    resultados = comprobar_arranque(repeticiones)
+    for modulo, duracion in resultados.items():
+        print(f"import {modulo}: {duracion * 1000:.1f} ms (presupuesto {PRESUPUESTO_ARRANQUE[modulo] * 1000:.0f} ms)")
+    return resultados
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
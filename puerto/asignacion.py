@@ -0,0 +1,265 @@
+"""
+Asignación de patrones y tripulación
+Calcula un plan factible y equilibrado para la salida diaria: cada barco recibe un patrón
+cualificado para su tipo y una tripulación que no supera num_max_tripulantes
+"""
+
+import random
+import time
+from collections import defaultdict
+
+from .lancha import Lancha
+from .transaccion import iniciar_navegacion_lote
+from .velero import Velero
+
+
+# Velocidad y rumbo de salida por defecto de cada tipo
+SALIDA_POR_DEFECTO = {
+    Lancha: (20, "norte"),
+    Velero: (10, "ceñida"),
+}
+
+
+class PlanAsignacion:
+    """Resultado de la asignación: (barco, patrón, tripulantes) por cada barco que sale"""
+    
+    def __init__(self, asignaciones, barcos_sin_patron, patrones_libres, tripulantes_libres):
+        """Constructor de PlanAsignacion"""
+        
+        self._asignaciones = asignaciones
+        self._barcos_sin_patron = barcos_sin_patron
+        self._patrones_libres = patrones_libres
+        self._tripulantes_libres = tripulantes_libres
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_asignaciones(self):
+        return list(self._asignaciones)
+    
+    def get_barcos_sin_patron(self):
+        return list(self._barcos_sin_patron)
+    
+    def get_patrones_libres(self):
+        return list(self._patrones_libres)
+    
+    def get_tripulantes_libres(self):
+        return self._tripulantes_libres
+    
+    def __len__(self):
+        return len(self._asignaciones)
+    
+    # ========== SALIDA ==========
+    
+    def comandos(self, salida=None):
+        """Argumentos de iniciar_navegacion por barco: (barco, velocidad, rumbo, patrón, tripulantes)"""
+        
+        salida = salida if salida is not None else SALIDA_POR_DEFECTO
+        comandos = []
+        for barco, patron, tripulantes in self._asignaciones:
+            velocidad, rumbo = salida[type(barco)]
+            comandos.append((barco, velocidad, rumbo, patron, tripulantes))
+        return comandos
+    
+    def iniciar(self, salida=None):
+        """Inicia la navegación de todos los barcos del plan (todos o ninguno)"""
+        iniciar_navegacion_lote(self.comandos(salida))
+
+
+# ========== EMPAREJAMIENTO DE PATRONES ==========
+
+def _flujo_maximo(capacidades, origen, destino):
+    """Edmonds-Karp sobre un grafo pequeño (grupos de patrones y tipos de barco)"""
+    
+    flujo = defaultdict(int)
+    vecinos = defaultdict(set)
+    for (u, v) in capacidades:
+        vecinos[u].add(v)
+        vecinos[v].add(u)
+    
+    while True:
+        # BFS en el grafo residual
+        previo = {origen: None}
+        cola = [origen]
+        for u in cola:
+            for v in vecinos[u]:
+                if v not in previo and capacidades.get((u, v), 0) - flujo[(u, v)] + flujo[(v, u)] > 0:
+                    previo[v] = u
+                    cola.append(v)
+            if destino in previo:
+                break
+        
+        if destino not in previo:
+            return flujo
+        
+        # Cuello de botella del camino y actualización
+        camino = []
+        v = destino
+        while previo[v] is not None:
+            camino.append((previo[v], v))
+            v = previo[v]
+        incremento = min(capacidades.get((u, v), 0) - flujo[(u, v)] + flujo[(v, u)] for u, v in camino)
+        
+        for u, v in camino:
+            cancelado = min(incremento, flujo[(v, u)])
+            flujo[(v, u)] -= cancelado
+            flujo[(u, v)] += incremento - cancelado
+
+
+def _emparejar(barcos_por_tipo, patrones):
+    """Empareja el máximo de barcos con patrones cualificados para su tipo"""
+    
+    # Los patrones se agrupan por conjunto de cualificaciones: el grafo queda diminuto
+    grupos = defaultdict(list)
+    for nombre, tipos in patrones:
+        grupos[frozenset(tipos)].append(nombre)
+    
+    capacidades = {}
+    for cualificaciones, nombres in grupos.items():
+        capacidades[("origen", cualificaciones)] = len(nombres)
+        for tipo in cualificaciones:
+            if tipo in barcos_por_tipo:
+                capacidades[(cualificaciones, tipo)] = len(nombres)
+    for tipo, barcos in barcos_por_tipo.items():
+        capacidades[(tipo, "destino")] = len(barcos)
+    
+    flujo = _flujo_maximo(capacidades, "origen", "destino")
+    
+    # Reparto concreto: cada grupo entrega a cada tipo tantos patrones como indica el flujo
+    emparejados = []
+    pendientes = {tipo: list(barcos) for tipo, barcos in barcos_por_tipo.items()}
+    patrones_libres = []
+    for cualificaciones, nombres in grupos.items():
+        nombres = list(nombres)
+        for tipo in cualificaciones:
+            cantidad = flujo.get((cualificaciones, tipo), 0)
+            for _ in range(cantidad):
+                emparejados.append((pendientes[tipo].pop(), nombres.pop()))
+        patrones_libres.extend(nombres)
+    
+    barcos_sin_patron = [barco for barcos in pendientes.values() for barco in barcos]
+    return emparejados, barcos_sin_patron, patrones_libres
+
+
+# ========== REPARTO DE TRIPULACIÓN ==========
+
+def repartir_tripulacion(capacidades, total):
+    """Reparto por nivelación: cada barco recibe min(capacidad, nivel) y el resto se reparte de uno en uno"""
+    
+    if total < 0:
+        raise ValueError("El número de tripulantes disponibles no puede ser negativo.")
+    
+    num = len(capacidades)
+    if num == 0:
+        return [], total
+    
+    disponible = min(total, sum(capacidades))
+    orden = sorted(range(num), key=capacidades.__getitem__)
+    
+    # Buscar el nivel recorriendo las capacidades de menor a mayor
+    asignados = [0] * num
+    restante = disponible
+    for posicion, i in enumerate(orden):
+        quedan = num - posicion
+        nivel = restante // quedan
+        if capacidades[i] <= nivel:
+            asignados[i] = capacidades[i]
+            restante -= capacidades[i]
+            continue
+        
+        # Todos los barcos que quedan admiten al menos el nivel
+        for j in orden[posicion:]:
+            asignados[j] = nivel
+        restante -= nivel * quedan
+        
+        # Los sobrantes (< quedan) van a los barcos de mayor capacidad
+        for j in reversed(orden[posicion:]):
+            if restante == 0:
+                break
+            if asignados[j] < capacidades[j]:
+                asignados[j] += 1
+                restante -= 1
+        break
+    
+    return asignados, total - (disponible - restante)
+
+
+# ========== PLANIFICADOR ==========
+
+def planificar(barcos, patrones, num_tripulantes):
+    """Plan de salida: barcos disponibles, patrones (nombre, tipos cualificados) y bolsa de tripulantes"""
+    
+    if barcos is None or patrones is None:
+        raise ValueError("Debes indicar los barcos y los patrones a asignar.")
+    
+    # Solo cuentan los barcos en puerto y, en las lanchas, con combustible suficiente
+    barcos_por_tipo = defaultdict(list)
+    for barco in barcos:
+        if barco._navegando:
+            continue
+        if isinstance(barco, Lancha) and not (Lancha.MIN_COMBUSTIBLE <= barco._cantidad_combustible <= Lancha.MAX_COMBUSTIBLE):
+            continue
+        barcos_por_tipo[type(barco)].append(barco)
+    
+    # Los barcos de más capacidad se asignan primero (se sacan del final de cada lista)
+    for lista in barcos_por_tipo.values():
+        lista.sort(key=lambda barco: barco._num_max_tripulantes)
+    
+    patrones = [(nombre, [_tipo(t) for t in tipos]) for nombre, tipos in patrones]
+    emparejados, barcos_sin_patron, patrones_libres = _emparejar(barcos_por_tipo, patrones)
+    
+    capacidades = [barco._num_max_tripulantes for barco, _ in emparejados]
+    tripulaciones, tripulantes_libres = repartir_tripulacion(capacidades, num_tripulantes)
+    
+    asignaciones = [(barco, patron, tripulantes)
+                    for (barco, patron), tripulantes in zip(emparejados, tripulaciones)]
+    return PlanAsignacion(asignaciones, barcos_sin_patron, patrones_libres, tripulantes_libres)
+
+
+def _tipo(tipo):
+    """Acepta la clase o su nombre ("Lancha", "Velero")"""
+    
+    if isinstance(tipo, type):
+        return tipo
+    for clase in SALIDA_POR_DEFECTO:
+        if clase.__name__ == tipo:
+            return clase
+    raise ValueError(f"Tipo de embarcación desconocido: {tipo}.")
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=10_000, num_patrones=8_000, semilla=1):
+    """Planifica una mañana con num_barcos barcos y num_patrones patrones"""
+    
+    generador = random.Random(semilla)
+    barcos = []
+    for i in range(num_barcos):
+        if i % 2 == 0:
+            barcos.append(Lancha(f"Asignación L{i}", generador.randint(0, 8), 1, 40))
+        else:
+            barcos.append(Velero(f"Asignación V{i}", 2, generador.randint(0, 12)))
+    
+    cualificaciones = [["Lancha"], ["Velero"], ["Lancha", "Velero"]]
+    patrones = [(f"Patrón {i}", generador.choice(cualificaciones)) for i in range(num_patrones)]
+    num_tripulantes = num_barcos * 3
+    
+    inicio = time.perf_counter()
+    plan = planificar(barcos, patrones, num_tripulantes)
+    segundos = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    plan.iniciar()
+    salida = time.perf_counter() - inicio
+    
+    print(f"{num_barcos} barcos, {num_patrones} patrones: plan en {segundos * 1000:.1f} ms, "
+          f"{len(plan)} salidas, {len(plan.get_barcos_sin_patron())} sin patrón, "
+          f"{plan.get_tripulantes_libres()} tripulantes libres; salida en {salida * 1000:.1f} ms")
+    
+    for barco, _, _ in plan.get_asignaciones():
+        barco.parar_navegacion(0)
+    
+    return segundos
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
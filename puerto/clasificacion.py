@@ -0,0 +1,334 @@
+"""
+Clasificación Elo de barcos y patrones
+Actualiza las puntuaciones con cada resultado de regata (empates incluidos) en O(participantes)
+y responde top-k y percentiles con un árbol de Fenwick sobre las puntuaciones
+"""
+
+import random
+import time
+from array import array
+
+from .embarcacion import Embarcacion
+
+
+class ArbolFenwick:
+    """Recuentos por cubeta con suma de prefijos y búsqueda del k-ésimo en O(log n)"""
+    
+    def __init__(self, tamaño):
+        """Constructor de ArbolFenwick"""
+        
+        self._tamaño = tamaño
+        self._arbol = array("q", bytes(8 * (tamaño + 1)))
+        
+        # Mayor potencia de dos que no supera el tamaño, para la búsqueda binaria
+        self._salto = 1
+        while self._salto * 2 <= tamaño:
+            self._salto *= 2
+    
+    def añadir(self, posicion, cantidad):
+        arbol = self._arbol
+        posicion += 1
+        while posicion <= self._tamaño:
+            arbol[posicion] += cantidad
+            posicion += posicion & -posicion
+    
+    def prefijo(self, posicion):
+        """Suma de las cubetas [0, posicion)"""
+        
+        arbol = self._arbol
+        total = 0
+        while posicion > 0:
+            total += arbol[posicion]
+            posicion -= posicion & -posicion
+        return total
+    
+    def buscar(self, k):
+        """Primera cubeta cuyo prefijo acumulado supera k (k empieza en 0)"""
+        
+        arbol = self._arbol
+        posicion = 0
+        salto = self._salto
+        while salto:
+            siguiente = posicion + salto
+            if siguiente <= self._tamaño and arbol[siguiente] <= k:
+                posicion = siguiente
+                k -= arbol[siguiente]
+            salto //= 2
+        return posicion
+
+
+class TablaPuntuaciones:
+    """Puntuaciones compactas por identificador entero con estadística de orden"""
+    
+    PUNTUACION_INICIAL = 1500.0
+    
+    # Las puntuaciones se agrupan en cubetas de un punto entre MIN y MAX para el árbol
+    MIN_PUNTUACION = 0
+    MAX_PUNTUACION = 4000
+    
+    def __init__(self):
+        """Constructor de TablaPuntuaciones"""
+        
+        self._ids = {}
+        self._nombres = []
+        self._puntuaciones = array("d")
+        self._participaciones = array("I")
+        
+        self._arbol = ArbolFenwick(TablaPuntuaciones.MAX_PUNTUACION - TablaPuntuaciones.MIN_PUNTUACION + 1)
+        self._cubetas = {}
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def __len__(self):
+        return len(self._nombres)
+    
+    def __contains__(self, nombre):
+        return nombre in self._ids
+    
+    def get_puntuacion(self, nombre):
+        return self._puntuaciones[self._buscar(nombre)]
+    
+    def get_participaciones(self, nombre):
+        return self._participaciones[self._buscar(nombre)]
+    
+    def _buscar(self, nombre):
+        identificador = self._ids.get(nombre)
+        if identificador is None:
+            raise ValueError(f"{nombre} no tiene puntuación registrada.")
+        return identificador
+    
+    # ========== ACTUALIZACIÓN ==========
+    
+    @staticmethod
+    def _cubeta(puntuacion):
+        cubeta = int(puntuacion) - TablaPuntuaciones.MIN_PUNTUACION
+        if cubeta < 0:
+            return 0
+        if cubeta > TablaPuntuaciones.MAX_PUNTUACION - TablaPuntuaciones.MIN_PUNTUACION:
+            return TablaPuntuaciones.MAX_PUNTUACION - TablaPuntuaciones.MIN_PUNTUACION
+        return cubeta
+    
+    def identificador(self, nombre):
+        """Identificador entero del nombre; lo da de alta con la puntuación inicial si es nuevo"""
+        
+        identificador = self._ids.get(nombre)
+        if identificador is None:
+            identificador = self._ids[nombre] = len(self._nombres)
+            self._nombres.append(nombre)
+            self._puntuaciones.append(TablaPuntuaciones.PUNTUACION_INICIAL)
+            self._participaciones.append(0)
+            
+            cubeta = self._cubeta(TablaPuntuaciones.PUNTUACION_INICIAL)
+            self._arbol.añadir(cubeta, 1)
+            self._cubetas.setdefault(cubeta, set()).add(identificador)
+        return identificador
+    
+    def ajustar(self, identificador, incremento):
+        """Suma el incremento a la puntuación y mueve el identificador de cubeta si hace falta"""
+        
+        anterior = self._puntuaciones[identificador]
+        nueva = anterior + incremento
+        self._puntuaciones[identificador] = nueva
+        self._participaciones[identificador] += 1
+        
+        cubeta_anterior = self._cubeta(anterior)
+        cubeta_nueva = self._cubeta(nueva)
+        if cubeta_anterior != cubeta_nueva:
+            self._arbol.añadir(cubeta_anterior, -1)
+            self._arbol.añadir(cubeta_nueva, 1)
+            cubetas = self._cubetas
+            cubetas[cubeta_anterior].discard(identificador)
+            if not cubetas[cubeta_anterior]:
+                del cubetas[cubeta_anterior]
+            cubetas.setdefault(cubeta_nueva, set()).add(identificador)
+    
+    # ========== CONSULTAS ==========
+    
+    def top(self, k):
+        """Los k mejores como (nombre, puntuación), de mayor a menor"""
+        
+        resultado = []
+        total = len(self._nombres)
+        posicion = 0
+        while len(resultado) < k and posicion < total:
+            # Cubeta que contiene al (posicion + 1)-ésimo mejor
+            cubeta = self._arbol.buscar(total - 1 - posicion)
+            ids = self._cubetas[cubeta]
+            resultado.extend(sorted(ids, key=self._puntuaciones.__getitem__, reverse=True))
+            posicion += len(ids)
+        
+        return [(self._nombres[i], self._puntuaciones[i]) for i in resultado[:k]]
+    
+    def percentil(self, nombre):
+        """Porcentaje de participantes con puntuación inferior (a resolución de cubeta)"""
+        
+        identificador = self._buscar(nombre)
+        cubeta = self._cubeta(self._puntuaciones[identificador])
+        por_debajo = self._arbol.prefijo(cubeta)
+        
+        # Dentro de la cubeta se compara con la puntuación exacta
+        puntuacion = self._puntuaciones[identificador]
+        por_debajo += sum(1 for otro in self._cubetas[cubeta] if self._puntuaciones[otro] < puntuacion)
+        return 100.0 * por_debajo / len(self._nombres)
+    
+    def posicion(self, nombre):
+        """Puesto en la clasificación (1 es el mejor)"""
+        
+        identificador = self._buscar(nombre)
+        puntuacion = self._puntuaciones[identificador]
+        cubeta = self._cubeta(puntuacion)
+        por_encima = len(self._nombres) - self._arbol.prefijo(cubeta + 1)
+        por_encima += sum(1 for otro in self._cubetas[cubeta] if self._puntuaciones[otro] > puntuacion)
+        return por_encima + 1
+
+
+class ClasificacionElo:
+    """Motor de puntuaciones: una tabla de barcos y otra de patrones"""
+    
+    FACTOR_K = 32.0
+    
+    def __init__(self, factor_k=None):
+        """Constructor de ClasificacionElo"""
+        
+        if factor_k is None:
+            factor_k = ClasificacionElo.FACTOR_K
+        
+        if factor_k <= 0:
+            raise ValueError("El factor K debe ser mayor que cero.")
+        
+        self._factor_k = factor_k
+        self._barcos = TablaPuntuaciones()
+        self._patrones = TablaPuntuaciones()
+        self._num_regatas = 0
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_barcos(self):
+        return self._barcos
+    
+    def get_patrones(self):
+        return self._patrones
+    
+    def get_num_regatas(self):
+        return self._num_regatas
+    
+    # ========== RESULTADOS ==========
+    
+    def registrar(self, clasificacion):
+        """
+        clasificacion: grupos por orden de llegada; cada grupo (los empatados) contiene
+        veleros navegando o pares (nombre del barco, patrón)
+        """
+        
+        grupos_barcos = []
+        grupos_patrones = []
+        for grupo in clasificacion:
+            barcos = []
+            patrones = []
+            for participante in grupo:
+                if isinstance(participante, Embarcacion):
+                    barcos.append(participante._nombre)
+                    patrones.append(participante._patron)
+                else:
+                    barcos.append(participante[0])
+                    patrones.append(participante[1])
+            grupos_barcos.append(barcos)
+            grupos_patrones.append(patrones)
+        
+        num_participantes = sum(len(grupo) for grupo in grupos_barcos)
+        if num_participantes < 2:
+            raise ValueError("Una regata necesita al menos dos participantes.")
+        
+        nombres = [nombre for grupo in grupos_barcos for nombre in grupo]
+        if len(set(nombres)) != num_participantes:
+            raise ValueError("Una embarcación no puede aparecer dos veces en la misma regata.")
+        
+        self._actualizar(self._barcos, grupos_barcos, num_participantes)
+        self._actualizar(self._patrones, grupos_patrones, num_participantes)
+        self._num_regatas += 1
+    
+    def registrar_regata(self, velero, otro_velero):
+        """Disputa la regata entre dos veleros y registra su resultado"""
+        
+        clasificacion = velero.resultado_regata(otro_velero)
+        self.registrar(clasificacion)
+        return clasificacion
+    
+    def _actualizar(self, tabla, grupos, num_participantes):
+        """
+        Elo multijugador en O(n): cada participante se compara con la media del resto.
+        Con dos participantes coincide con el Elo clásico. Un patrón que lleva varios barcos
+        en la regata cuenta una sola vez, con la media de sus resultados.
+        """
+        
+        puntuaciones = tabla._puntuaciones
+        resultados = {}
+        lugar = 0
+        for grupo in grupos:
+            # Los empatados comparten el puesto medio del grupo
+            puesto = lugar + (len(grupo) - 1) / 2
+            resultado = (num_participantes - 1 - puesto) / (num_participantes - 1)
+            for nombre in grupo:
+                acumulado = resultados.setdefault(tabla.identificador(nombre), [0.0, 0])
+                acumulado[0] += resultado
+                acumulado[1] += 1
+            lugar += len(grupo)
+        
+        # Nadie puede competir solo contra sí mismo
+        num_distintos = len(resultados)
+        if num_distintos < 2:
+            return
+        
+        ids = list(resultados)
+        resultados = [suma / veces for suma, veces in resultados.values()]
+        
+        # Todos los incrementos se calculan con las puntuaciones previas a la regata
+        suma = sum(puntuaciones[i] for i in ids)
+        incrementos = []
+        for identificador, resultado in zip(ids, resultados):
+            propia = puntuaciones[identificador]
+            media_rivales = (suma - propia) / (num_distintos - 1)
+            esperado = 1.0 / (1.0 + 10.0 ** ((media_rivales - propia) / 400.0))
+            incrementos.append(self._factor_k * (resultado - esperado))
+        
+        for identificador, incremento in zip(ids, incrementos):
+            tabla.ajustar(identificador, incremento)
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_regatas=200_000, num_barcos=20_000, num_patrones=5_000, semilla=1):
+    """Temporada sintética de regatas de 2 a 10 participantes con algún empate"""
+    
+    generador = random.Random(semilla)
+    
+    # Habilidad oculta de cada barco para que la clasificación tenga sentido
+    habilidad = [generador.gauss(0, 1) for _ in range(num_barcos)]
+    regatas = []
+    for _ in range(num_regatas):
+        participantes = generador.sample(range(num_barcos), generador.randint(2, 10))
+        participantes.sort(key=lambda i: habilidad[i] + generador.gauss(0, 1), reverse=True)
+        clasificacion = [[(f"Barco {i}", f"Patrón {i % num_patrones}")] for i in participantes]
+        if generador.random() < 0.1:
+            clasificacion[0].extend(clasificacion.pop(1))
+        regatas.append(clasificacion)
+    
+    motor = ClasificacionElo()
+    inicio = time.perf_counter()
+    for clasificacion in regatas:
+        motor.registrar(clasificacion)
+    segundos = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    mejores = motor.get_barcos().top(20)
+    percentiles = [motor.get_barcos().percentil(f"Barco {i}") for i in range(1_000)]
+    consultas = time.perf_counter() - inicio
+    
+    print(f"{num_regatas} regatas en {segundos:.2f} s: {num_regatas / segundos:,.0f} regatas/s")
+    print(f"top 20 y 1000 percentiles en {consultas * 1000:.1f} ms; líder {mejores[0][0]} "
+          f"con {mejores[0][1]:.0f} puntos, {len(motor.get_patrones())} patrones clasificados")
+    return num_regatas / segundos
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,427 @@
+"""
+Línea de órdenes del puerto deportivo
+Uso: python -m puerto <orden> [argumentos] [--profile [RUTA]] [--format json]
+
+  cargar FLOTA                  construye la flota de un fichero JSON por líneas
+  reproducir FLOTA DIARIO       aplica un diario de comandos (formato del servidor de telemetría); admite --workers N
+  simular                       simula una jornada completa con una flota sintética
+  generar FLOTA DIARIO          escribe una flota sintética y un diario de comandos válidos para reproducir
+  benchmark [MODULO ...]        ejecuta los benchmarks de los módulos (todos si no se indica ninguno); admite --workers N
+  estadisticas FLOTA [DIARIO]   carga la flota, reproduce el diario si se indica y vuelca las estadísticas
+  demo                          la prueba guiada de las clases (antes main.py)
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import random
+import sys
+import time
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+# Módulos con función benchmark(), en el orden en que se ejecutan
+MODULOS_BENCHMARK = (
+    "registro", "serializacion", "transaccion", "eventos", "consultas", "historial", "clasificacion",
+    "asignacion", "repostaje", "rutas", "proximidad", "polar", "telemetria", "flota_distribuida",
+    "generador", "metricas", "diferencias", "archivo", "amarres", "arranque",
+)
+
+TAM_LOTE_DIARIO = 10_000
+
+
+# ========== UTILIDADES ==========
+
+def _contadores():
+    return {
+        "num_barcos": Embarcacion.get_num_barcos(),
+        "num_barcos_navegando": Embarcacion.get_num_barcos_navegando(),
+        "tiempo_total_navegacion_acumulado": Embarcacion.get_tiempo_total_navegacion_acumulado(),
+        "num_lanchas": Lancha.get_num_lanchas(),
+        "num_veleros": Velero.get_num_veleros(),
+    }
+
+
+def _leer_lotes(ruta, tam_lote):
+    """Líneas no vacías del diario en lotes de tam_lote"""
+    
+    lote = []
+    with open(ruta, encoding="utf-8") as fichero:
+        for linea in fichero:
+            if linea.strip():
+                lote.append(linea)
+                if len(lote) >= tam_lote:
+                    yield lote
+                    lote = []
+    if lote:
+        yield lote
+
+
+def _cargar(ruta):
+    from .serializacion import leer_flota
+    return list(leer_flota(ruta))
+
+
+# ========== ÓRDENES ==========
+
+def orden_cargar(args):
+    inicio = time.perf_counter()
+    barcos = _cargar(args.flota)
+    segundos = time.perf_counter() - inicio
+    
+    return {
+        "barcos": len(barcos),
+        "lanchas": sum(1 for barco in barcos if isinstance(barco, Lancha)),
+        "veleros": sum(1 for barco in barcos if isinstance(barco, Velero)),
+        "segundos": segundos,
+        "barcos_por_segundo": len(barcos) / segundos if segundos else None,
+    }
+
+
+def _reproducir_local(ruta_flota, ruta_diario):
+    from .agregados import AgregadosFlota
+    from .telemetria import ServidorTelemetria
+    
+    barcos = _cargar(ruta_flota)
+    servidor = ServidorTelemetria(barcos)
+    
+    # Las ventanas horarias de los agregados siguen el instante de los eventos del diario
+    agregados = AgregadosFlota(barcos, reloj=servidor.reloj).conectar()
+    
+    inicio = time.perf_counter()
+    for lote in _leer_lotes(ruta_diario, TAM_LOTE_DIARIO):
+        servidor.aplicar(lote)
+    segundos = time.perf_counter() - inicio
+    agregados.desconectar()
+    
+    resultado = {
+        "comandos": servidor.get_num_mensajes(),
+        "errores": servidor.get_num_errores(),
+        "segundos": segundos,
+        "contadores": _contadores(),
+        "agregados": agregados.resumen(),
+    }
+    return resultado
+
+
+def _reproducir_distribuido(ruta_flota, ruta_diario, num_trabajadores):
+    from .flota_distribuida import FlotaDistribuida
+    from .serializacion import leer_registros
+    
+    with FlotaDistribuida(num_trabajadores) as flota:
+        for registro in leer_registros(ruta_flota):
+            if registro["tipo"] == "Lancha":
+                flota.crear_lancha(registro["nombre"], registro["num_max_tripulantes"],
+                                   registro["num_motores"], registro["combustible"])
+            elif registro["tipo"] == "Velero":
+                flota.crear_velero(registro["nombre"], registro["num_mastiles"], registro["num_max_tripulantes"])
+            else:
+                raise ValueError(f"Tipo de embarcación desconocido: {registro['tipo']}.")
+        flota.ejecutar()
+        
+        comandos = 0
+        errores = 0
+        inicio = time.perf_counter()
+        for lote in _leer_lotes(ruta_diario, TAM_LOTE_DIARIO):
+            for linea in lote:
+                try:
+                    mensaje = json.loads(linea)
+                    operacion = mensaje.get("op")
+                    nombre = mensaje.get("barco")
+                    if operacion == "iniciar_navegacion":
+                        flota.iniciar_navegacion(nombre, mensaje["velocidad"], mensaje["rumbo"],
+                                                 mensaje["patron"], mensaje["tripulantes"])
+                    elif operacion == "set_rumbo":
+                        flota.set_rumbo(nombre, mensaje["rumbo"])
+                    elif operacion == "parar_navegacion":
+                        flota.parar_navegacion(nombre, mensaje["tiempo"])
+                    elif operacion == "iniciar_regata":
+                        flota.iniciar_regata(nombre, mensaje["otro"])
+                    elif operacion == "repostar":
+                        flota.repostar(nombre, mensaje.get("cantidad"))
+                    else:
+                        raise ValueError(f"Operación desconocida: {operacion}.")
+                except Exception:
+                    # Comando mal formado o de un barco inexistente: no llega a los trabajadores
+                    comandos += 1
+                    errores += 1
+            
+            resultados = flota.ejecutar()
+            comandos += len(resultados)
+            errores += sum(1 for ok, _ in resultados if not ok)
+        segundos = time.perf_counter() - inicio
+        
+        return {
+            "comandos": comandos,
+            "errores": errores,
+            "segundos": segundos,
+            "trabajadores": num_trabajadores,
+            "contadores": flota.contadores(),
+        }
+
+
+def orden_reproducir(args):
+    if args.workers > 1:
+        resultado = _reproducir_distribuido(args.flota, args.diario, args.workers)
+    else:
+        resultado = _reproducir_local(args.flota, args.diario)
+    resultado["comandos_por_segundo"] = resultado["comandos"] / resultado["segundos"] if resultado["segundos"] else None
+    return resultado
+
+
+def orden_estadisticas(args):
+    if args.diario is not None:
+        resultado = _reproducir_local(args.flota, args.diario)
+        return {"contadores": resultado["contadores"], "agregados": resultado["agregados"]}
+    
+    from .agregados import AgregadosFlota
+    
+    barcos = _cargar(args.flota)
+    return {"contadores": _contadores(), "agregados": AgregadosFlota(barcos).resumen()}
+
+
+def orden_simular(args):
+    """Jornada: salidas planificadas, cambios de rumbo, regatas, llegadas y repostaje"""
+    
+    from .agregados import AgregadosFlota
+    from .asignacion import planificar
+    from .clasificacion import ClasificacionElo
+    from .historial import HistorialNavegacion
+    from .repostaje import PlanificadorRepostaje
+    from .transaccion import iniciar_navegacion_lote
+    
+    generador = random.Random(args.semilla)
+    inicio = time.perf_counter()
+    
+    num_lanchas = args.barcos // 2
+    lanchas = Lancha.crear_lote(num_lanchas, 4, 2, Lancha.MAX_COMBUSTIBLE, prefijo="Simulación L")
+    veleros = Velero.crear_lote(args.barcos - num_lanchas, 2, 6, prefijo="Simulación V")
+    barcos = lanchas + veleros
+    
+    agregados = AgregadosFlota(barcos).conectar()
+    historial = HistorialNavegacion().conectar()
+    clasificacion = ClasificacionElo()
+    cualificaciones = [["Lancha"], ["Velero"], ["Lancha", "Velero"]]
+    patrones = [(f"Patrón {i}", generador.choice(cualificaciones)) for i in range(args.barcos * 4 // 5)]
+    
+    repostajes = None
+    for ronda in range(args.rondas):
+        # Salida de todo el plan en un lote, con velocidades al azar dentro del rango de cada tipo
+        plan = planificar(barcos, patrones, args.barcos * 3)
+        comandos = []
+        for barco, _, rumbo, patron, tripulantes in plan.comandos():
+            if isinstance(barco, Lancha):
+                velocidad = generador.randint(Lancha.MIN_VELOCIDAD_LANCHA, Lancha.MAX_VELOCIDAD_LANCHA)
+            else:
+                velocidad = generador.randint(Velero.MIN_VELOCIDAD_VELERO, Velero.MAX_VELOCIDAD_VELERO)
+            comandos.append((barco, velocidad, rumbo, patron, tripulantes))
+        iniciar_navegacion_lote(comandos)
+        navegando = [comando[0] for comando in comandos]
+        
+        # Cambios de rumbo
+        for barco in navegando:
+            if generador.random() < 0.3:
+                rumbos = Lancha.RUMBOS_LANCHA if isinstance(barco, Lancha) else Velero.RUMBOS_VELERO
+                barco.set_rumbo(generador.choice([rumbo for rumbo in rumbos if rumbo != barco.get_rumbo()]))
+        
+        # Regatas entre veleros del mismo rumbo
+        por_rumbo = {}
+        for barco in navegando:
+            if isinstance(barco, Velero):
+                por_rumbo.setdefault(barco.get_rumbo(), []).append(barco)
+        for grupo in por_rumbo.values():
+            generador.shuffle(grupo)
+            for velero, otro in zip(grupo[::2], grupo[1::2]):
+                clasificacion.registrar_regata(velero, otro)
+        
+        # Llegadas y repostaje de las lanchas que han gastado combustible
+        for barco in navegando:
+            barco.parar_navegacion(generador.uniform(0.5, 8))
+        
+        pendientes = PlanificadorRepostaje.necesitan_repostar(lanchas, Lancha.MAX_COMBUSTIBLE)
+        solicitudes = []
+        for lancha in pendientes:
+            llegada = generador.uniform(0, 2)
+            solicitudes.append((lancha, llegada, llegada + generador.uniform(1, 4)))
+        turnos = PlanificadorRepostaje(max(1, len(lanchas) // 50)).planificar(solicitudes)
+        PlanificadorRepostaje.ejecutar(turnos)
+        repostajes = PlanificadorRepostaje.resumen(turnos)
+    
+    agregados.desconectar()
+    historial.desconectar()
+    
+    return {
+        "barcos": len(barcos),
+        "rondas": args.rondas,
+        "segundos": time.perf_counter() - inicio,
+        "contadores": _contadores(),
+        "agregados": agregados.resumen(),
+        "top_patrones_por_horas": historial.top(5, "patron", "horas"),
+        "top_veleros_elo": clasificacion.get_barcos().top(5),
+        "regatas": clasificacion.get_num_regatas(),
+        "ultimo_repostaje": repostajes,
+    }
+
+
+def orden_generar(args):
+    from .generador import generar_ficheros
+    
+    inicio = time.perf_counter()
+    num = generar_ficheros(args.flota, args.diario, args.barcos, args.eventos, args.semilla, args.proporcion_lanchas)
+    segundos = time.perf_counter() - inicio
+    return {"barcos": args.barcos, "comandos": num, "semilla": args.semilla, "segundos": segundos,
+            "comandos_por_segundo": num / segundos if segundos else None}
+
+
+def orden_benchmark(args):
+    modulos = args.modulos or list(MODULOS_BENCHMARK)
+    resultados = {}
+    for nombre in modulos:
+        if nombre not in MODULOS_BENCHMARK:
+            raise ValueError(f"Módulo sin benchmark: {nombre}. Disponibles: {', '.join(MODULOS_BENCHMARK)}.")
+        
+        modulo = importlib.import_module(f".{nombre}", __package__)
+        print(f"== {nombre} ==")
+        inicio = time.perf_counter()
+        if nombre == "flota_distribuida" and args.workers > 1:
+            valor = modulo.benchmark(trabajadores=[args.workers])
+        else:
+            valor = modulo.benchmark()
+        resultados[nombre] = {"resultado": valor, "segundos": time.perf_counter() - inicio}
+    return resultados
+
+
+
+def orden_demo(args):
+    from .demo import ejecutar
+    
+    ejecutar()
+    return {"contadores": _contadores()}
+
+
+# ========== SALIDA ==========
+
+def _texto(valor, sangria=""):
+    lineas = []
+    for clave, dato in valor.items():
+        if isinstance(dato, dict):
+            lineas.append(f"{sangria}{clave}:")
+            lineas.extend(_texto(dato, sangria + "  "))
+        elif isinstance(dato, float):
+            lineas.append(f"{sangria}{clave}: {dato:,.3f}")
+        else:
+            lineas.append(f"{sangria}{clave}: {dato}")
+    return lineas
+
+
+def _argumentos():
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument("--profile", nargs="?", const="-", metavar="RUTA",
+                       help="perfila la orden con cProfile (estadísticas a stderr, o volcado pstats en RUTA)")
+    comun.add_argument("--format", choices=("texto", "json"), default="texto", help="formato de la salida")
+    
+    # Solo las órdenes que reparten el trabajo entre procesos aceptan --workers
+    trabajadores = argparse.ArgumentParser(add_help=False)
+    trabajadores.add_argument("--workers", type=int, default=1, metavar="N",
+                              help="procesos trabajadores (reproducir y benchmark de flota_distribuida)")
+    
+    analizador = argparse.ArgumentParser(prog="python -m puerto", description="Gestión del puerto deportivo")
+    ordenes = analizador.add_subparsers(dest="orden", required=True)
+    
+    orden = ordenes.add_parser("cargar", parents=[comun], help="carga una flota de un fichero")
+    orden.add_argument("flota")
+    orden.set_defaults(funcion=orden_cargar)
+    
+    orden = ordenes.add_parser("reproducir", parents=[comun, trabajadores], help="aplica un diario de comandos a una flota")
+    orden.add_argument("flota")
+    orden.add_argument("diario")
+    orden.set_defaults(funcion=orden_reproducir)
+    
+    orden = ordenes.add_parser("simular", parents=[comun], help="simula una jornada")
+    orden.add_argument("--barcos", type=int, default=1_000)
+    orden.add_argument("--rondas", type=int, default=3)
+    orden.add_argument("--semilla", type=int, default=1)
+    orden.set_defaults(funcion=orden_simular)
+    
+    orden = ordenes.add_parser("generar", parents=[comun], help="genera una flota y un diario sintéticos")
+    orden.add_argument("flota")
+    orden.add_argument("diario")
+    orden.add_argument("--barcos", type=int, default=1_000)
+    orden.add_argument("--eventos", type=int, default=100_000)
+    orden.add_argument("--semilla", type=int, default=1)
+    orden.add_argument("--proporcion-lanchas", type=float, default=0.5)
+    orden.set_defaults(funcion=orden_generar)
+    
+    orden = ordenes.add_parser("benchmark", parents=[comun, trabajadores], help="ejecuta los benchmarks")
+    orden.add_argument("modulos", nargs="*", metavar="MODULO")
+    orden.set_defaults(funcion=orden_benchmark)
+    
+    orden = ordenes.add_parser("demo", parents=[comun], help="prueba guiada de las clases")
+    orden.set_defaults(funcion=orden_demo)
+    
+    orden = ordenes.add_parser("estadisticas", parents=[comun], help="vuelca las estadísticas de una flota")
+    orden.add_argument("flota")
+    orden.add_argument("diario", nargs="?")
+    orden.set_defaults(funcion=orden_estadisticas)
+    
+    return analizador
+
+
+def main(argumentos=None):
+    args = _argumentos().parse_args(argumentos)
+    
+    if getattr(args, "workers", 1) < 1:
+        print("Error: --workers debe ser al menos 1.", file=sys.stderr)
+        return 2
+    
+    # En JSON la salida estándar queda solo para el resultado; lo demás va a stderr
+    destino = sys.stderr if args.format == "json" else sys.stdout
+    perfil = None
+    if args.profile:
+        import cProfile
+        perfil = cProfile.Profile()
+    
+    try:
+        with contextlib.redirect_stdout(destino):
+            if perfil is not None:
+                perfil.enable()
+            try:
+                resultado = args.funcion(args)
+            finally:
+                if perfil is not None:
+                    perfil.disable()
+    except KeyError as e:
+        # Registro de la flota sin alguno de sus campos
+        print(f"Error: falta el campo {e.args[0]}.", file=sys.stderr)
+        return 1
+    except Exception as e:
+        # Incluye los errores de estado del modelo (p. ej. un barco que ya navega), que son Exception
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    if args.format == "json":
+        print(json.dumps(resultado, ensure_ascii=False, indent=2, default=str))
+    else:
+        print("\n".join(_texto(resultado)))
+    
+    if perfil is not None:
+        if args.profile == "-":
+            import io
+            import pstats
+            
+            salida = io.StringIO()
+            pstats.Stats(perfil, stream=salida).sort_stats("cumulative").print_stats(25)
+            print(salida.getvalue(), file=sys.stderr)
+        else:
+            perfil.dump_stats(args.profile)
+            print(f"Perfil guardado en {args.profile}", file=sys.stderr)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,594 @@
+"""
+Motor de consultas sobre la flota
+Los predicados se compilan a operaciones vectorizadas por columnas (FlotaEmpaquetada + NumPy)
+o a una única función fusionada (listas de barcos), usando índices cuando existen
+"""
+
+import heapq
+import operator
+import time
+import weakref
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .oyente_embarcacion import OyenteEmbarcacion
+from .serializacion import COLUMNAS, TIPO_LANCHA, TIPO_VELERO, FlotaEmpaquetada, _numero
+from .velero import Velero
+
+
+# NumPy se importa en la primera consulta por columnas (ver _cargar_numpy)
+np = None
+_numpy_buscado = False
+
+# Expresión de cada campo sobre un barco b (los campos que no aplican al tipo valen 0,
+# igual que en las columnas de FlotaEmpaquetada)
+CAMPOS = {
+    "nombre": "b._nombre",
+    "tipo": "type(b).__name__",
+    "num_max_tripulantes": "b._num_max_tripulantes",
+    "navegando": "b._navegando",
+    "velocidad": "b._velocidad",
+    "rumbo": "b._rumbo",
+    "patron": "b._patron",
+    "tripulacion": "b._tripulacion",
+    "tiempo_total": "b._tiempo_total_navegacion",
+    "num_motores": "getattr(b, '_num_motores', 0)",
+    "combustible": "getattr(b, '_cantidad_combustible', 0)",
+    "num_mastiles": "getattr(b, '_num_mastiles', 0)",
+}
+
+# Campos discretos que admiten un IndiceHash
+CAMPOS_INDEXABLES = ["tipo", "navegando", "rumbo", "patron", "num_max_tripulantes", "num_motores", "num_mastiles"]
+
+OPERADORES = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+CODIGOS_TIPO = {Lancha.__name__: TIPO_LANCHA, Velero.__name__: TIPO_VELERO}
+TIPOS_POR_CODIGO = {codigo: tipo for tipo, codigo in CODIGOS_TIPO.items()}
+
+
+def _valor_campo(campo):
+    """Función que lee un campo de un barco"""
+    return eval(f"lambda b: {CAMPOS[campo]}")
+
+
+def _cargar_numpy():
+    """NumPy (o None si no está instalado); se importa una sola vez, al primer uso"""
+    
+    global np, _numpy_buscado
+    if not _numpy_buscado:
+        _numpy_buscado = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+    return np
+
+
+# ========== PREDICADOS ==========
+
+class Campo:
+    """Referencia a un campo de la flota; sus comparaciones construyen predicados"""
+    
+    def __init__(self, nombre):
+        """Constructor de Campo"""
+        
+        if nombre not in CAMPOS:
+            raise ValueError(f"El campo {nombre} no existe. Campos válidos: {', '.join(CAMPOS)}.")
+        self._nombre = nombre
+    
+    def get_nombre(self):
+        return self._nombre
+    
+    def __eq__(self, valor):
+        return Predicado(self._nombre, "==", valor)
+    
+    def __ne__(self, valor):
+        return Predicado(self._nombre, "!=", valor)
+    
+    def __lt__(self, valor):
+        return Predicado(self._nombre, "<", valor)
+    
+    def __le__(self, valor):
+        return Predicado(self._nombre, "<=", valor)
+    
+    def __gt__(self, valor):
+        return Predicado(self._nombre, ">", valor)
+    
+    def __ge__(self, valor):
+        return Predicado(self._nombre, ">=", valor)
+    
+    def en(self, valores):
+        return Predicado(self._nombre, "en", frozenset(valores))
+    
+    __hash__ = None
+
+
+class Predicado:
+    """Condición campo-operador-valor"""
+    
+    def __init__(self, campo, operador, valor):
+        """Constructor de Predicado"""
+        
+        if operador not in OPERADORES and operador != "en":
+            raise ValueError(f"Operador no soportado: {operador}.")
+        
+        self._campo = campo
+        self._operador = operador
+        self._valor = valor
+    
+    def get_campo(self):
+        return self._campo
+    
+    def get_operador(self):
+        return self._operador
+    
+    def get_valor(self):
+        return self._valor
+    
+    def expresion(self, nombre_constante):
+        """Código Python del predicado sobre un barco b"""
+        if self._operador == "en":
+            return f"({CAMPOS[self._campo]} in {nombre_constante})"
+        return f"({CAMPOS[self._campo]} {self._operador} {nombre_constante})"
+    
+    def __repr__(self):
+        return f"Predicado({self._campo} {self._operador} {self._valor!r})"
+
+
+def compilar(predicados):
+    """Fusiona los predicados en una sola función b -> bool"""
+    
+    if not predicados:
+        return lambda b: True
+    
+    # Los valores de comparación quedan como globales de la función generada
+    entorno = {f"_v{i}": predicado.get_valor() for i, predicado in enumerate(predicados)}
+    cuerpo = " and ".join(predicado.expresion(f"_v{i}") for i, predicado in enumerate(predicados))
+    return eval(f"lambda b: {cuerpo}", entorno)
+
+
+# ========== ÍNDICES ==========
+
+class _Referencia(weakref.ref):
+    """Referencia débil a un barco indexado que recuerda su id"""
+    
+    __slots__ = ("clave",)
+    
+    def __new__(cls, barco, al_desaparecer):
+        return super().__new__(cls, barco, al_desaparecer)
+    
+    def __init__(self, barco, al_desaparecer):
+        super().__init__(barco, al_desaparecer)
+        self.clave = id(barco)
+
+
+class IndiceHash(OyenteEmbarcacion):
+    """
+    Índice valor -> barcos de un campo discreto sobre una lista de barcos, mantenido al día como
+    oyente. Guarda referencias débiles: un barco que deja de existir sale solo del índice.
+    """
+    
+    def __init__(self, barcos, campo):
+        """Constructor de IndiceHash"""
+        
+        if campo not in CAMPOS_INDEXABLES:
+            raise ValueError(f"El campo {campo} no se puede indexar. Campos indexables: {', '.join(CAMPOS_INDEXABLES)}.")
+        
+        self._campo = campo
+        self._leer = _valor_campo(campo)
+        
+        # Todo por id del barco: valor -> {id: posición en la lista de origen (-1 si no se conoce)},
+        # id -> valor, id -> referencia débil
+        self._por_valor = {}
+        self._valor_de = {}
+        self._referencias = {}
+        self._al_desaparecer = self._desaparecido
+        
+        # Lista sobre la que se construyó: sus resultados se ordenan por posición sin recorrerla
+        self._origen = barcos
+        
+        for posicion, barco in enumerate(barcos):
+            self._añadir(barco, posicion)
+        
+        Embarcacion.registrar_oyente(self)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_campo(self):
+        return self._campo
+    
+    def buscar(self, valor):
+        """Barcos cuyo campo vale exactamente valor (sin orden)"""
+        referencias = self._referencias
+        return [referencias[clave]() for clave in self._por_valor.get(valor, ())]
+    
+    def __len__(self):
+        return len(self._valor_de)
+    
+    def cuantos(self, valor):
+        return len(self._por_valor.get(valor, ()))
+    
+    def buscar_en(self, fuente, valor):
+        """Barcos de fuente cuyo campo vale valor, en el orden de fuente"""
+        
+        claves = self._por_valor.get(valor, ())
+        
+        # Sobre su propia lista sin cambios basta ordenar los encontrados por su posición
+        if fuente is self._origen and len(fuente) == len(self._valor_de):
+            posiciones = sorted(claves.values()) if claves else []
+            if not posiciones or (posiciones[0] >= 0 and posiciones[-1] < len(fuente)):
+                candidatos = [fuente[i] for i in posiciones]
+                
+                # Cada posición debe seguir ocupada por un barco encontrado (las posiciones son distintas)
+                if all(map(claves.__contains__, map(id, candidatos))):
+                    return candidatos
+        
+        # Otra fuente, o la lista ha cambiado: se recorre en su orden quedándose con los encontrados
+        return [barco for barco in fuente if id(barco) in claves]
+    
+    # ========== MANTENIMIENTO ==========
+    
+    def añadir(self, barco):
+        """Añade un barco al índice (si se añade también a la lista de origen)"""
+        self._añadir(barco, -1)
+    
+    def _añadir(self, barco, posicion):
+        clave = id(barco)
+        if clave in self._valor_de:
+            return
+        
+        valor = self._leer(barco)
+        self._referencias[clave] = _Referencia(barco, self._al_desaparecer)
+        self._valor_de[clave] = valor
+        self._por_valor.setdefault(valor, {})[clave] = posicion
+    
+    def eliminar(self, barco):
+        clave = id(barco)
+        if clave in self._valor_de:
+            self._quitar(clave)
+    
+    def _quitar(self, clave):
+        valor = self._valor_de.pop(clave)
+        del self._referencias[clave]
+        claves = self._por_valor[valor]
+        del claves[clave]
+        if not claves:
+            del self._por_valor[valor]
+    
+    def _desaparecido(self, referencia):
+        # El barco se ha liberado de memoria: su id puede reutilizarse para otro
+        if self._referencias.get(referencia.clave) is referencia:
+            self._quitar(referencia.clave)
+    
+    def cerrar(self):
+        """Deja de mantener el índice"""
+        Embarcacion.eliminar_oyente(self)
+    
+    def _actualizar(self, barco):
+        clave = id(barco)
+        anterior = self._valor_de.get(clave)
+        if anterior is None and clave not in self._valor_de:
+            return
+        
+        valor = self._leer(barco)
+        if valor != anterior:
+            claves = self._por_valor[anterior]
+            posicion = claves.pop(clave)
+            if not claves:
+                del self._por_valor[anterior]
+            self._valor_de[clave] = valor
+            self._por_valor.setdefault(valor, {})[clave] = posicion
+    
+    def al_iniciar_navegacion(self, barco):
+        self._actualizar(barco)
+    
+    def al_cambiar_rumbo(self, barco, rumbo_anterior):
+        self._actualizar(barco)
+    
+    def al_parar_navegacion(self, barco, *estado_anterior):
+        self._actualizar(barco)
+
+
+# ========== CONSULTAS ==========
+
+class Consulta:
+    """Consulta encadenable: donde(...).seleccionar(...).ordenar(...).limite(...).ejecutar()"""
+    
+    def __init__(self, fuente, indices=None):
+        """Constructor de Consulta (fuente: lista de barcos o FlotaEmpaquetada)"""
+        
+        if fuente is None:
+            raise ValueError("La flota a consultar no existe.")
+        
+        self._fuente = fuente
+        self._indices = {indice.get_campo(): indice for indice in (indices or [])}
+        self._predicados = []
+        self._proyeccion = None
+        self._orden = None
+        self._descendente = False
+        self._limite = None
+    
+    # ========== CONSTRUCCIÓN ==========
+    
+    def donde(self, *predicados):
+        for predicado in predicados:
+            if not isinstance(predicado, Predicado):
+                raise ValueError(f"{predicado!r} no es un predicado; usa Campo('...') para construirlo.")
+            self._predicados.append(predicado)
+        return self
+    
+    def seleccionar(self, *campos):
+        for campo in campos:
+            if campo not in CAMPOS:
+                raise ValueError(f"El campo {campo} no existe.")
+        self._proyeccion = list(campos)
+        return self
+    
+    def ordenar(self, campo, descendente=False):
+        if campo not in CAMPOS:
+            raise ValueError(f"El campo {campo} no existe.")
+        self._orden = campo
+        self._descendente = descendente
+        return self
+    
+    def limite(self, num):
+        if num < 0:
+            raise ValueError("El límite no puede ser negativo.")
+        self._limite = num
+        return self
+    
+    # ========== EJECUCIÓN ==========
+    
+    def ejecutar(self):
+        """Devuelve barcos (sin proyección) o diccionarios con los campos seleccionados"""
+        
+        if isinstance(self._fuente, FlotaEmpaquetada):
+            return self._ejecutar_columnas()
+        return self._ejecutar_objetos()
+    
+    def contar(self):
+        """Número de barcos que cumplen los predicados (sin materializar resultados)"""
+        
+        if isinstance(self._fuente, FlotaEmpaquetada) and _cargar_numpy() is not None:
+            return int(np.count_nonzero(self._seleccion_columnas()))
+        copia = self._clonar(self._fuente)
+        copia._proyeccion = copia._orden = copia._limite = None
+        return len(copia._ejecutar_objetos())
+    
+    def _ejecutar_objetos(self):
+        candidatos = self._fuente
+        predicados = self._predicados
+        
+        # Usar el índice de igualdad más selectivo disponible
+        mejor = None
+        for predicado in predicados:
+            indice = self._indices.get(predicado.get_campo())
+            if indice is not None and predicado.get_operador() == "==":
+                num = indice.cuantos(predicado.get_valor())
+                if mejor is None or num < mejor[2]:
+                    mejor = (predicado, indice, num)
+        
+        if mejor is not None:
+            predicado_indexado, indice, _ = mejor
+            predicados = [predicado for predicado in predicados if predicado is not predicado_indexado]
+            
+            # Los candidatos salen en el orden de la fuente, igual que sin índice (importa con limite)
+            candidatos = indice.buscar_en(self._fuente, predicado_indexado.get_valor())
+        
+        filtro = compilar(predicados)
+        seleccion = [b for b in candidatos if filtro(b)]
+        
+        if self._orden is not None:
+            clave = _valor_campo(self._orden)
+            if self._limite is not None:
+                elegir = heapq.nlargest if self._descendente else heapq.nsmallest
+                seleccion = elegir(self._limite, seleccion, key=clave)
+            else:
+                seleccion.sort(key=clave, reverse=self._descendente)
+        elif self._limite is not None:
+            seleccion = seleccion[:self._limite]
+        
+        if self._proyeccion is None:
+            return seleccion
+        
+        lectores = [(campo, _valor_campo(campo)) for campo in self._proyeccion]
+        return [{campo: leer(b) for campo, leer in lectores} for b in seleccion]
+    
+    # ---------- Flota empaquetada ----------
+    
+    def _columna(self, campo):
+        """Valores de un campo como array NumPy (sin copia para las columnas numéricas)"""
+        
+        flota = self._fuente
+        if campo == "nombre":
+            return np.array([flota.get_nombre(i) for i in range(len(flota))], dtype=object)
+        
+        formatos = dict(COLUMNAS)
+        valores = np.frombuffer(memoryview(flota.get_columna(campo)).cast("B"), dtype=formatos[campo])
+        if campo == "navegando":
+            return valores.astype(bool)
+        return valores
+    
+    def _mascara(self, predicado):
+        flota = self._fuente
+        campo, operador, valor = predicado.get_campo(), predicado.get_operador(), predicado.get_valor()
+        
+        # Los campos codificados se comparan por código siempre que sea posible
+        if campo in ("tipo", "rumbo", "patron") and operador in ("==", "!=", "en"):
+            if campo == "tipo":
+                tabla = {tipo: codigo for tipo, codigo in CODIGOS_TIPO.items()}
+            else:
+                tabla = {texto: codigo for codigo, texto in
+                         enumerate(flota.get_rumbos() if campo == "rumbo" else flota.get_patrones())}
+            
+            codigos = self._columna(campo)
+            if operador == "en":
+                buscados = [tabla[v] for v in valor if v in tabla]
+                return np.isin(codigos, buscados)
+            
+            codigo = tabla.get(valor, -1)
+            return codigos == codigo if operador == "==" else codigos != codigo
+        
+        if campo in ("rumbo", "patron", "tipo"):
+            tabla = flota.get_rumbos() if campo == "rumbo" else flota.get_patrones()
+            if campo == "tipo":
+                tabla = [TIPOS_POR_CODIGO.get(codigo) for codigo in range(max(CODIGOS_TIPO.values()) + 1)]
+            valores = np.array(tabla, dtype=object)[self._columna(campo)]
+        else:
+            valores = self._columna(campo)
+        
+        if operador == "en":
+            return np.isin(valores, list(valor))
+        return OPERADORES[operador](valores, valor)
+    
+    def _ejecutar_columnas(self):
+        flota = self._fuente
+        
+        if _cargar_numpy() is None:
+            # Sin NumPy: se reconstruyen los barcos y se usa la función fusionada (sin índices:
+            # son barcos nuevos)
+            copia = self._clonar(flota.barcos())
+            copia._indices = {}
+            return copia.ejecutar()
+        
+        filas = np.flatnonzero(self._seleccion_columnas())
+        
+        if self._orden is not None:
+            if self._orden in ("nombre", "tipo", "rumbo", "patron"):
+                claves = np.array([self._leer_fila(self._orden, int(fila)) for fila in filas], dtype=object)
+            else:
+                claves = self._columna(self._orden)[filas]
+            if self._descendente:
+                # Orden estable descendente: empates en el orden original de la flota
+                orden = len(claves) - 1 - np.argsort(claves[::-1], kind="stable")[::-1]
+            else:
+                orden = np.argsort(claves, kind="stable")
+            filas = filas[orden]
+        
+        if self._limite is not None:
+            filas = filas[:self._limite]
+        
+        if self._proyeccion is None:
+            return [flota.barco(int(fila)) for fila in filas]
+        
+        # Proyección por columnas: cada campo se extrae de una vez para todas las filas
+        columnas = [self._leer_filas(campo, filas) for campo in self._proyeccion]
+        return [dict(zip(self._proyeccion, valores)) for valores in zip(*columnas)]
+    
+    def _leer_filas(self, campo, filas):
+        flota = self._fuente
+        if campo == "nombre":
+            return [flota.get_nombre(fila) for fila in filas.tolist()]
+        
+        valores = self._columna(campo)[filas].tolist()
+        if campo == "tipo":
+            return [TIPOS_POR_CODIGO.get(valor) for valor in valores]
+        if campo in ("rumbo", "patron"):
+            tabla = flota.get_rumbos() if campo == "rumbo" else flota.get_patrones()
+            return [tabla[valor] for valor in valores]
+        if campo in ("velocidad", "combustible"):
+            return [_numero(valor) for valor in valores]
+        return valores
+    
+    def _seleccion_columnas(self):
+        seleccion = np.ones(len(self._fuente), dtype=bool)
+        for predicado in self._predicados:
+            seleccion &= self._mascara(predicado)
+        return seleccion
+    
+    def _leer_fila(self, campo, fila):
+        flota = self._fuente
+        if campo == "nombre":
+            return flota.get_nombre(fila)
+        valor = flota.get_columna(campo)[fila]
+        if campo == "tipo":
+            return TIPOS_POR_CODIGO.get(valor)
+        if campo == "rumbo":
+            return flota.get_rumbos()[valor]
+        if campo == "patron":
+            return flota.get_patrones()[valor]
+        if campo == "navegando":
+            return bool(valor)
+        if campo in ("velocidad", "combustible"):
+            return _numero(valor)
+        return valor
+    
+    def _clonar(self, fuente):
+        """Misma consulta sobre otra fuente"""
+        
+        copia = Consulta(fuente, list(self._indices.values()))
+        copia._predicados = list(self._predicados)
+        copia._proyeccion = self._proyeccion
+        copia._orden = self._orden
+        copia._descendente = self._descendente
+        copia._limite = self._limite
+        return copia
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=1_000_000):
+    """Mide la consulta de ejemplo sobre una lista de barcos, con índice y por columnas"""
+    
+    barcos = []
+    for i in range(num_barcos):
+        if i % 2 == 0:
+            barco = Lancha(f"Consulta {i}", 4, 1 + (i // 2) % 2, Lancha.MIN_COMBUSTIBLE + i % 40)
+        else:
+            barco = Velero(f"Consulta {i}", 1 + i % 4, 4)
+        barcos.append(barco)
+    
+    predicados = [
+        Campo("tipo") == "Lancha",
+        Campo("num_motores") == 2,
+        Campo("combustible") < 15,
+        Campo("navegando") == False,
+    ]
+    
+    inicio = time.perf_counter()
+    esperado = [b for b in barcos if isinstance(b, Lancha) and b.get_num_motores() == 2
+                and b.get_cantidad_combustible() < 15 and not b.is_navegando()]
+    comprension = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    fusionada = Consulta(barcos).donde(*predicados).ejecutar()
+    tiempo_fusionada = time.perf_counter() - inicio
+    
+    indice = IndiceHash(barcos, "num_motores")
+    inicio = time.perf_counter()
+    con_indice = Consulta(barcos, indices=[indice]).donde(*predicados).ejecutar()
+    tiempo_indice = time.perf_counter() - inicio
+    indice.cerrar()
+    
+    empaquetada = FlotaEmpaquetada.desde_barcos(barcos)
+    inicio = time.perf_counter()
+    num_columnas = Consulta(empaquetada).donde(*predicados).contar()
+    tiempo_filtro = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    columnas = Consulta(empaquetada).donde(*predicados).seleccionar("nombre", "combustible").ejecutar()
+    tiempo_columnas = time.perf_counter() - inicio
+    
+    if not (len(esperado) == len(fusionada) == len(con_indice) == len(columnas) == num_columnas):
+        raise Exception("Las estrategias de consulta no devuelven el mismo resultado.")
+    
+    print(f"{num_barcos} barcos, {len(esperado)} resultados")
+    print(f"  comprensión con getters: {comprension * 1000:9.1f} ms")
+    print(f"  función fusionada:       {tiempo_fusionada * 1000:9.1f} ms")
+    print(f"  con índice num_motores:  {tiempo_indice * 1000:9.1f} ms")
+    print(f"  filtro por columnas:     {tiempo_filtro * 1000:9.1f} ms")
+    print(f"  columnas + proyección:   {tiempo_columnas * 1000:9.1f} ms")
+    
+    return comprension, tiempo_fusionada, tiempo_indice, tiempo_filtro, tiempo_columnas
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,477 @@
+"""
+Diferencias entre estados de la flota
+Compara dos flotas por nombre (listas de barcos o FlotaEmpaquetada) y produce un conjunto de
+cambios compacto que se puede guardar, enviar y aplicar como parche
+"""
+
+import hashlib
+import struct
+import time
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .serializacion import TIPO_LANCHA, TIPO_VELERO, FlotaEmpaquetada, _numero
+from .velero import Velero
+
+
+# Campos comparados, en el orden de la tupla de estado de cada barco
+CAMPOS = (
+    "tipo", "num_max_tripulantes", "navegando", "velocidad", "rumbo", "patron",
+    "tripulacion", "tiempo_total", "num_motores", "combustible", "num_mastiles",
+)
+
+# Campo -> atributo del barco
+ATRIBUTOS = {
+    "num_max_tripulantes": "_num_max_tripulantes",
+    "navegando": "_navegando",
+    "velocidad": "_velocidad",
+    "rumbo": "_rumbo",
+    "patron": "_patron",
+    "tripulacion": "_tripulacion",
+    "tiempo_total": "_tiempo_total_navegacion",
+    "num_motores": "_num_motores",
+    "combustible": "_cantidad_combustible",
+    "num_mastiles": "_num_mastiles",
+}
+
+CAMPOS_LANCHA = ("num_motores", "combustible")
+CAMPOS_VELERO = ("num_mastiles",)
+
+# Valores que admite cada campo en un parche (un bool no cuenta como número)
+CAMPOS_ENTEROS = ("num_max_tripulantes", "tripulacion", "num_motores", "num_mastiles")
+CAMPOS_REALES = ("velocidad", "tiempo_total", "combustible")
+CAMPOS_TEXTO = ("rumbo", "patron")
+
+_RUMBOS = {Lancha.__name__: Lancha.RUMBOS_LANCHA, Velero.__name__: Velero.RUMBOS_VELERO}
+
+_TIPOS = {TIPO_LANCHA: Lancha.__name__, TIPO_VELERO: Velero.__name__}
+_CODIGOS_TIPO = {nombre: codigo for codigo, nombre in _TIPOS.items()}
+
+# Parte numérica de la huella: los números se normalizan para que 20 y 20.0 den lo mismo
+_NUMEROS = struct.Struct("<bqbdqdbdb")
+
+
+# ========== ESTADOS ==========
+
+def estado_barco(barco):
+    """Tupla con los CAMPOS del barco (0 en los que no aplican a su tipo)"""
+    return (
+        type(barco).__name__, barco._num_max_tripulantes, barco._navegando, barco._velocidad,
+        barco._rumbo, barco._patron, barco._tripulacion, barco._tiempo_total_navegacion,
+        getattr(barco, "_num_motores", 0), getattr(barco, "_cantidad_combustible", 0),
+        getattr(barco, "_num_mastiles", 0),
+    )
+
+
+def _nombres_empaquetados(flota):
+    fines = flota.get_columna("fin_nombre").tolist()
+    datos = bytes(flota._nombres)
+    if datos.isascii():
+        # En ASCII los desplazamientos en bytes son también desplazamientos en caracteres
+        texto = datos.decode("ascii")
+        return [texto[inicio:fin] for inicio, fin in zip([0] + fines, fines)]
+    return [datos[inicio:fin].decode("utf-8") for inicio, fin in zip([0] + fines, fines)]
+
+
+def estados(fuente):
+    """Diccionario nombre -> tupla de estado; las flotas empaquetadas se leen por columnas"""
+    
+    if isinstance(fuente, FlotaEmpaquetada):
+        columnas = [fuente.get_columna(campo).tolist() for campo in CAMPOS]
+        columnas[0] = [_TIPOS.get(codigo) for codigo in columnas[0]]
+        columnas[2] = [bool(valor) for valor in columnas[2]]
+        rumbos, patrones = fuente.get_rumbos(), fuente.get_patrones()
+        columnas[4] = [rumbos[codigo] for codigo in columnas[4]]
+        columnas[5] = [patrones[codigo] for codigo in columnas[5]]
+        return dict(zip(_nombres_empaquetados(fuente), zip(*columnas)))
+    
+    if isinstance(fuente, dict):
+        fuente = fuente.values()
+    return {barco._nombre: estado_barco(barco) for barco in fuente}
+
+
+def huella(estado):
+    """Hash de contenido de 64 bits, estable entre procesos y máquinas"""
+    
+    tipo, maximo, navegando, velocidad, rumbo, patron, tripulacion, tiempo, motores, combustible, mastiles = estado
+    numeros = _NUMEROS.pack(_CODIGOS_TIPO.get(tipo, 0), maximo, navegando, float(velocidad), tripulacion,
+                            float(tiempo), motores, float(combustible), mastiles)
+    texto = f"{rumbo}\0{patron}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(numeros + texto, digest_size=8).digest(), "little")
+
+
+def huellas(fuente):
+    """Diccionario nombre -> huella, para comparar flotas que están en otra máquina"""
+    return {nombre: huella(estado) for nombre, estado in estados(fuente).items()}
+
+
+def nombres_distintos(huellas_origen, huellas_destino):
+    """Nombres que hay que transferir: (solo en origen, solo en destino, con huella distinta)"""
+    
+    solo_origen = [nombre for nombre in huellas_origen if nombre not in huellas_destino]
+    solo_destino = []
+    distintos = []
+    for nombre, valor in huellas_destino.items():
+        anterior = huellas_origen.get(nombre)
+        if anterior is None:
+            solo_destino.append(nombre)
+        elif anterior != valor:
+            distintos.append(nombre)
+    return solo_origen, solo_destino, distintos
+
+
+# ========== CONJUNTO DE CAMBIOS ==========
+
+class ConjuntoCambios:
+    """Parche que lleva una flota del estado de origen al de destino"""
+    
+    def __init__(self, altas=None, bajas=None, modificaciones=None):
+        """
+        Constructor de ConjuntoCambios
+        altas: nombre -> {campo: valor} con todos los CAMPOS
+        bajas: nombres que desaparecen
+        modificaciones: nombre -> {campo: valor nuevo}, solo los campos que cambian
+        """
+        
+        self._altas = altas if altas is not None else {}
+        self._bajas = bajas if bajas is not None else []
+        self._modificaciones = modificaciones if modificaciones is not None else {}
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_altas(self):
+        return self._altas
+    
+    def get_bajas(self):
+        return self._bajas
+    
+    def get_modificaciones(self):
+        return self._modificaciones
+    
+    def __len__(self):
+        return len(self._altas) + len(self._bajas) + len(self._modificaciones)
+    
+    def __repr__(self):
+        return (f"ConjuntoCambios({len(self._altas)} altas, {len(self._bajas)} bajas, "
+                f"{len(self._modificaciones)} modificaciones)")
+    
+    # ========== FORMATO DE INTERCAMBIO ==========
+    
+    def a_dict(self):
+        """Diccionario apto para JSON"""
+        return {"altas": self._altas, "bajas": self._bajas, "modificaciones": self._modificaciones}
+    
+    @classmethod
+    def desde_dict(cls, datos):
+        for clave in ("altas", "bajas", "modificaciones"):
+            if clave not in datos:
+                raise ValueError(f"Al conjunto de cambios le falta la clave {clave}.")
+        return cls(dict(datos["altas"]), list(datos["bajas"]), dict(datos["modificaciones"]))
+    
+    # ========== APLICACIÓN ==========
+    
+    def aplicar(self, barcos):
+        """
+        Aplica el parche a una flota (diccionario nombre -> barco o iterable de barcos) y devuelve
+        el diccionario resultante. Como la reconstrucción de FlotaEmpaquetada, copia el estado sin
+        pasar por los métodos de navegación: no se avisa a los oyentes ni cambian los contadores
+        de creados, aunque sí el de barcos navegando.
+        """
+        
+        flota = dict(barcos) if isinstance(barcos, dict) else {barco._nombre: barco for barco in barcos}
+        
+        # Todo el parche se valida antes de tocar ningún barco: o se aplica entero o nada
+        self._validar(flota)
+        
+        for nombre in self._bajas:
+            barco = flota.pop(nombre)
+            if barco._navegando:
+                Embarcacion._num_barcos_navegando -= 1
+        
+        for nombre, campos in self._altas.items():
+            flota[nombre] = _crear(nombre, campos)
+        
+        for nombre, campos in self._modificaciones.items():
+            _asignar(flota[nombre], campos)
+        
+        return flota
+    
+    
+    def _validar(self, flota):
+        bajas = set(self._bajas)
+        if len(bajas) != len(self._bajas):
+            raise ValueError("Un barco aparece más de una vez entre las bajas del parche.")
+        
+        for nombre in self._bajas:
+            if nombre not in flota:
+                raise ValueError(f"El barco {nombre} que hay que dar de baja no está en la flota.")
+        
+        tipos = {}
+        for nombre, campos in self._altas.items():
+            if nombre in flota and nombre not in bajas:
+                raise ValueError(f"El barco {nombre} que hay que dar de alta ya está en la flota.")
+            
+            tipo = campos.get("tipo")
+            if tipo not in _CODIGOS_TIPO:
+                raise ValueError(f"Tipo de embarcación desconocido: {tipo}.")
+            
+            for campo in CAMPOS:
+                if campo not in campos:
+                    raise ValueError(f"Al alta de {nombre} le falta el campo {campo}.")
+            
+            # Las altas llevan todos los CAMPOS; los que no son de su tipo se ignoran al crear
+            _validar_campos(nombre, tipo, {campo: valor for campo, valor in campos.items() if campo != "tipo"}, alta=True)
+            tipos[nombre] = tipo
+        
+        for nombre, campos in self._modificaciones.items():
+            tipo = tipos.get(nombre)
+            if tipo is None:
+                if nombre not in flota or nombre in bajas:
+                    raise ValueError(f"El barco {nombre} que hay que modificar no está en la flota.")
+                tipo = type(flota[nombre]).__name__
+            _validar_campos(nombre, tipo, campos)
+        
+        # Los patrones nuevos del parche deben caber juntos en la tabla de patrones
+        tabla = Embarcacion._patrones
+        if tabla.get_max_simbolos() is not None:
+            nuevos = {campos["patron"] for parte in (self._altas, self._modificaciones)
+                      for campos in parte.values() if "patron" in campos and campos["patron"] not in tabla}
+            if len(tabla) + len(nuevos) > tabla.get_max_simbolos():
+                raise ValueError(f"No se admiten más de {tabla.get_max_simbolos()} patrones distintos.")
+
+
+def _validar_campos(nombre, tipo, campos, alta=False):
+    """
+    Campos conocidos y con valores del tipo adecuado. En una modificación se rechazan los campos
+    propios del otro tipo de barco; en un alta vienen todos y esos se ignoran al crear.
+    """
+    
+    ajenos = CAMPOS_VELERO if tipo == Lancha.__name__ else CAMPOS_LANCHA
+    for campo, valor in campos.items():
+        if campo not in ATRIBUTOS:
+            raise ValueError(f"El campo {campo} no se puede modificar con un parche.")
+        if campo in ajenos:
+            if alta:
+                continue
+            raise ValueError(f"El campo {campo} no corresponde al tipo {tipo} de {nombre}.")
+        
+        if campo in CAMPOS_ENTEROS:
+            valido = type(valor) is int
+        elif campo in CAMPOS_REALES:
+            valido = type(valor) in (int, float)
+        elif campo == "navegando":
+            valido = type(valor) is bool or (type(valor) is int and valor in (0, 1))
+        else:
+            valido = isinstance(valor, str)
+        if not valido:
+            raise ValueError(f"Valor no válido para el campo {campo} de {nombre}: {valor!r}.")
+        
+        # Solo se internan rumbos del tipo de barco (o el de los barcos en puerto)
+        if campo == "rumbo" and valor != Embarcacion.RUMBO_POR_DEFECTO and valor not in _RUMBOS[tipo]:
+            raise ValueError(f"El rumbo {valor} no corresponde al tipo {tipo} de {nombre}.")
+
+
+def _asignar(barco, campos):
+    for campo, valor in campos.items():
+        if campo == "rumbo":
+            barco._codigo_rumbo, barco._rumbo = Embarcacion._rumbos.internar(valor)
+        elif campo == "patron":
+            barco._codigo_patron, barco._patron = Embarcacion._patrones.internar(valor)
+        elif campo == "navegando":
+            valor = bool(valor)
+            if valor != barco._navegando:
+                Embarcacion._num_barcos_navegando += 1 if valor else -1
+            barco._navegando = valor
+        elif campo in ATRIBUTOS:
+            setattr(barco, ATRIBUTOS[campo], valor)
+        else:
+            raise ValueError(f"El campo {campo} no se puede modificar con un parche.")
+
+
+def _crear(nombre, campos):
+    tipo = campos.get("tipo")
+    if tipo == Lancha.__name__:
+        barco, excluidos = object.__new__(Lancha), CAMPOS_VELERO
+    elif tipo == Velero.__name__:
+        barco, excluidos = object.__new__(Velero), CAMPOS_LANCHA
+    else:
+        raise ValueError(f"Tipo de embarcación desconocido: {tipo}.")
+    
+    barco._nombre = nombre
+    barco._navegando = False
+    _asignar(barco, {campo: valor for campo, valor in campos.items() if campo != "tipo" and campo not in excluidos})
+    Embarcacion._registro.añadir(barco)
+    return barco
+
+
+# ========== DIFERENCIA ==========
+
+def _cambios(anterior, nuevo):
+    return {campo: valor for campo, valor_anterior, valor in zip(CAMPOS, anterior, nuevo) if valor_anterior != valor}
+
+
+def diferenciar(origen, destino):
+    """ConjuntoCambios que convierte origen en destino, en tiempo lineal"""
+    
+    if isinstance(origen, FlotaEmpaquetada) and isinstance(destino, FlotaEmpaquetada):
+        cambios = _diferenciar_columnas(origen, destino)
+        if cambios is not None:
+            return cambios
+    
+    return diferenciar_estados(estados(origen), estados(destino))
+
+
+def diferenciar_estados(estados_origen, estados_destino):
+    """Diferencia entre dos diccionarios nombre -> tupla de estado"""
+    
+    altas = {}
+    modificaciones = {}
+    bajas = [nombre for nombre in estados_origen if nombre not in estados_destino]
+    
+    for nombre, estado in estados_destino.items():
+        anterior = estados_origen.get(nombre)
+        if anterior == estado:
+            continue
+        if anterior is None or anterior[0] != estado[0]:
+            # Un barco que cambia de tipo se da de baja y se vuelve a crear
+            if anterior is not None:
+                bajas.append(nombre)
+            altas[nombre] = dict(zip(CAMPOS, estado))
+        else:
+            modificaciones[nombre] = _cambios(anterior, estado)
+    
+    return ConjuntoCambios(altas, bajas, modificaciones)
+
+
+def _diferenciar_columnas(origen, destino):
+    """
+    Camino rápido para flotas empaquetadas con los mismos nombres en el mismo orden: compara
+    columna a columna con NumPy y solo lee las filas distintas. None si no es aplicable.
+    """
+    
+    from .consultas import _cargar_numpy
+    
+    np = _cargar_numpy()
+    if np is None or len(origen) != len(destino):
+        return None
+    if bytes(origen._nombres) != bytes(destino._nombres):
+        return None
+    if origen.get_columna("fin_nombre").tobytes() != destino.get_columna("fin_nombre").tobytes():
+        return None
+    
+    def columna(flota, campo):
+        valores = flota.get_columna(campo)
+        return np.frombuffer(memoryview(valores).cast("B"), dtype=valores.typecode)
+    
+    distintas = np.zeros(len(origen), dtype=bool)
+    for campo in CAMPOS:
+        a, b = columna(origen, campo), columna(destino, campo)
+        if campo in ("rumbo", "patron"):
+            # Los códigos de origen se traducen a la tabla de destino; -1 si el texto no existe allí
+            tabla_origen = origen.get_rumbos() if campo == "rumbo" else origen.get_patrones()
+            tabla_destino = destino.get_rumbos() if campo == "rumbo" else destino.get_patrones()
+            indices = {texto: codigo for codigo, texto in enumerate(tabla_destino)}
+            traduccion = np.array([indices.get(texto, -1) for texto in tabla_origen], dtype=np.int64)
+            a = traduccion[a] if len(traduccion) else a
+        distintas |= a != b
+    
+    filas = np.flatnonzero(distintas).tolist()
+    if not filas:
+        return ConjuntoCambios()
+    
+    altas = {}
+    bajas = []
+    modificaciones = {}
+    for fila in filas:
+        nombre = origen.get_nombre(fila)
+        anterior, nuevo = _estado_fila(origen, fila), _estado_fila(destino, fila)
+        if anterior[0] != nuevo[0]:
+            bajas.append(nombre)
+            altas[nombre] = dict(zip(CAMPOS, nuevo))
+        else:
+            modificaciones[nombre] = _cambios(anterior, nuevo)
+    return ConjuntoCambios(altas, bajas, modificaciones)
+
+
+def _estado_fila(flota, fila):
+    valores = [flota.get_columna(campo)[fila] for campo in CAMPOS]
+    valores[0] = _TIPOS.get(valores[0])
+    valores[2] = bool(valores[2])
+    valores[3] = _numero(valores[3])
+    valores[4] = flota._rumbos[valores[4]]
+    valores[5] = flota._patrones[valores[5]]
+    valores[9] = _numero(valores[9])
+    return tuple(valores)
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=1_000_000, proporcion_cambios=0.01, num_objetos=100_000):
+    """Diferencia por columnas y por estados frente a comparar __str__ barco a barco"""
+    
+    import random
+    
+    generador = random.Random(1)
+    
+    # Flotas empaquetadas: el destino cambia rumbo, patrón o combustible en una fracción de las filas
+    nombres = [f"Diferencia {i}" for i in range(num_barcos)]
+    origen = FlotaEmpaquetada.uniforme(nombres, TIPO_LANCHA, 4, num_motores=2, combustible=40)
+    destino = FlotaEmpaquetada.uniforme(nombres, TIPO_LANCHA, 4, num_motores=2, combustible=40)
+    destino._rumbos.append("norte")
+    destino._patrones.append("Patrón D")
+    cambiadas = generador.sample(range(num_barcos), int(num_barcos * proporcion_cambios))
+    for fila in cambiadas:
+        destino.get_columna("navegando")[fila] = 1
+        destino.get_columna("rumbo")[fila] = 1
+        destino.get_columna("patron")[fila] = 1
+        destino.get_columna("combustible")[fila] = 30
+    
+    inicio = time.perf_counter()
+    cambios = diferenciar(origen, destino)
+    columnas = time.perf_counter() - inicio
+    assert len(cambios.get_modificaciones()) == len(cambiadas)
+    
+    inicio = time.perf_counter()
+    por_estados = diferenciar_estados(estados(origen), estados(destino))
+    tuplas = time.perf_counter() - inicio
+    assert por_estados.get_modificaciones() == cambios.get_modificaciones()
+    
+    # Objetos: una copia de la flota modificada y parcheada de vuelta
+    barcos = [Lancha(f"Parche {i}", 4, 2, 40) for i in range(num_objetos)]
+    copia = ConjuntoCambios({barco._nombre: dict(zip(CAMPOS, estado_barco(barco))) for barco in barcos}).aplicar([])
+    for i in generador.sample(range(num_objetos), int(num_objetos * proporcion_cambios)):
+        barcos[i].iniciar_navegacion(20, "norte", "Patrón D", 2)
+    
+    inicio = time.perf_counter()
+    textos = {barco._nombre: str(barco) for barco in copia.values()}
+    distintos_str = [barco._nombre for barco in barcos if textos[barco._nombre] != str(barco)]
+    comparacion_str = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    parche = diferenciar(copia.values(), barcos)
+    objetos = time.perf_counter() - inicio
+    
+    parche.aplicar(copia)
+    assert diferenciar(copia.values(), barcos).get_modificaciones() == {}
+    assert len(parche.get_modificaciones()) == len(distintos_str)
+    
+    inicio = time.perf_counter()
+    huellas(barcos)
+    tiempo_huellas = time.perf_counter() - inicio
+    
+    for barco in barcos:
+        if barco.is_navegando():
+            barco.parar_navegacion(0)
+    for barco in copia.values():
+        if barco._navegando:
+            barco.parar_navegacion(0)
+    
+    print(f"{num_barcos} barcos empaquetados, {len(cambiadas)} cambiados: por columnas {columnas * 1000:.1f} ms, "
+          f"por estados {tuplas * 1000:.1f} ms")
+    print(f"{num_objetos} objetos: __str__ {comparacion_str * 1000:.1f} ms, diferencia {objetos * 1000:.1f} ms, "
+          f"huellas {tiempo_huellas * 1000:.1f} ms")
+    return columnas, tuplas, objetos
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,356 @@
+"""
+Clase Embarcacion (abstracta)
+Clase base para todas las embarcaciones del puerto deportivo
+"""
+
+from abc import ABC, abstractmethod
+from .i_navegable import INavegable
+from .registro import RegistroEmbarcaciones
+from .simbolos import TablaSimbolos
+
+
+class Embarcacion(INavegable, ABC):
+    """Clase abstracta base para todas las embarcaciones"""
+    
+    # Constantes públicas
+    PATRON_POR_DEFECTO = "Sin patrón"
+    RUMBO_POR_DEFECTO = "Sin rumbo"
+    MIN_TRIPULANTES = 0
+    MAX_PATRONES = 1_000_000
+    
+    # Atributos de clase (privados)
+    _num_barcos = 0
+    _num_barcos_navegando = 0
+    _tiempo_total_navegacion_acumulado = 0.0
+    
+    # Instancias vivas (referencias débiles): _num_barcos cuenta las creadas
+    _registro = RegistroEmbarcaciones()
+    
+    # Oyentes notificados de los cambios de estado (ver OyenteEmbarcacion)
+    _oyentes = []
+    
+    # Códigos enteros de rumbos y patrones; _rumbo y _patron guardan la copia compartida de la tabla.
+    # Los rumbos se validan por tipo antes de internarlos; los patrones, libres, tienen un límite
+    _rumbos = TablaSimbolos([RUMBO_POR_DEFECTO])
+    _patrones = TablaSimbolos([PATRON_POR_DEFECTO], MAX_PATRONES)
+    CODIGO_POR_DEFECTO = 0
+    
+    def __init__(self, nombre, num_max_tripulantes):
+        """Constructor de Embarcacion"""
+        
+        # Validaciones
+        if nombre is None:
+            raise ValueError("El nombre de la embarcación es obligatorio.")
+        
+        if nombre.strip() == "":
+            raise ValueError("El nombre de la embarcación no puede estar vacío.")
+        
+        Embarcacion._validar_num_max_tripulantes(num_max_tripulantes)
+        
+        # Atributos constantes del objeto (privados)
+        self._nombre = nombre
+        self._num_max_tripulantes = num_max_tripulantes
+        
+        # Atributos de estado (protegidos para que las subclases puedan acceder)
+        self._navegando = False
+        self._velocidad = 0
+        self._patron = Embarcacion.PATRON_POR_DEFECTO
+        self._rumbo = Embarcacion.RUMBO_POR_DEFECTO
+        self._codigo_patron = Embarcacion.CODIGO_POR_DEFECTO
+        self._codigo_rumbo = Embarcacion.CODIGO_POR_DEFECTO
+        self._tripulacion = 0
+        self._tiempo_total_navegacion = 0.0
+        
+        # Actualizar atributos de clase
+        Embarcacion._num_barcos += 1
+        Embarcacion._registro.añadir(self)
+    
+    @staticmethod
+    def _validar_num_max_tripulantes(num_max_tripulantes):
+        if num_max_tripulantes < Embarcacion.MIN_TRIPULANTES:
+            raise ValueError(f"El número de tripulantes debe ser, como mínimo, {Embarcacion.MIN_TRIPULANTES}.")
+    
+    def __getstate__(self):
+        """Los códigos de rumbo y patrón son propios de cada proceso: viajan solo las cadenas"""
+        
+        estado = self.__dict__.copy()
+        estado.pop("_codigo_rumbo", None)
+        estado.pop("_codigo_patron", None)
+        return estado
+    
+    def __setstate__(self, estado):
+        """Al deserializar (pickle, copy) la embarcación también se registra como viva"""
+        
+        self.__dict__.update(estado)
+        self._codigo_rumbo, self._rumbo = Embarcacion._rumbos.internar(self._rumbo)
+        self._codigo_patron, self._patron = Embarcacion._patrones.internar(self._patron)
+        Embarcacion._registro.añadir(self)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_nombre_barco(self):
+        return self._nombre
+    
+    def get_num_max_tripulantes(self):
+        return self._num_max_tripulantes
+    
+    def is_navegando(self):
+        return self._navegando
+    
+    def get_velocidad(self):
+        return self._velocidad
+    
+    def get_rumbo(self):
+        return self._rumbo
+    
+    def get_patron(self):
+        return self._patron
+    
+    def get_codigo_rumbo(self):
+        return self._codigo_rumbo
+    
+    def get_codigo_patron(self):
+        return self._codigo_patron
+    
+    def get_tripulacion(self):
+        return self._tripulacion
+    
+    def get_tiempo_total_navegacion(self):
+        return self._tiempo_total_navegacion
+    
+    # ========== MÉTODOS DE CLASE ==========
+    
+    @classmethod
+    def get_num_barcos(cls):
+        return cls._num_barcos
+    
+    @classmethod
+    def get_num_barcos_navegando(cls):
+        return cls._num_barcos_navegando
+    
+    @classmethod
+    def get_tiempo_total_navegacion_acumulado(cls):
+        return cls._tiempo_total_navegacion_acumulado
+    
+    @classmethod
+    def get_tabla_rumbos(cls):
+        return Embarcacion._rumbos
+    
+    @classmethod
+    def get_tabla_patrones(cls):
+        return Embarcacion._patrones
+    
+    @classmethod
+    def get_num_barcos_vivos(cls):
+        """Embarcaciones de esta clase (o subclases) que siguen existiendo"""
+        return Embarcacion._registro.num_vivos(cls)
+    
+    @classmethod
+    def barcos_vivos(cls):
+        """Recorre las embarcaciones vivas de esta clase (o subclases)"""
+        return Embarcacion._registro.iterar(cls)
+    
+    # ========== CREACIÓN EN LOTE ==========
+    
+    @classmethod
+    def _crear_lote(cls, nombres, atributos):
+        """Crea instancias de cls sin pasar por el constructor (los parámetros ya vienen validados)"""
+        
+        plantilla = {
+            "_nombre": None,
+            "_num_max_tripulantes": atributos.pop("_num_max_tripulantes"),
+            "_navegando": False,
+            "_velocidad": 0,
+            "_patron": Embarcacion.PATRON_POR_DEFECTO,
+            "_rumbo": Embarcacion.RUMBO_POR_DEFECTO,
+            "_codigo_patron": Embarcacion.CODIGO_POR_DEFECTO,
+            "_codigo_rumbo": Embarcacion.CODIGO_POR_DEFECTO,
+            "_tripulacion": 0,
+            "_tiempo_total_navegacion": 0.0,
+        }
+        plantilla.update(atributos)
+        
+        # Cada barco recibe una copia de la plantilla como diccionario de atributos
+        nuevo = object.__new__
+        copiar = plantilla.copy
+        barcos = []
+        for nombre in nombres:
+            barco = nuevo(cls)
+            estado = copiar()
+            estado["_nombre"] = nombre
+            barco.__dict__ = estado
+            barcos.append(barco)
+        
+        # Contadores y registro una vez por lote
+        Embarcacion._num_barcos += len(barcos)
+        Embarcacion._registro.añadir_lote(cls, barcos)
+        
+        if Embarcacion._oyentes:
+            for barco in barcos:
+                barco._notificar("al_crear")
+        
+        return barcos
+    
+    @staticmethod
+    def _nombres_lote(prefijo, primero, cantidad):
+        """Nombres "prefijo n" para los valores de contador primero .. primero + cantidad - 1"""
+        
+        if prefijo is None or prefijo.strip() == "":
+            raise ValueError("El nombre de la embarcación no puede estar vacío.")
+        
+        prefijo = prefijo + " "
+        return [prefijo + str(numero) for numero in range(primero, primero + cantidad)]
+    
+    # ========== OYENTES ==========
+    
+    @classmethod
+    def registrar_oyente(cls, oyente):
+        """Registra un oyente de cambios de estado de todas las embarcaciones"""
+        
+        if oyente is None:
+            raise ValueError("El oyente a registrar no existe.")
+        
+        if oyente not in Embarcacion._oyentes:
+            Embarcacion._oyentes.append(oyente)
+    
+    @classmethod
+    def eliminar_oyente(cls, oyente):
+        """Deja de notificar a un oyente"""
+        
+        if oyente in Embarcacion._oyentes:
+            Embarcacion._oyentes.remove(oyente)
+    
+    def _notificar(self, evento, *argumentos):
+        """Avisa a los oyentes registrados (los llamadores comprueban antes si hay alguno)"""
+        
+        for oyente in list(Embarcacion._oyentes):
+            getattr(oyente, evento)(self, *argumentos)
+    
+    # ========== MÉTODOS DE MODIFICACIÓN ==========
+    
+    def set_rumbo(self, rumbo):
+        """Cambia el rumbo de la embarcación mientras navega"""
+        
+        if not self._navegando:
+            raise Exception(f"La embarcación {self._nombre} no está navegando, no se puede cambiar el rumbo.")
+        
+        codigo_rumbo = Embarcacion._rumbos.buscar(rumbo)
+        if codigo_rumbo == self._codigo_rumbo:
+            raise Exception(
+                f"La embarcación {self._nombre} ya está navegando con ese rumbo ({self._rumbo}), "
+                "debes indicar un rumbo distinto para poder modificarlo."
+            )
+        
+        # Si todo está bien, actualizar rumbo
+        rumbo_anterior = self._rumbo
+        self._codigo_rumbo, self._rumbo = Embarcacion._rumbos.internar(rumbo)
+        
+        if Embarcacion._oyentes:
+            self._notificar("al_cambiar_rumbo", rumbo_anterior)
+    
+    # ========== MÉTODOS DE NAVEGACIÓN (de la interfaz INavegable) ==========
+    
+    def iniciar_navegacion(self, velocidad, rumbo, patron, num_tripulantes):
+        """Inicia la navegación de la embarcación"""
+        
+        self._validar_salida(velocidad, rumbo, patron, num_tripulantes)
+        
+        # Actualizar atributos
+        self._navegando = True
+        self._velocidad = velocidad
+        self._codigo_rumbo, self._rumbo = Embarcacion._rumbos.internar(rumbo)
+        self._codigo_patron, self._patron = Embarcacion._patrones.internar(patron)
+        self._tripulacion = num_tripulantes
+        
+        # Actualizar contador de clase
+        Embarcacion._num_barcos_navegando += 1
+        
+        if Embarcacion._oyentes:
+            self._notificar("al_iniciar_navegacion")
+    
+    def _validar_salida(self, velocidad, rumbo, patron, num_tripulantes):
+        """Comprueba que la embarcación puede salir con esos datos (las subclases añaden sus validaciones)"""
+        
+        # Validaciones
+        if self._navegando:
+            raise Exception(f"La embarcación {self._nombre} ya está navegando y se encuentra fuera de puerto.")
+        
+        if rumbo is None or rumbo.strip() == "":
+            raise ValueError("Debes indicar el rumbo para iniciar la navegación.")
+        
+        if patron is None or patron.strip() == "":
+            raise ValueError("El patrón de la embarcación no puede estar vacío, se necesita un patrón para iniciar la navegación.")
+        
+        if not Embarcacion._patrones.admite(patron):
+            raise ValueError(f"No se admiten más de {Embarcacion.MAX_PATRONES} patrones distintos.")
+        
+        if num_tripulantes < Embarcacion.MIN_TRIPULANTES or num_tripulantes > self._num_max_tripulantes:
+            raise ValueError(
+                f"El número de tripulantes debe estar entre {Embarcacion.MIN_TRIPULANTES} y {self._num_max_tripulantes}."
+            )
+    
+    def parar_navegacion(self, tiempo_navegando):
+        """Detiene la navegación de la embarcación"""
+        
+        # Validaciones
+        if not self._navegando:
+            raise Exception(f"La embarcación {self._nombre} no está navegando.")
+        
+        if tiempo_navegando < 0:
+            raise ValueError("Tiempo navegando incorrecto, debe ser mayor que cero.")
+        
+        # Consumo de combustible (solo las embarcaciones a motor lo gastan)
+        combustible_consumido = self._consumir_combustible(tiempo_navegando)
+        
+        # Actualizar tiempos
+        self._tiempo_total_navegacion += tiempo_navegando
+        Embarcacion._tiempo_total_navegacion_acumulado += tiempo_navegando
+        
+        # Estado de la navegación que termina (para los oyentes)
+        velocidad, rumbo, patron, tripulacion = self._velocidad, self._rumbo, self._patron, self._tripulacion
+        
+        # Resetear estado de navegación
+        self._navegando = False
+        self._velocidad = 0
+        self._rumbo = Embarcacion.RUMBO_POR_DEFECTO
+        self._patron = Embarcacion.PATRON_POR_DEFECTO
+        self._codigo_rumbo = Embarcacion.CODIGO_POR_DEFECTO
+        self._codigo_patron = Embarcacion.CODIGO_POR_DEFECTO
+        self._tripulacion = 0
+        
+        # Actualizar contador de clase
+        Embarcacion._num_barcos_navegando -= 1
+        
+        if Embarcacion._oyentes:
+            self._notificar(
+                "al_parar_navegacion", tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido
+            )
+    
+    def _consumir_combustible(self, tiempo_navegando):
+        """Descuenta el combustible gastado en la navegación y devuelve la cantidad consumida"""
+        return 0
+    
+    # ========== MÉTODO ABSTRACTO ==========
+    
+    @abstractmethod
+    def señalizar(self):
+        """Método abstracto para la señalización"""
+        pass
+    
+    # ========== MÉTODO __str__ ==========
+    
+    def __str__(self):
+        """Representación en cadena de la embarcación"""
+        
+        resultado = f"Nombre de la embarcación: {self._nombre}, "
+        resultado += f"Tripulación: {self._tripulacion}, "
+        
+        if self._navegando:
+            resultado += "Navegando: Sí, "
+            resultado += f"con el patrón {self._patron} en {self._rumbo} a {self._velocidad} nudos, "
+        else:
+            resultado += "Navegando: No, "
+        
+        resultado += f"Tiempo total de navegación de la embarcación: {self._tiempo_total_navegacion:.2f} horas"
+        
+        return resultado
\ No newline at end of file
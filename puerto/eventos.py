@@ -0,0 +1,272 @@
+"""
+Bus de eventos de la flota
+Traduce los cambios de estado de las embarcaciones en eventos tipados y los entrega a los
+suscriptores en lotes agrupados: en cada vaciado, solo el último evento de cada barco
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .oyente_embarcacion import OyenteEmbarcacion
+
+
+class EventoEmbarcacion:
+    """Último cambio de la embarcación y su estado en el momento de la entrega"""
+    
+    __slots__ = ("barco", "nombre", "instante", "navegando", "velocidad", "rumbo", "patron", "tripulacion", "combustible")
+    
+    def __init__(self, barco, instante):
+        """Constructor de EventoEmbarcacion"""
+        
+        self.barco = barco
+        self.nombre = barco._nombre
+        self.instante = instante
+        self.navegando = barco._navegando
+        self.velocidad = barco._velocidad
+        self.rumbo = barco._rumbo
+        self.patron = barco._patron
+        self.tripulacion = barco._tripulacion
+        self.combustible = barco._cantidad_combustible if isinstance(barco, Lancha) else None
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.nombre}, navegando={self.navegando}, rumbo={self.rumbo})"
+
+
+class EventoCreacion(EventoEmbarcacion):
+    __slots__ = ()
+
+
+class EventoSalida(EventoEmbarcacion):
+    __slots__ = ()
+
+
+class EventoCambioRumbo(EventoEmbarcacion):
+    __slots__ = ("rumbo_anterior",)
+
+
+class EventoLlegada(EventoEmbarcacion):
+    __slots__ = ("horas", "combustible_consumido")
+
+
+class EventoRepostaje(EventoEmbarcacion):
+    __slots__ = ("cantidad",)
+
+
+class BusEventos(OyenteEmbarcacion):
+    """Publica los cambios de estado a los suscriptores (modo síncrono, hilos o asyncio)"""
+    
+    SINCRONO = "sincrono"
+    HILOS = "hilos"
+    ASYNCIO = "asyncio"
+    
+    def __init__(self, modo="sincrono", num_hilos=4, bucle=None, max_pendientes=10_000, reloj=None):
+        """Constructor de BusEventos (bucle: event loop de asyncio en el que entregar, en modo asyncio)"""
+        
+        # Validaciones
+        if modo not in (BusEventos.SINCRONO, BusEventos.HILOS, BusEventos.ASYNCIO):
+            raise ValueError(f"Modo de entrega desconocido: {modo}.")
+        
+        if modo == BusEventos.ASYNCIO and bucle is None:
+            raise ValueError("El modo asyncio necesita el bucle de eventos en el que entregar.")
+        
+        if max_pendientes < 1:
+            raise ValueError("El número máximo de eventos pendientes debe ser mayor que cero.")
+        
+        self._modo = modo
+        self._bucle = bucle
+        self._hilos = ThreadPoolExecutor(max_workers=num_hilos) if modo == BusEventos.HILOS else None
+        self._max_pendientes = max_pendientes
+        self._reloj = reloj if reloj is not None else time.time
+        
+        # (función, tipos aceptados o None para todos)
+        self._suscriptores = []
+        
+        # id(barco) -> (clase de evento, barco, instante, datos propios del evento) del último cambio
+        self._pendientes = {}
+        self._num_publicados = 0
+        self._num_entregados = 0
+        
+        # Fallos de los suscriptores, que nunca se propagan (en hilos y asyncio se anotan al terminar la entrega)
+        self._cerrojo_errores = threading.Lock()
+        self._num_errores = 0
+        self._ultimo_error = None
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_publicados(self):
+        return self._num_publicados
+    
+    def get_num_entregados(self):
+        return self._num_entregados
+    
+    def get_num_pendientes(self):
+        return len(self._pendientes)
+    
+    def get_num_errores(self):
+        return self._num_errores
+    
+    def get_ultimo_error(self):
+        return self._ultimo_error
+    
+    # ========== SUSCRIPCIONES ==========
+    
+    def suscribir(self, funcion, tipos=None):
+        """funcion(eventos) recibe una lista con el último evento de cada barco; tipos filtra por clase"""
+        
+        if funcion is None:
+            raise ValueError("El suscriptor no existe.")
+        
+        tipos = tuple(tipos) if tipos is not None else None
+        self._suscriptores.append((funcion, tipos))
+        
+        # El bus solo escucha a las embarcaciones mientras tenga suscriptores
+        if len(self._suscriptores) == 1:
+            Embarcacion.registrar_oyente(self)
+    
+    def cancelar(self, funcion):
+        self._suscriptores = [(otra, tipos) for otra, tipos in self._suscriptores if otra is not funcion]
+        if not self._suscriptores:
+            Embarcacion.eliminar_oyente(self)
+    
+    def cerrar(self):
+        """Entrega lo pendiente, se da de baja y libera los hilos"""
+        
+        self.vaciar()
+        self._suscriptores = []
+        Embarcacion.eliminar_oyente(self)
+        if self._hilos is not None:
+            self._hilos.shutdown(wait=True)
+            self._hilos = None
+    
+    # ========== PUBLICACIÓN ==========
+    
+    def publicar(self, clase, barco, *extras):
+        """
+        Anota el cambio; sustituye al anterior del mismo barco si aún no se ha entregado.
+        El evento se construye al vaciar, con el estado que el barco tenga entonces.
+        """
+        
+        self._pendientes[id(barco)] = (clase, barco, self._reloj(), extras)
+        self._num_publicados += 1
+        if len(self._pendientes) >= self._max_pendientes:
+            self.vaciar()
+    
+    def al_crear(self, barco):
+        self.publicar(EventoCreacion, barco)
+    
+    def al_iniciar_navegacion(self, barco):
+        self.publicar(EventoSalida, barco)
+    
+    def al_cambiar_rumbo(self, barco, rumbo_anterior):
+        self.publicar(EventoCambioRumbo, barco, rumbo_anterior)
+    
+    def al_parar_navegacion(self, barco, tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido):
+        self.publicar(EventoLlegada, barco, tiempo_navegando, combustible_consumido)
+    
+    def al_repostar(self, barco, cantidad):
+        self.publicar(EventoRepostaje, barco, cantidad)
+    
+    # ========== ENTREGA ==========
+    
+    def vaciar(self):
+        """Entrega a cada suscriptor el lote agrupado y devuelve el número de eventos del lote"""
+        
+        if not self._pendientes:
+            return 0
+        
+        # Se cambia el diccionario antes de entregar: lo que se publique durante la entrega va al siguiente lote
+        pendientes = self._pendientes
+        self._pendientes = {}
+        
+        lote = []
+        for clase, barco, instante, extras in pendientes.values():
+            evento = clase(barco, instante)
+            for nombre, valor in zip(clase.__slots__, extras):
+                setattr(evento, nombre, valor)
+            lote.append(evento)
+        
+        for funcion, tipos in list(self._suscriptores):
+            eventos = lote if tipos is None else [evento for evento in lote if isinstance(evento, tipos)]
+            if eventos:
+                self._entregar(funcion, eventos)
+        
+        self._num_entregados += len(lote)
+        return len(lote)
+    
+    def _entregar(self, funcion, eventos):
+        if self._modo == BusEventos.SINCRONO:
+            # Un suscriptor que falla no impide la entrega a los demás ni llega al método del
+            # modelo que provocó el vaciado: queda anotado en get_num_errores/get_ultimo_error
+            try:
+                funcion(eventos)
+            except Exception as e:
+                self._anotar_error(e)
+        elif self._modo == BusEventos.HILOS:
+            self._hilos.submit(funcion, eventos).add_done_callback(self._al_terminar)
+        elif inspect.iscoroutinefunction(funcion):
+            asyncio.run_coroutine_threadsafe(funcion(eventos), self._bucle).add_done_callback(self._al_terminar)
+        else:
+            self._bucle.call_soon_threadsafe(self._llamar_en_bucle, funcion, eventos)
+    
+    def _llamar_en_bucle(self, funcion, eventos):
+        # El bucle también informa de la excepción con su manejador habitual
+        try:
+            funcion(eventos)
+        except Exception as e:
+            self._anotar_error(e)
+            raise
+    
+    def _al_terminar(self, futuro):
+        if not futuro.cancelled() and futuro.exception() is not None:
+            self._anotar_error(futuro.exception())
+    
+    def _anotar_error(self, excepcion):
+        with self._cerrojo_errores:
+            self._num_errores += 1
+            self._ultimo_error = excepcion
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=2_000, num_ciclos=20):
+    """Coste de publicar sin suscriptores, con suscriptor síncrono y agrupación por vaciado"""
+    
+    from .velero import Velero
+    
+    veleros = [Velero(f"Evento {i}", 2, 4) for i in range(num_barcos)]
+    
+    def jornada():
+        inicio = time.perf_counter()
+        for _ in range(num_ciclos):
+            for velero in veleros:
+                velero.iniciar_navegacion(10, "ceñida", "Bus", 2)
+                velero.set_rumbo("empopada")
+                velero.parar_navegacion(0.5)
+        return time.perf_counter() - inicio
+    
+    sin_bus = jornada()
+    
+    # Un bus sin suscriptores no está registrado como oyente: coste nulo
+    bus = BusEventos()
+    sin_suscriptores = jornada()
+    
+    recibidos = []
+    bus.suscribir(recibidos.extend)
+    con_suscriptor = jornada()
+    bus.vaciar()
+    bus.cerrar()
+    
+    operaciones = num_barcos * num_ciclos * 3
+    print(f"{operaciones} operaciones: sin bus {sin_bus * 1000:.1f} ms, bus sin suscriptores "
+          f"{sin_suscriptores * 1000:.1f} ms, con suscriptor {con_suscriptor * 1000:.1f} ms; "
+          f"{bus.get_num_publicados()} eventos publicados, {len(recibidos)} entregados tras agrupar")
+    return sin_suscriptores / sin_bus
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
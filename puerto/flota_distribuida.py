@@ -0,0 +1,398 @@
+"""
+Flota distribuida en varios procesos
+Reparte las embarcaciones entre procesos trabajadores (por marina o por hash del nombre)
+y les envía los comandos de navegación por lotes
+"""
+
+import multiprocessing
+import time
+import zlib
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+# ========== PROCESO TRABAJADOR ==========
+
+def _reiniciar_contadores():
+    """Cada trabajador empieza con sus contadores de clase a cero"""
+    Embarcacion._num_barcos = 0
+    Embarcacion._num_barcos_navegando = 0
+    Embarcacion._tiempo_total_navegacion_acumulado = 0.0
+    Lancha._num_lanchas = 0
+    Velero._num_veleros = 0
+
+
+def _contadores_locales():
+    return (
+        Embarcacion.get_num_barcos(),
+        Embarcacion.get_num_barcos_navegando(),
+        Embarcacion.get_tiempo_total_navegacion_acumulado(),
+        Lancha.get_num_lanchas(),
+        Velero.get_num_veleros(),
+    )
+
+
+def _estado(barco):
+    """Estado de un barco en forma de tupla serializable"""
+    return (
+        barco._nombre,
+        barco._navegando,
+        barco._velocidad,
+        barco._rumbo,
+        barco._patron,
+        barco._tripulacion,
+        barco._tiempo_total_navegacion,
+        getattr(barco, "_num_mastiles", None),
+    )
+
+
+class _VeleroRemoto:
+    """Vista mínima de un velero de otro fragmento, suficiente para iniciar_regata"""
+    
+    def __init__(self, estado):
+        self._nombre, self._navegando, self._velocidad, self._rumbo, _, _, _, self._num_mastiles = estado
+        self._codigo_rumbo = Embarcacion._rumbos.codigo(self._rumbo)
+
+
+def _ejecutar(barcos, comando):
+    """Aplica un comando sobre los barcos del trabajador"""
+    
+    operacion = comando[0]
+    
+    if operacion == "iniciar_navegacion":
+        _, nombre, velocidad, rumbo, patron, num_tripulantes = comando
+        return barcos[nombre].iniciar_navegacion(velocidad, rumbo, patron, num_tripulantes)
+    
+    if operacion == "parar_navegacion":
+        return barcos[comando[1]].parar_navegacion(comando[2])
+    
+    if operacion == "set_rumbo":
+        return barcos[comando[1]].set_rumbo(comando[2])
+    
+    if operacion == "iniciar_regata":
+        _, nombre, otro = comando
+        otro_barco = barcos[otro] if isinstance(otro, str) else _VeleroRemoto(otro)
+        return barcos[nombre].iniciar_regata(otro_barco)
+    
+    if operacion == "repostar":
+        return barcos[comando[1]].repostar(comando[2])
+    
+    if operacion == "crear_lancha":
+        _, nombre, num_max_tripulantes, num_motores, nivel_combustible = comando
+        barcos[nombre] = Lancha(nombre, num_max_tripulantes, num_motores, nivel_combustible)
+        return None
+    
+    if operacion == "crear_velero":
+        _, nombre, num_mastiles, num_max_tripulantes = comando
+        barcos[nombre] = Velero(nombre, num_mastiles, num_max_tripulantes)
+        return None
+    
+    if operacion == "estado":
+        return _estado(barcos[comando[1]])
+    
+    if operacion == "contadores":
+        return _contadores_locales()
+    
+    raise ValueError(f"Comando desconocido: {operacion}.")
+
+
+def _trabajador(conexion):
+    """Bucle del proceso trabajador: recibe lotes de comandos y devuelve un estado por comando"""
+    
+    _reiniciar_contadores()
+    barcos = {}
+    
+    while True:
+        lote = conexion.recv()
+        if lote is None:
+            break
+        
+        resultados = []
+        for comando in lote:
+            try:
+                resultados.append((True, _ejecutar(barcos, comando)))
+            except KeyError as e:
+                resultados.append((False, f"La embarcación {e.args[0]} no existe."))
+            except Exception as e:
+                resultados.append((False, str(e)))
+        
+        conexion.send(resultados)
+    
+    conexion.close()
+
+
+# ========== COORDINADOR ==========
+
+class FlotaDistribuida:
+    """Coordinador de una flota repartida entre procesos trabajadores"""
+    
+    PARTICION_HASH = "hash"
+    PARTICION_MARINA = "marina"
+    
+    def __init__(self, num_trabajadores=None, particion="hash", contexto=None):
+        """Constructor de FlotaDistribuida"""
+        
+        if num_trabajadores is None:
+            num_trabajadores = multiprocessing.cpu_count()
+        
+        # Validaciones
+        if num_trabajadores < 1:
+            raise ValueError("Se necesita al menos un proceso trabajador.")
+        
+        if particion not in (FlotaDistribuida.PARTICION_HASH, FlotaDistribuida.PARTICION_MARINA):
+            raise ValueError("La partición debe ser por hash del nombre o por marina.")
+        
+        contexto = contexto if contexto is not None else multiprocessing.get_context()
+        
+        self._particion = particion
+        self._conexiones = []
+        self._procesos = []
+        for _ in range(num_trabajadores):
+            extremo_local, extremo_remoto = contexto.Pipe()
+            proceso = contexto.Process(target=_trabajador, args=(extremo_remoto,), daemon=True)
+            proceso.start()
+            extremo_remoto.close()
+            self._conexiones.append(extremo_local)
+            self._procesos.append(proceso)
+        
+        # Fragmento de cada barco, altas aún sin confirmar, marinas asignadas y lotes pendientes
+        self._fragmento_de = {}
+        self._reservados = {}
+        self._fragmento_de_marina = {}
+        self._pendientes = [[] for _ in range(num_trabajadores)]
+        self._orden = []
+        self._resultados_previos = []
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_trabajadores(self):
+        return len(self._procesos)
+    
+    def get_num_barcos(self):
+        return len(self._fragmento_de)
+    
+    def get_fragmento(self, nombre):
+        return self._fragmento_existente(nombre)
+    
+    # ========== PARTICIÓN ==========
+    
+    def _elegir_fragmento(self, nombre, marina):
+        if self._particion == FlotaDistribuida.PARTICION_MARINA:
+            if marina is None:
+                raise ValueError("Con partición por marina hay que indicar la marina de cada embarcación.")
+            
+            # Cada marina nueva va al fragmento con menos marinas asignadas
+            if marina not in self._fragmento_de_marina:
+                cargas = [0] * len(self._procesos)
+                for fragmento in self._fragmento_de_marina.values():
+                    cargas[fragmento] += 1
+                self._fragmento_de_marina[marina] = cargas.index(min(cargas))
+            return self._fragmento_de_marina[marina]
+        
+        # Hash estable entre procesos (hash() de str varía en cada proceso)
+        return zlib.crc32(nombre.encode("utf-8")) % len(self._procesos)
+    
+    # ========== ENCOLADO DE COMANDOS ==========
+    
+    def _encolar(self, fragmento, comando, alta=None):
+        """alta: nombre del barco si el comando lo crea (se confirma al recibir la respuesta)"""
+        self._pendientes[fragmento].append(comando)
+        self._orden.append((fragmento, alta))
+    
+    def _fragmento_existente(self, nombre):
+        # Un barco con el alta encolada ya admite comandos: van al mismo lote, detrás de la creación
+        fragmento = self._fragmento_de.get(nombre, self._reservados.get(nombre))
+        if fragmento is None:
+            raise ValueError(f"La embarcación {nombre} no existe en la flota.")
+        return fragmento
+    
+    def _reservar(self, nombre, marina):
+        if nombre in self._fragmento_de or nombre in self._reservados:
+            raise ValueError(f"Ya existe una embarcación llamada {nombre}.")
+        
+        fragmento = self._elegir_fragmento(nombre, marina)
+        self._reservados[nombre] = fragmento
+        return fragmento
+    
+    def crear_lancha(self, nombre, num_max_tripulantes, num_motores, nivel_combustible, marina=None):
+        """Encola la creación de una lancha en su fragmento"""
+        
+        fragmento = self._reservar(nombre, marina)
+        self._encolar(fragmento, ("crear_lancha", nombre, num_max_tripulantes, num_motores, nivel_combustible), nombre)
+    
+    def crear_velero(self, nombre, num_mastiles, num_max_tripulantes, marina=None):
+        """Encola la creación de un velero en su fragmento"""
+        
+        fragmento = self._reservar(nombre, marina)
+        self._encolar(fragmento, ("crear_velero", nombre, num_mastiles, num_max_tripulantes), nombre)
+    
+    def iniciar_navegacion(self, nombre, velocidad, rumbo, patron, num_tripulantes):
+        self._encolar(
+            self._fragmento_existente(nombre),
+            ("iniciar_navegacion", nombre, velocidad, rumbo, patron, num_tripulantes),
+        )
+    
+    def parar_navegacion(self, nombre, tiempo_navegando):
+        self._encolar(self._fragmento_existente(nombre), ("parar_navegacion", nombre, tiempo_navegando))
+    
+    def set_rumbo(self, nombre, rumbo):
+        self._encolar(self._fragmento_existente(nombre), ("set_rumbo", nombre, rumbo))
+    
+    def repostar(self, nombre, cantidad=None):
+        self._encolar(self._fragmento_existente(nombre), ("repostar", nombre, cantidad))
+    
+    def iniciar_regata(self, nombre, otro_nombre):
+        """Encola una regata; si el rival vive en otro fragmento se envía su estado actual"""
+        
+        fragmento = self._fragmento_existente(nombre)
+        fragmento_otro = self._fragmento_existente(otro_nombre)
+        
+        if fragmento == fragmento_otro:
+            self._encolar(fragmento, ("iniciar_regata", nombre, otro_nombre))
+            return
+        
+        # El estado del rival debe reflejar los comandos ya encolados
+        self._resultados_previos.extend(self._enviar_pendientes())
+        estado_otro = self._consultar(fragmento_otro, ("estado", otro_nombre))
+        self._encolar(fragmento, ("iniciar_regata", nombre, estado_otro))
+    
+    # ========== EJECUCIÓN POR LOTES ==========
+    
+    def ejecutar(self):
+        """Envía un lote por fragmento y devuelve (ok, resultado) de cada comando en orden"""
+        
+        resultados = self._resultados_previos + self._enviar_pendientes()
+        self._resultados_previos = []
+        return resultados
+    
+    def _enviar_pendientes(self):
+        # Primero se envían todos los lotes para que los trabajadores avancen en paralelo
+        activos = []
+        for fragmento, lote in enumerate(self._pendientes):
+            if lote:
+                self._conexiones[fragmento].send(lote)
+                activos.append(fragmento)
+        
+        respuestas = {}
+        for fragmento in activos:
+            respuestas[fragmento] = iter(self._conexiones[fragmento].recv())
+        
+        # Las altas solo quedan registradas si el trabajador ha podido crear el barco
+        resultados = []
+        for fragmento, alta in self._orden:
+            resultado = next(respuestas[fragmento])
+            if alta is not None:
+                del self._reservados[alta]
+                if resultado[0]:
+                    self._fragmento_de[alta] = fragmento
+            resultados.append(resultado)
+        
+        self._pendientes = [[] for _ in self._procesos]
+        self._orden = []
+        return resultados
+    
+    def _consultar(self, fragmento, comando):
+        self._conexiones[fragmento].send([comando])
+        ok, valor = self._conexiones[fragmento].recv()[0]
+        if not ok:
+            raise Exception(valor)
+        return valor
+    
+    # ========== CONSULTAS ==========
+    
+    def estado(self, nombre):
+        """Estado actual de un barco (nombre, navegando, velocidad, rumbo, patrón, tripulación, horas, mástiles)"""
+        self._resultados_previos.extend(self._enviar_pendientes())
+        return self._consultar(self._fragmento_existente(nombre), ("estado", nombre))
+    
+    def contadores(self):
+        """Contadores de clase agregados de todos los fragmentos"""
+        
+        # Los contadores deben reflejar los comandos ya encolados
+        self._resultados_previos.extend(self._enviar_pendientes())
+        
+        for conexion in self._conexiones:
+            conexion.send([("contadores",)])
+        
+        total = [0, 0, 0.0, 0, 0]
+        for conexion in self._conexiones:
+            _, locales = conexion.recv()[0]
+            for i, valor in enumerate(locales):
+                total[i] += valor
+        
+        return {
+            "num_barcos": total[0],
+            "num_barcos_navegando": total[1],
+            "tiempo_total_navegacion_acumulado": total[2],
+            "num_lanchas": total[3],
+            "num_veleros": total[4],
+        }
+    
+    # ========== CIERRE ==========
+    
+    def cerrar(self):
+        """Detiene los trabajadores"""
+        
+        for conexion in self._conexiones:
+            try:
+                conexion.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conexion.close()
+        
+        for proceso in self._procesos:
+            proceso.join(timeout=5)
+        
+        self._conexiones = []
+        self._procesos = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=20_000, rondas=5, tam_lote=5_000, trabajadores=None):
+    """Mide comandos por segundo con distinto número de procesos trabajadores"""
+    
+    if trabajadores is None:
+        maximo = multiprocessing.cpu_count()
+        trabajadores = sorted({1, 2, 4, maximo} & set(range(1, maximo + 1)))
+    
+    resultados = []
+    for num_trabajadores in trabajadores:
+        with FlotaDistribuida(num_trabajadores) as flota:
+            nombres = [f"Bench {i}" for i in range(num_barcos)]
+            for nombre in nombres:
+                flota.crear_lancha(nombre, 4, 2, 50)
+            flota.ejecutar()
+            
+            num_comandos = 0
+            inicio = time.perf_counter()
+            for _ in range(rondas):
+                for desde in range(0, num_barcos, tam_lote):
+                    for nombre in nombres[desde:desde + tam_lote]:
+                        flota.iniciar_navegacion(nombre, 20, "norte", "Bench", 2)
+                        flota.set_rumbo(nombre, "sur")
+                        flota.parar_navegacion(nombre, 0.1)
+                    num_comandos += len(flota.ejecutar())
+            segundos = time.perf_counter() - inicio
+            
+            contadores = flota.contadores()
+        
+        resultados.append((num_trabajadores, num_comandos / segundos))
+        print(
+            f"{num_trabajadores:>3} trabajadores: {num_comandos / segundos:12.0f} comandos/s "
+            f"({contadores['num_barcos']} barcos, {contadores['tiempo_total_navegacion_acumulado']:.1f} h)"
+        )
+    
+    return resultados
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+Generador sintético de flotas y cargas de trabajo
+Produce flotas y secuencias de comandos válidas (salidas, cambios de rumbo, regatas, llegadas
+y repostajes) de forma determinista a partir de una semilla y sin guardarlas en memoria
+"""
+
+import json
+import random
+import time
+from array import array
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+MAX_TRIPULANTES_GENERADOS = 12
+
+# Pesos de cada tipo de comando cuando es posible emitirlo
+PESOS_COMANDOS = {
+    "iniciar_navegacion": 4,
+    "set_rumbo": 3,
+    "iniciar_regata": 1,
+    "parar_navegacion": 4,
+}
+
+# Separación media entre mensajes, en segundos simulados, es SEGUNDOS_POR_BARCO / número de barcos:
+# una flota mayor envía más mensajes por hora
+SEGUNDOS_POR_BARCO = 9_600
+
+
+# ========== FLOTA ==========
+
+def generar_flota(num_barcos, semilla=1, proporcion_lanchas=0.5, prefijo="Sintético"):
+    """Registros de construcción (formato de serializacion.escribir_flota), de uno en uno"""
+    
+    if num_barcos < 0:
+        raise ValueError("El número de barcos a generar no puede ser negativo.")
+    
+    if not 0 <= proporcion_lanchas <= 1:
+        raise ValueError("La proporción de lanchas debe estar entre 0 y 1.")
+    
+    generador = random.Random(semilla)
+    for i in range(num_barcos):
+        num_max_tripulantes = generador.randint(Embarcacion.MIN_TRIPULANTES, MAX_TRIPULANTES_GENERADOS)
+        if generador.random() < proporcion_lanchas:
+            yield {
+                "tipo": "Lancha",
+                "nombre": f"{prefijo} L{i}",
+                "num_max_tripulantes": num_max_tripulantes,
+                "num_motores": generador.randint(Lancha.MIN_MOTORES, Lancha.MAX_MOTORES),
+                "combustible": generador.randint(Lancha.MIN_COMBUSTIBLE, Lancha.MAX_COMBUSTIBLE),
+            }
+        else:
+            yield {
+                "tipo": "Velero",
+                "nombre": f"{prefijo} V{i}",
+                "num_mastiles": generador.randint(Velero.MIN_MASTILES, Velero.MAX_MASTILES),
+                "num_max_tripulantes": num_max_tripulantes,
+            }
+
+
+# ========== CARGA DE TRABAJO ==========
+
+class _Conjunto:
+    """Conjunto de índices con alta, baja y elección al azar en O(1)"""
+    
+    def __init__(self):
+        self._elementos = []
+        self._posicion = {}
+    
+    def __len__(self):
+        return len(self._elementos)
+    
+    def añadir(self, elemento):
+        self._posicion[elemento] = len(self._elementos)
+        self._elementos.append(elemento)
+    
+    def quitar(self, elemento):
+        posicion = self._posicion.pop(elemento)
+        ultimo = self._elementos.pop()
+        if ultimo != elemento:
+            self._elementos[posicion] = ultimo
+            self._posicion[ultimo] = posicion
+    
+    def elegir(self, generador):
+        return self._elementos[int(generador.random() * len(self._elementos))]
+
+
+class GeneradorCarga:
+    """Simula el estado de cada barco para emitir solo comandos que Embarcacion acepta"""
+    
+    def __init__(self, registros, semilla=1, num_patrones=1_000, instante_inicial=1_700_000_000):
+        """Constructor de GeneradorCarga (registros: la flota, como la produce generar_flota; instante_inicial: época en segundos)"""
+        
+        if num_patrones < 1:
+            raise ValueError("Se necesita al menos un patrón.")
+        
+        self._generador = random.Random(semilla)
+        
+        # Nombres ya codificados en JSON para montar los mensajes sin volver a serializarlos
+        self._nombres = []
+        self._es_lancha = bytearray()
+        self._max_tripulantes = array("i")
+        self._mastiles = array("b")
+        self._combustible = array("i")
+        
+        for registro in registros:
+            self._nombres.append(json.dumps(registro["nombre"], ensure_ascii=False))
+            lancha = registro["tipo"] == "Lancha"
+            self._es_lancha.append(lancha)
+            self._max_tripulantes.append(registro["num_max_tripulantes"])
+            self._mastiles.append(0 if lancha else registro["num_mastiles"])
+            self._combustible.append(registro["combustible"] if lancha else 0)
+        
+        num_barcos = len(self._nombres)
+        if num_barcos == 0:
+            raise ValueError("La flota para generar la carga está vacía.")
+        
+        self._patrones = [json.dumps(f"Patrón {i}", ensure_ascii=False) for i in range(num_patrones)]
+        self._rumbos_lancha = [json.dumps(rumbo, ensure_ascii=False) for rumbo in Lancha.RUMBOS_LANCHA]
+        self._rumbos_velero = [json.dumps(rumbo, ensure_ascii=False) for rumbo in Velero.RUMBOS_VELERO]
+        
+        # Reloj simulado: cada mensaje lleva su instante y el tiempo navegado sale de él
+        self._instante = float(instante_inicial)
+        self._paso_medio = SEGUNDOS_POR_BARCO / num_barcos
+        
+        # Estado: rumbo (índice en la lista de su tipo), velocidad e instante de salida de los que navegan
+        self._rumbo = array("b", [-1]) * num_barcos
+        self._velocidad = array("i", [0]) * num_barcos
+        self._salida_en = array("d", [0.0]) * num_barcos
+        self._en_puerto = _Conjunto()
+        self._en_mar = _Conjunto()
+        for i in range(num_barcos):
+            self._en_puerto.añadir(i)
+        
+        # Veleros navegando agrupados por (mástiles, rumbo): los únicos que pueden regatear entre sí
+        self._grupos_regata = {}
+    
+    # ========== TRANSICIONES ==========
+    
+    def _grupo(self, i):
+        clave = (self._mastiles[i], self._rumbo[i])
+        grupo = self._grupos_regata.get(clave)
+        if grupo is None:
+            grupo = self._grupos_regata[clave] = _Conjunto()
+        return grupo
+    
+    def _salida(self, i):
+        generador = self._generador
+        if self._es_lancha[i]:
+            # Una lancha sin combustible suficiente reposta en vez de salir
+            if self._combustible[i] < Lancha.MIN_COMBUSTIBLE:
+                self._combustible[i] = Lancha.MAX_COMBUSTIBLE
+                return f'{{"op":"repostar","barco":{self._nombres[i]}}}'
+            velocidad = generador.randint(Lancha.MIN_VELOCIDAD_LANCHA, Lancha.MAX_VELOCIDAD_LANCHA)
+            rumbo = int(generador.random() * len(self._rumbos_lancha))
+            texto_rumbo = self._rumbos_lancha[rumbo]
+        else:
+            velocidad = generador.randint(Velero.MIN_VELOCIDAD_VELERO, Velero.MAX_VELOCIDAD_VELERO)
+            rumbo = int(generador.random() * len(self._rumbos_velero))
+            texto_rumbo = self._rumbos_velero[rumbo]
+        
+        tripulantes = generador.randint(Embarcacion.MIN_TRIPULANTES, self._max_tripulantes[i])
+        patron = self._patrones[int(generador.random() * len(self._patrones))]
+        
+        self._rumbo[i] = rumbo
+        self._velocidad[i] = velocidad
+        self._salida_en[i] = self._instante
+        self._en_puerto.quitar(i)
+        self._en_mar.añadir(i)
+        if not self._es_lancha[i]:
+            self._grupo(i).añadir(i)
+        
+        return (f'{{"op":"iniciar_navegacion","barco":{self._nombres[i]},"velocidad":{velocidad},'
+                f'"rumbo":{texto_rumbo},"patron":{patron},"tripulantes":{tripulantes}}}')
+    
+    def _cambio_rumbo(self, i):
+        rumbos = self._rumbos_lancha if self._es_lancha[i] else self._rumbos_velero
+        
+        # Cualquier rumbo de su tipo salvo el actual
+        rumbo = int(self._generador.random() * (len(rumbos) - 1))
+        if rumbo >= self._rumbo[i]:
+            rumbo += 1
+        
+        if not self._es_lancha[i]:
+            self._grupo(i).quitar(i)
+        self._rumbo[i] = rumbo
+        if not self._es_lancha[i]:
+            self._grupo(i).añadir(i)
+        
+        return f'{{"op":"set_rumbo","barco":{self._nombres[i]},"rumbo":{rumbos[rumbo]}}}'
+    
+    def _regata(self, i):
+        """Regata con otro velero del mismo grupo; None si no hay rival posible"""
+        
+        grupo = self._grupo(i)
+        if len(grupo) < 2:
+            return None
+        otro = grupo.elegir(self._generador)
+        while otro == i:
+            otro = grupo.elegir(self._generador)
+        return f'{{"op":"iniciar_regata","barco":{self._nombres[i]},"otro":{self._nombres[otro]}}}'
+    
+    def _llegada(self, i):
+        tiempo = max(0.01, round((self._instante - self._salida_en[i]) / 3600, 2))
+        
+        # Mismo cálculo que Lancha._consumir_combustible
+        if self._es_lancha[i]:
+            consumido = int(self._velocidad[i] * tiempo * Lancha.FACTOR_COMBUSTIBLE)
+            self._combustible[i] = max(0, self._combustible[i] - consumido)
+        else:
+            self._grupo(i).quitar(i)
+        
+        self._rumbo[i] = -1
+        self._velocidad[i] = 0
+        self._en_mar.quitar(i)
+        self._en_puerto.añadir(i)
+        
+        return f'{{"op":"parar_navegacion","barco":{self._nombres[i]},"tiempo":{tiempo}}}'
+    
+    # ========== EMISIÓN ==========
+    
+    def mensajes(self, num_eventos=None):
+        """
+        Mensajes JSON (sin salto de línea) en el formato del servidor de telemetría, cada uno con su
+        instante simulado; infinitos si num_eventos es None
+        """
+        
+        generador = self._generador
+        operaciones = list(PESOS_COMANDOS)
+        pesos = list(PESOS_COMANDOS.values())
+        emitidos = 0
+        
+        while num_eventos is None or emitidos < num_eventos:
+            self._instante += generador.expovariate(1 / self._paso_medio)
+            
+            if not self._en_mar:
+                operacion = "iniciar_navegacion"
+            elif not self._en_puerto:
+                operacion = "parar_navegacion"
+            else:
+                operacion = generador.choices(operaciones, pesos)[0]
+            
+            if operacion == "iniciar_navegacion":
+                mensaje = self._salida(self._en_puerto.elegir(generador))
+            else:
+                i = self._en_mar.elegir(generador)
+                if operacion == "parar_navegacion":
+                    mensaje = self._llegada(i)
+                elif operacion == "iniciar_regata" and not self._es_lancha[i]:
+                    mensaje = self._regata(i) or self._cambio_rumbo(i)
+                else:
+                    mensaje = self._cambio_rumbo(i)
+            
+            yield f'{mensaje[:-1]},"instante":{self._instante:.1f}}}'
+            emitidos += 1
+
+
+# ========== FICHEROS ==========
+
+def escribir_diario(mensajes, ruta, tam_bloque=10_000):
+    """Escribe los mensajes, uno por línea, en bloques; devuelve cuántos"""
+    
+    num = 0
+    bloque = []
+    with open(ruta, "w", encoding="utf-8") as fichero:
+        for mensaje in mensajes:
+            bloque.append(mensaje)
+            if len(bloque) >= tam_bloque:
+                fichero.write("\n".join(bloque) + "\n")
+                num += len(bloque)
+                bloque = []
+        if bloque:
+            fichero.write("\n".join(bloque) + "\n")
+            num += len(bloque)
+    return num
+
+
+def generar_ficheros(ruta_flota, ruta_diario, num_barcos, num_eventos, semilla=1, proporcion_lanchas=0.5):
+    """Escribe una flota y su diario de comandos, listos para reproducir (python -m puerto reproducir)"""
+    
+    from .serializacion import escribir_flota
+    
+    escribir_flota(generar_flota(num_barcos, semilla, proporcion_lanchas), ruta_flota)
+    
+    # La flota se vuelve a generar con la misma semilla en lugar de guardarla en memoria
+    carga = GeneradorCarga(generar_flota(num_barcos, semilla, proporcion_lanchas), semilla + 1)
+    return escribir_diario(carga.mensajes(num_eventos), ruta_diario)
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=10_000, num_eventos=1_000_000, semilla=1):
+    """Mide eventos generados por segundo, sin escribir y escribiendo a fichero"""
+    
+    import os
+    import tempfile
+    
+    carga = GeneradorCarga(generar_flota(num_barcos, semilla), semilla + 1)
+    inicio = time.perf_counter()
+    for _ in carga.mensajes(num_eventos):
+        pass
+    generacion = time.perf_counter() - inicio
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_flota = os.path.join(directorio, "flota.jsonl")
+        ruta_diario = os.path.join(directorio, "diario.jsonl")
+        inicio = time.perf_counter()
+        generar_ficheros(ruta_flota, ruta_diario, num_barcos, num_eventos, semilla)
+        escritura = time.perf_counter() - inicio
+        tamaño = os.path.getsize(ruta_diario)
+    
+    print(f"{num_eventos} eventos sobre {num_barcos} barcos: {num_eventos / generacion:,.0f} eventos/s generados, "
+          f"{num_eventos / escritura:,.0f} eventos/s a fichero ({tamaño / 2 ** 20:.1f} MB)")
+    return num_eventos / generacion
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Historial de navegaciones
+Guarda un hecho por cada navegación terminada (patrón, horas, combustible...) y mantiene
+acumulados por patrón y por barco, totales y mensuales, con índices de montículo para el top-k
+"""
+
+import heapq
+import json
+import random
+import time
+
+from .embarcacion import Embarcacion
+from .oyente_embarcacion import OyenteEmbarcacion
+
+
+# Campos de cada sesión, en el orden en que se guardan
+CAMPOS_SESION = ("instante", "barco", "tipo", "patron", "tripulacion", "horas", "combustible", "velocidad", "rumbo")
+
+DIMENSIONES = ("patron", "barco")
+METRICAS = ("horas", "combustible", "sesiones")
+
+
+class IndiceTop:
+    """Montículo de máximos con entradas obsoletas descartadas al consultar (los acumulados solo crecen)"""
+    
+    def __init__(self, valores):
+        """Constructor de IndiceTop a partir de un diccionario clave -> valor ya acumulado"""
+        
+        self._valores = valores
+        self._monticulo = [(-valor, clave) for clave, valor in valores.items()]
+        heapq.heapify(self._monticulo)
+    
+    def actualizar(self, clave):
+        """La clave ha cambiado de valor: se apila su valor nuevo"""
+        
+        heapq.heappush(self._monticulo, (-self._valores[clave], clave))
+        
+        # Si las entradas obsoletas dominan, se reconstruye desde los valores vigentes
+        if len(self._monticulo) > 2 * len(self._valores) + 64:
+            self._monticulo = [(-valor, clave) for clave, valor in self._valores.items()]
+            heapq.heapify(self._monticulo)
+    
+    def top(self, k):
+        monticulo = self._monticulo
+        valores = self._valores
+        resultado = []
+        vistas = set()
+        while monticulo and len(resultado) < k:
+            valor, clave = heapq.heappop(monticulo)
+            # Una clave puede tener varias entradas con el valor vigente: cuenta la primera
+            if valores.get(clave) == -valor and clave not in vistas:
+                vistas.add(clave)
+                resultado.append((clave, -valor))
+        
+        # Las entradas vigentes vuelven al montículo; las obsoletas quedan descartadas
+        for clave, valor in resultado:
+            heapq.heappush(monticulo, (-valor, clave))
+        return resultado
+
+
+class HistorialNavegacion(OyenteEmbarcacion):
+    """Registro de sesiones y acumulados por patrón y por barco"""
+    
+    def __init__(self, ruta=None, reloj=None):
+        """Constructor de HistorialNavegacion (ruta: diario JSON por líneas donde añadir las sesiones)"""
+        
+        self._reloj = reloj if reloj is not None else time.time
+        self._diario = open(ruta, "a", encoding="utf-8") if ruta is not None else None
+        self._num_sesiones = 0
+        
+        # (dimensión, mes) -> métrica -> {clave: valor}; mes None es el acumulado total
+        self._acumulados = {}
+        
+        # (dimensión, métrica, mes) -> IndiceTop, creado en la primera consulta
+        self._indices = {}
+    
+    # ========== ALTA Y BAJA EN EL OYENTE ==========
+    
+    def conectar(self):
+        """Empieza a registrar las navegaciones de todas las embarcaciones"""
+        Embarcacion.registrar_oyente(self)
+        return self
+    
+    def desconectar(self):
+        Embarcacion.eliminar_oyente(self)
+        if self._diario is not None:
+            self._diario.close()
+            self._diario = None
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_sesiones(self):
+        return self._num_sesiones
+    
+    # ========== REGISTRO DE SESIONES ==========
+    
+    def al_parar_navegacion(self, barco, tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido):
+        sesion = (
+            self._reloj(), barco._nombre, type(barco).__name__, patron, tripulacion,
+            tiempo_navegando, combustible_consumido, velocidad, rumbo,
+        )
+        if self._diario is not None:
+            self._diario.write(json.dumps(sesion, ensure_ascii=False) + "\n")
+        self.añadir(sesion)
+    
+    def añadir(self, sesion):
+        """Acumula una sesión (tupla en el orden de CAMPOS_SESION)"""
+        
+        instante, barco, _, patron, _, horas, combustible, _, _ = sesion
+        mes = HistorialNavegacion.mes(instante)
+        incrementos = (("horas", horas), ("combustible", combustible), ("sesiones", 1))
+        
+        for dimension, clave in (("patron", patron), ("barco", barco)):
+            for periodo in (None, mes):
+                acumulado = self._acumulados.get((dimension, periodo))
+                if acumulado is None:
+                    acumulado = self._acumulados[(dimension, periodo)] = {metrica: {} for metrica in METRICAS}
+                
+                for metrica, incremento in incrementos:
+                    valores = acumulado[metrica]
+                    nuevo = valores[clave] = valores.get(clave, 0) + incremento
+                    indice = self._indices.get((dimension, metrica, periodo))
+                    if indice is not None and (incremento or nuevo == incremento):
+                        indice.actualizar(clave)
+        
+        self._num_sesiones += 1
+    
+    # ========== RECONSTRUCCIÓN ==========
+    
+    @staticmethod
+    def leer_diario(ruta):
+        """Sesiones de un diario JSON por líneas, de una en una"""
+        
+        with open(ruta, encoding="utf-8") as fichero:
+            for linea in fichero:
+                if linea.strip():
+                    yield tuple(json.loads(linea))
+    
+    @classmethod
+    def reconstruir(cls, sesiones, reloj=None):
+        """Recalcula los acumulados en una sola pasada; los índices se crean después, al consultar"""
+        
+        historial = cls(reloj=reloj)
+        for sesion in sesiones:
+            historial.añadir(sesion)
+        return historial
+    
+    # ========== CONSULTAS ==========
+    
+    @staticmethod
+    def mes(instante):
+        """Clave de mes ("AAAA-MM") del instante, para las consultas mensuales"""
+        return time.strftime("%Y-%m", time.gmtime(instante))
+    
+    def valor(self, dimension, clave, metrica="horas", mes=None):
+        self._validar(dimension, metrica)
+        acumulado = self._acumulados.get((dimension, mes))
+        return acumulado[metrica].get(clave, 0) if acumulado else 0
+    
+    def top(self, k, dimension="patron", metrica="horas", mes=None):
+        """Los k patrones o barcos con más horas, combustible o sesiones, totales o del mes"""
+        
+        self._validar(dimension, metrica)
+        indice = self._indices.get((dimension, metrica, mes))
+        if indice is None:
+            acumulado = self._acumulados.get((dimension, mes))
+            if acumulado is None:
+                return []
+            indice = self._indices[(dimension, metrica, mes)] = IndiceTop(acumulado[metrica])
+        return indice.top(k)
+    
+    @staticmethod
+    def _validar(dimension, metrica):
+        if dimension not in DIMENSIONES:
+            raise ValueError(f"Dimensión desconocida: {dimension}. Debe ser una de {', '.join(DIMENSIONES)}.")
+        if metrica not in METRICAS:
+            raise ValueError(f"Métrica desconocida: {metrica}. Debe ser una de {', '.join(METRICAS)}.")
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_sesiones=500_000, num_barcos=20_000, num_patrones=2_000, semilla=1):
+    """Ingesta de sesiones con índices vivos, consultas top-k y reconstrucción desde el historial"""
+    
+    generador = random.Random(semilla)
+    inicio_mes = 1_700_000_000
+    sesiones = []
+    for i in range(num_sesiones):
+        horas = generador.uniform(0.1, 6)
+        sesiones.append((
+            inicio_mes + i * 10, f"Barco {generador.randrange(num_barcos)}", "Lancha",
+            f"Patrón {generador.randrange(num_patrones)}", 2, horas, horas * 1.3, 20, "norte",
+        ))
+    
+    # Unas pocas sesiones y una consulta para que la ingesta mida el mantenimiento de los índices vivos
+    historial = HistorialNavegacion()
+    iniciales = num_sesiones // 100
+    for sesion in sesiones[:iniciales]:
+        historial.añadir(sesion)
+    historial.top(20, "patron", "horas")
+    historial.top(20, "barco", "combustible", HistorialNavegacion.mes(inicio_mes))
+    
+    inicio = time.perf_counter()
+    for sesion in sesiones[iniciales:]:
+        historial.añadir(sesion)
+    ingesta = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for _ in range(1_000):
+        historial.top(20, "patron", "horas")
+        historial.top(20, "barco", "combustible", HistorialNavegacion.mes(inicio_mes))
+    consultas = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    reconstruido = HistorialNavegacion.reconstruir(iter(sesiones))
+    reconstruccion = time.perf_counter() - inicio
+    
+    assert reconstruido.top(20, "patron", "horas") == historial.top(20, "patron", "horas")
+    print(f"{num_sesiones} sesiones: ingesta {(num_sesiones - iniciales) / ingesta:,.0f} sesiones/s, "
+          f"2000 consultas top-20 en {consultas * 1000:.1f} ms, reconstrucción en {reconstruccion:.2f} s")
+    return ingesta
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Clase Lancha
+Embarcación motorizada con consumo de combustible
+"""
+
+from .embarcacion import Embarcacion
+
+
+class Lancha(Embarcacion):
+    """Clase para lanchas motoras"""
+    
+    # Constantes públicas
+    MIN_MOTORES = 1
+    MAX_MOTORES = 2
+    MIN_COMBUSTIBLE = 8
+    MAX_COMBUSTIBLE = 50
+    FACTOR_COMBUSTIBLE = 0.026
+    MIN_VELOCIDAD_LANCHA = 1
+    MAX_VELOCIDAD_LANCHA = 50
+    RUMBOS_LANCHA = ("norte", "sur", "este", "oeste")
+    
+    # Atributos de clase
+    _num_lanchas = 0
+    _codigos_rumbo = Embarcacion._rumbos.codigos(RUMBOS_LANCHA)
+    
+    def __init__(self, nombre=None, num_max_tripulantes=None, num_motores=None, nivel_combustible=None):
+        """Constructor de Lancha"""
+        
+        # Constructor sin parámetros
+        if nombre is None:
+            Lancha._num_lanchas += 1
+            nombre = f"Lancha {Lancha._num_lanchas}"
+            num_max_tripulantes = Embarcacion.MIN_TRIPULANTES
+            num_motores = Lancha.MIN_MOTORES
+            nivel_combustible = Lancha.MAX_COMBUSTIBLE
+        else:
+            # Validaciones para constructor con parámetros
+            Lancha._validar_parametros(num_motores, nivel_combustible)
+            
+            Lancha._num_lanchas += 1
+        
+        # Llamar al constructor de la clase base
+        super().__init__(nombre, num_max_tripulantes)
+        
+        # Atributos constantes propios de Lancha
+        self._num_motores = num_motores
+        self._cantidad_combustible = nivel_combustible
+        
+        if Embarcacion._oyentes:
+            self._notificar("al_crear")
+    
+    @staticmethod
+    def _validar_parametros(num_motores, nivel_combustible):
+        if num_motores < Lancha.MIN_MOTORES or num_motores > Lancha.MAX_MOTORES:
+            raise ValueError(f"El número de motores debe estar entre {Lancha.MIN_MOTORES} y {Lancha.MAX_MOTORES}.")
+        
+        if nivel_combustible < Lancha.MIN_COMBUSTIBLE or nivel_combustible > Lancha.MAX_COMBUSTIBLE:
+            raise ValueError(
+                f"El nivel de combustible debe estar entre {Lancha.MIN_COMBUSTIBLE} y {Lancha.MAX_COMBUSTIBLE}."
+            )
+    
+    @classmethod
+    def crear_lote(cls, cantidad, num_max_tripulantes=None, num_motores=None, nivel_combustible=None,
+                   prefijo="Lancha", vista=False):
+        """
+        Crea cantidad lanchas iguales con nombres "prefijo n" consecutivos. Los parámetros se validan
+        una vez y el contador se reserva en bloque. Con vista=True devuelve una FlotaEmpaquetada:
+        no se crean embarcaciones, así que no cuentan en get_num_barcos, no entran en el registro de
+        vivas ni se notifican a los oyentes; solo reservan sus nombres en el contador de lanchas.
+        """
+        
+        if cantidad < 0:
+            raise ValueError("El número de lanchas a crear no puede ser negativo.")
+        
+        # Valores del constructor sin parámetros para lo que no se indique
+        if num_max_tripulantes is None:
+            num_max_tripulantes = Embarcacion.MIN_TRIPULANTES
+        if num_motores is None:
+            num_motores = Lancha.MIN_MOTORES
+        if nivel_combustible is None:
+            nivel_combustible = Lancha.MAX_COMBUSTIBLE
+        
+        Embarcacion._validar_num_max_tripulantes(num_max_tripulantes)
+        Lancha._validar_parametros(num_motores, nivel_combustible)
+        nombres = Embarcacion._nombres_lote(prefijo, Lancha._num_lanchas + 1, cantidad)
+        
+        # Reservar el bloque de valores del contador
+        Lancha._num_lanchas += cantidad
+        
+        if vista:
+            from .serializacion import FlotaEmpaquetada, TIPO_LANCHA
+            return FlotaEmpaquetada.uniforme(
+                nombres, TIPO_LANCHA, num_max_tripulantes, num_motores=num_motores, combustible=nivel_combustible
+            )
+        
+        return cls._crear_lote(nombres, {
+            "_num_max_tripulantes": num_max_tripulantes,
+            "_num_motores": num_motores,
+            "_cantidad_combustible": nivel_combustible,
+        })
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_motores(self):
+        return self._num_motores
+    
+    def get_cantidad_combustible(self):
+        return self._cantidad_combustible
+    
+    @classmethod
+    def get_num_lanchas(cls):
+        return cls._num_lanchas
+    
+    # ========== MÉTODOS DE MODIFICACIÓN ==========
+    
+    def repostar(self, cantidad=None):
+        """Reposta la lancha en puerto (sin cantidad, hasta llenar el depósito) y devuelve lo repostado"""
+        
+        # Validaciones
+        if self._navegando:
+            raise Exception(f"La lancha {self._nombre} está navegando, no se puede repostar.")
+        
+        if cantidad is None:
+            cantidad = Lancha.MAX_COMBUSTIBLE - self._cantidad_combustible
+        elif cantidad <= 0:
+            raise ValueError("La cantidad de combustible a repostar debe ser mayor que cero.")
+        elif self._cantidad_combustible + cantidad > Lancha.MAX_COMBUSTIBLE:
+            raise ValueError(
+                f"No caben {cantidad} unidades en el depósito de {self._nombre}, "
+                f"el nivel máximo de combustible es {Lancha.MAX_COMBUSTIBLE}."
+            )
+        
+        self._cantidad_combustible += cantidad
+        
+        if Embarcacion._oyentes and cantidad:
+            self._notificar("al_repostar", cantidad)
+        
+        return cantidad
+    
+    # ========== SOBREESCRITURA DE MÉTODOS ==========
+    
+    def set_rumbo(self, rumbo):
+        """Cambia el rumbo de la lancha mientras navega"""
+        
+        # Validaciones específicas de Lancha
+        if rumbo is None:
+            raise ValueError("El rumbo no puede ser nulo, debes indicar el rumbo (norte, sur, este u oeste) para poder modificarlo.")
+        
+        if Embarcacion._rumbos.buscar(rumbo) not in Lancha._codigos_rumbo:
+            raise ValueError("El rumbo no es correcto, debes indicar el rumbo (norte, sur, este u oeste) para poder modificarlo.")
+        
+        # Llamar al método de la clase base
+        super().set_rumbo(rumbo)
+    
+    def _validar_salida(self, velocidad, rumbo, patron, num_tripulantes):
+        """Validaciones de salida de la lancha"""
+        
+        # Validaciones específicas de Lancha
+        if self._cantidad_combustible < Lancha.MIN_COMBUSTIBLE or self._cantidad_combustible > Lancha.MAX_COMBUSTIBLE:
+            raise Exception(
+                f"La lancha {self._nombre} no tiene un nivel de combustible válido para iniciar la navegación. "
+                f"El nivel de combustible debe estar entre {Lancha.MIN_COMBUSTIBLE} y {Lancha.MAX_COMBUSTIBLE}."
+            )
+        
+        if velocidad < Lancha.MIN_VELOCIDAD_LANCHA or velocidad > Lancha.MAX_VELOCIDAD_LANCHA:
+            raise ValueError(
+                f"La velocidad de navegación de {velocidad} nudos asignada a {self._nombre} es incorrecta."
+            )
+        
+        # Llamar al método de la clase base
+        super()._validar_salida(velocidad, rumbo, patron, num_tripulantes)
+        
+        # El rumbo se comprueba antes de internarlo, así la tabla solo guarda rumbos válidos
+        if Embarcacion._rumbos.buscar(rumbo) not in Lancha._codigos_rumbo:
+            raise ValueError("El rumbo no es correcto, debes indicar el rumbo (norte, sur, este u oeste) para iniciar la navegación.")
+    
+    def _consumir_combustible(self, tiempo_navegando):
+        """Descuenta el combustible gastado por la lancha (se llama ya validada la parada)"""
+        
+        # Calcular combustible consumido
+        combustible_consumido = int(self._velocidad * tiempo_navegando * Lancha.FACTOR_COMBUSTIBLE)
+        
+        # Actualizar combustible (no puede ser menor que 0)
+        combustible_restante = max(0, self._cantidad_combustible - combustible_consumido)
+        combustible_consumido = self._cantidad_combustible - combustible_restante
+        self._cantidad_combustible = combustible_restante
+        
+        return combustible_consumido
+    
+    def señalizar(self):
+        """Señalización de la lancha"""
+        print(f"AVISO de señalización de la lancha {self._nombre} con bocinas y luces intermitentes.")
+    
+    def __str__(self):
+        """Representación en cadena de la lancha"""
+        resultado = super().__str__()
+        resultado += f", Número de motores: {self._num_motores}, "
+        resultado += f"Nivel de combustible: {self._cantidad_combustible}"
+        return resultado
\ No newline at end of file
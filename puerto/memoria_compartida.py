@@ -0,0 +1,337 @@
+"""
+Estado de la flota en memoria compartida
+Bloque multiprocessing.shared_memory con protocolo seqlock para lectores de otros procesos
+
+Disposición del bloque (little-endian, todas las columnas alineadas a 8 bytes):
+
+    Cabecera (CABECERA.size = 72 bytes)
+        0   4s   firma b"FLOT"
+        4   I    versión de la disposición
+        8   Q    secuencia del seqlock (impar = escritura en curso)
+        16  I    capacidad (número máximo de barcos)
+        20  I    número de barcos publicados
+        24  q    Embarcacion.get_num_barcos()
+        32  q    Embarcacion.get_num_barcos_navegando()
+        40  d    Embarcacion.get_tiempo_total_navegacion_acumulado()
+        48  q    Lancha.get_num_lanchas()
+        56  q    Velero.get_num_veleros()
+        64  d    instante de la última publicación (time.time())
+
+    Columnas (una entrada por barco, en el orden de publicación)
+        tipo            B[capacidad]   TIPO_LANCHA, TIPO_VELERO u otro
+        navegando       B[capacidad]   0 / 1
+        rumbo           b[capacidad]   código de CODIGOS_RUMBO (-1 si es desconocido)
+        velocidad       d[capacidad]   nudos
+        combustible     d[capacidad]   solo Lancha; NaN en el resto
+        tiempo_total    d[capacidad]   horas acumuladas del barco
+        nombre          LONGITUD_NOMBRE bytes por barco, UTF-8 rellenado con ceros
+
+Protocolo seqlock: el escritor incrementa la secuencia (queda impar), escribe y la
+vuelve a incrementar (queda par). El lector lee la secuencia, lee los datos y la
+vuelve a leer; si era impar o ha cambiado, repite la lectura.
+"""
+
+import math
+import os
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+FIRMA = b"FLOT"
+VERSION = 1
+CABECERA = struct.Struct("<4sIQIIqqdqqd")
+OFFSET_SECUENCIA = 8
+LONGITUD_NOMBRE = 32
+
+TIPO_OTRO = 0
+TIPO_LANCHA = 1
+TIPO_VELERO = 2
+
+# Códigos de rumbo publicados en la columna rumbo
+CODIGOS_RUMBO = {
+    Embarcacion.RUMBO_POR_DEFECTO: 0,
+    "norte": 1,
+    "sur": 2,
+    "este": 3,
+    "oeste": 4,
+    "ceñida": 5,
+    "empopada": 6,
+}
+RUMBOS_POR_CODIGO = {codigo: rumbo for rumbo, codigo in CODIGOS_RUMBO.items()}
+
+
+def _alinear(offset):
+    return (offset + 7) & ~7
+
+
+def calcular_disposicion(capacidad):
+    """Devuelve los offsets de cada columna y el tamaño total del bloque"""
+    
+    disposicion = {}
+    offset = _alinear(CABECERA.size)
+    for columna, tam in (("tipo", 1), ("navegando", 1), ("rumbo", 1),
+                         ("velocidad", 8), ("combustible", 8), ("tiempo_total", 8),
+                         ("nombre", LONGITUD_NOMBRE)):
+        disposicion[columna] = offset
+        offset = _alinear(offset + tam * capacidad)
+    return disposicion, offset
+
+
+def _vistas(buf, capacidad):
+    """Vistas tipadas (sin copia) sobre las columnas del bloque"""
+    
+    disposicion, _ = calcular_disposicion(capacidad)
+    formatos = {"tipo": "B", "navegando": "B", "rumbo": "b",
+                "velocidad": "d", "combustible": "d", "tiempo_total": "d"}
+    
+    vistas = {}
+    for columna, formato in formatos.items():
+        inicio = disposicion[columna]
+        fin = inicio + struct.calcsize(formato) * capacidad
+        vistas[columna] = buf[inicio:fin].cast(formato)
+    
+    inicio = disposicion["nombre"]
+    vistas["nombre"] = buf[inicio:inicio + LONGITUD_NOMBRE * capacidad]
+    return vistas
+
+
+# Bloques creados por este proceso: el resource_tracker ya los tiene registrados a nombre del escritor
+_bloques_propios = set()
+
+
+class PublicadorFlota:
+    """Escritor del estado de la flota en un bloque de memoria compartida"""
+    
+    def __init__(self, barcos, nombre=None, capacidad=None):
+        """Constructor de PublicadorFlota"""
+        
+        if barcos is None:
+            raise ValueError("La flota a publicar no existe.")
+        
+        self._barcos = list(barcos)
+        if capacidad is None:
+            capacidad = max(1, len(self._barcos))
+        
+        if capacidad < len(self._barcos):
+            raise ValueError(f"La capacidad ({capacidad}) es menor que el número de barcos ({len(self._barcos)}).")
+        
+        _, tam = calcular_disposicion(capacidad)
+        self._shm = shared_memory.SharedMemory(name=nombre, create=True, size=tam)
+        _bloques_propios.add(self._shm.name)
+        self._capacidad = capacidad
+        self._buf = self._shm.buf
+        self._secuencia = self._buf[OFFSET_SECUENCIA:OFFSET_SECUENCIA + 8].cast("Q")
+        self._vistas = _vistas(self._buf, capacidad)
+        self._nombres_escritos = 0
+        
+        CABECERA.pack_into(self._buf, 0, FIRMA, VERSION, 0, capacidad, 0, 0, 0, 0.0, 0, 0, 0.0)
+        self.publicar()
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_nombre(self):
+        return self._shm.name
+    
+    def get_capacidad(self):
+        return self._capacidad
+    
+    def get_num_barcos(self):
+        return len(self._barcos)
+    
+    # ========== PUBLICACIÓN ==========
+    
+    def añadir(self, barco):
+        """Añade un barco al final de la flota publicada"""
+        
+        if len(self._barcos) >= self._capacidad:
+            raise Exception(f"El bloque compartido está lleno ({self._capacidad} barcos).")
+        
+        self._barcos.append(barco)
+    
+    def publicar(self):
+        """Copia el estado actual de la flota al bloque compartido bajo el seqlock"""
+        
+        vistas = self._vistas
+        tipo = vistas["tipo"]
+        navegando = vistas["navegando"]
+        rumbo = vistas["rumbo"]
+        velocidad = vistas["velocidad"]
+        combustible = vistas["combustible"]
+        tiempo_total = vistas["tiempo_total"]
+        codigos = CODIGOS_RUMBO
+        
+        # Abrir escritura (secuencia impar)
+        self._secuencia[0] += 1
+        
+        try:
+            for i, barco in enumerate(self._barcos):
+                navegando[i] = barco._navegando
+                rumbo[i] = codigos.get(barco._rumbo, -1)
+                velocidad[i] = barco._velocidad
+                tiempo_total[i] = barco._tiempo_total_navegacion
+                if isinstance(barco, Lancha):
+                    combustible[i] = barco._cantidad_combustible
+            
+            # Los atributos constantes solo se escriben la primera vez
+            for i in range(self._nombres_escritos, len(self._barcos)):
+                barco = self._barcos[i]
+                if isinstance(barco, Lancha):
+                    tipo[i] = TIPO_LANCHA
+                else:
+                    tipo[i] = TIPO_VELERO if isinstance(barco, Velero) else TIPO_OTRO
+                    combustible[i] = math.nan
+                
+                nombre = barco._nombre.encode("utf-8")[:LONGITUD_NOMBRE]
+                inicio = i * LONGITUD_NOMBRE
+                vistas["nombre"][inicio:inicio + LONGITUD_NOMBRE] = nombre.ljust(LONGITUD_NOMBRE, b"\0")
+            self._nombres_escritos = len(self._barcos)
+            
+            struct.pack_into(
+                "<Iqqdqqd", self._buf, 20,
+                len(self._barcos),
+                Embarcacion.get_num_barcos(),
+                Embarcacion.get_num_barcos_navegando(),
+                Embarcacion.get_tiempo_total_navegacion_acumulado(),
+                Lancha.get_num_lanchas(),
+                Velero.get_num_veleros(),
+                time.time(),
+            )
+        finally:
+            # Cerrar escritura (secuencia par)
+            self._secuencia[0] += 1
+    
+    def cerrar(self, eliminar=True):
+        """Libera el bloque compartido (y lo elimina del sistema si se indica)"""
+        
+        for vista in self._vistas.values():
+            vista.release()
+        self._secuencia.release()
+        self._buf = None
+        self._shm.close()
+        if eliminar:
+            _bloques_propios.discard(self._shm.name)
+            self._shm.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class LectorFlota:
+    """Lector sin copia del estado de la flota publicado por otro proceso"""
+    
+    MAX_REINTENTOS = 10_000
+    
+    def __init__(self, nombre):
+        """Constructor de LectorFlota"""
+        
+        if nombre is None or nombre.strip() == "":
+            raise ValueError("Debes indicar el nombre del bloque compartido.")
+        
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=nombre, track=False)
+        else:
+            # Python < 3.13 registra el bloque en el resource_tracker, que lo eliminaría al terminar
+            # este proceso aunque pertenezca al escritor: se retira el registro justo después, salvo
+            # si el escritor es este mismo proceso (el registro es suyo y lo retira unlink())
+            self._shm = shared_memory.SharedMemory(name=nombre)
+            if os.name == "posix" and self._shm.name not in _bloques_propios:
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        
+        self._buf = self._shm.buf
+        firma, version, _, capacidad = struct.unpack_from("<4sIQI", self._buf, 0)
+        if firma != FIRMA or version != VERSION:
+            self._shm.close()
+            raise ValueError(f"El bloque {nombre} no contiene una flota publicada compatible.")
+        
+        self._capacidad = capacidad
+        self._secuencia = self._buf[OFFSET_SECUENCIA:OFFSET_SECUENCIA + 8].cast("Q")
+        self._vistas = _vistas(self._buf, capacidad)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_capacidad(self):
+        return self._capacidad
+    
+    def get_vistas(self):
+        """Vistas sin copia de las columnas (leer dentro de leer() para tener consistencia)"""
+        return self._vistas
+    
+    # ========== LECTURA ==========
+    
+    def leer(self, funcion):
+        """Ejecuta funcion(cabecera, vistas) hasta obtener una lectura consistente"""
+        
+        for _ in range(LectorFlota.MAX_REINTENTOS):
+            inicio = self._secuencia[0]
+            if inicio & 1:
+                continue
+            
+            cabecera = self._cabecera()
+            resultado = funcion(cabecera, self._vistas)
+            
+            if self._secuencia[0] == inicio:
+                return resultado
+        
+        raise Exception("No se ha podido obtener una lectura consistente de la flota compartida.")
+    
+    def contadores(self):
+        """Contadores de clase publicados"""
+        return self.leer(lambda cabecera, vistas: cabecera)
+    
+    def instantanea(self):
+        """Copia consistente de todas las columnas como listas de Python"""
+        
+        def copiar(cabecera, vistas):
+            num = cabecera["num_publicados"]
+            nombres = vistas["nombre"]
+            return {
+                "contadores": cabecera,
+                "tipo": vistas["tipo"][:num].tolist(),
+                "navegando": [bool(valor) for valor in vistas["navegando"][:num]],
+                "rumbo": [RUMBOS_POR_CODIGO.get(codigo) for codigo in vistas["rumbo"][:num]],
+                "velocidad": vistas["velocidad"][:num].tolist(),
+                "combustible": vistas["combustible"][:num].tolist(),
+                "tiempo_total": vistas["tiempo_total"][:num].tolist(),
+                "nombre": [
+                    bytes(nombres[i * LONGITUD_NOMBRE:(i + 1) * LONGITUD_NOMBRE]).rstrip(b"\0").decode("utf-8", "replace")
+                    for i in range(num)
+                ],
+            }
+        
+        return self.leer(copiar)
+    
+    def _cabecera(self):
+        valores = CABECERA.unpack_from(self._buf, 0)
+        return {
+            "num_publicados": valores[4],
+            "num_barcos": valores[5],
+            "num_barcos_navegando": valores[6],
+            "tiempo_total_navegacion_acumulado": valores[7],
+            "num_lanchas": valores[8],
+            "num_veleros": valores[9],
+            "instante": valores[10],
+        }
+    
+    def cerrar(self):
+        """Se desconecta del bloque compartido (no lo elimina)"""
+        
+        for vista in self._vistas.values():
+            vista.release()
+        self._secuencia.release()
+        self._buf = None
+        self._shm.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Exportador de métricas
+Sirve en localhost, en el formato de texto de Prometheus, los contadores de la flota y el número
+de llamadas y la latencia de los métodos de navegación. Las cifras salen de AgregadosFlota y de
+los contadores de clase, así que leerlas no recorre la flota
+"""
+
+import ipaddress
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .agregados import AgregadosFlota
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites superiores (segundos) de los cubos del histograma de latencias
+CUBOS_LATENCIA = (0.000_001, 0.000_002, 0.000_005, 0.000_01, 0.000_02, 0.000_05,
+                  0.000_1, 0.000_25, 0.000_5, 0.001, 0.01, 0.1, 1.0)
+
+# Métodos públicos medidos por defecto, en la clase final para no contar dos veces las llamadas a super()
+METODOS_MEDIDOS = (
+    (Lancha, "iniciar_navegacion"), (Lancha, "set_rumbo"), (Lancha, "parar_navegacion"), (Lancha, "repostar"),
+    (Velero, "iniciar_navegacion"), (Velero, "set_rumbo"), (Velero, "parar_navegacion"), (Velero, "iniciar_regata"),
+)
+
+
+def _etiqueta(valor):
+    return str(valor).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+# ========== LATENCIAS ==========
+
+class MetricasMetodos:
+    """Envuelve métodos de clase para contar sus llamadas y repartir su duración en cubos"""
+    
+    def __init__(self, cubos=CUBOS_LATENCIA):
+        """Constructor de MetricasMetodos"""
+        
+        if not cubos or list(cubos) != sorted(cubos):
+            raise ValueError("Los cubos del histograma deben ser una lista creciente y no vacía.")
+        
+        self._cubos = tuple(cubos)
+        
+        # (tipo, método) -> [cuentas por cubo (la última es +Inf), suma de segundos]
+        self._medidas = {}
+        
+        # (clase, método, original o None si era heredado)
+        self._envueltos = []
+    
+    def instrumentar(self, metodos=METODOS_MEDIDOS):
+        for clase, nombre in metodos:
+            self._envolver(clase, nombre)
+        return self
+    
+    def _envolver(self, clase, nombre):
+        original = getattr(clase, nombre, None)
+        if original is None:
+            raise ValueError(f"{clase.__name__} no tiene el método {nombre}.")
+        
+        clave = (clase.__name__, nombre)
+        if clave in self._medidas:
+            raise ValueError(f"El método {clase.__name__}.{nombre} ya está medido.")
+        
+        medida = self._medidas[clave] = [[0] * (len(self._cubos) + 1), 0.0]
+        cuentas = medida[0]
+        cubos = self._cubos
+        reloj = time.perf_counter
+        
+        # Sin cerrojo: con el GIL, una carrera solo puede perder alguna cuenta suelta
+        @wraps(original)
+        def medido(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                duracion = reloj() - inicio
+                cuentas[bisect_left(cubos, duracion)] += 1
+                medida[1] += duracion
+        
+        self._envueltos.append((clase, nombre, clase.__dict__.get(nombre)))
+        setattr(clase, nombre, medido)
+    
+    def restaurar(self):
+        """Deja los métodos como estaban"""
+        
+        for clase, nombre, original in reversed(self._envueltos):
+            if original is None:
+                delattr(clase, nombre)
+            else:
+                setattr(clase, nombre, original)
+        self._envueltos = []
+    
+    def llamadas(self, tipo, metodo):
+        medida = self._medidas.get((tipo, metodo))
+        return sum(medida[0]) if medida else 0
+    
+    def lineas(self):
+        """Líneas de texto de los contadores de llamadas y del histograma de latencias"""
+        
+        lineas = ["# HELP puerto_metodo_llamadas_total Llamadas a los métodos de navegación.",
+                  "# TYPE puerto_metodo_llamadas_total counter"]
+        for (tipo, metodo), (cuentas, _) in self._medidas.items():
+            lineas.append(f'puerto_metodo_llamadas_total{{tipo="{tipo}",metodo="{metodo}"}} {sum(cuentas)}')
+        
+        lineas.append("# HELP puerto_metodo_segundos Duración de los métodos de navegación.")
+        lineas.append("# TYPE puerto_metodo_segundos histogram")
+        for (tipo, metodo), (cuentas, suma) in self._medidas.items():
+            etiquetas = f'tipo="{tipo}",metodo="{metodo}"'
+            acumulado = 0
+            for limite, cuenta in zip(self._cubos, cuentas):
+                acumulado += cuenta
+                lineas.append(f'puerto_metodo_segundos_bucket{{{etiquetas},le="{limite!r}"}} {acumulado}')
+            acumulado += cuentas[-1]
+            lineas.append(f'puerto_metodo_segundos_bucket{{{etiquetas},le="+Inf"}} {acumulado}')
+            lineas.append(f"puerto_metodo_segundos_sum{{{etiquetas}}} {suma!r}")
+            lineas.append(f"puerto_metodo_segundos_count{{{etiquetas}}} {acumulado}")
+        return lineas
+
+
+# ========== EXPORTADOR ==========
+
+class ExportadorMetricas:
+    """Servidor HTTP en localhost que responde en /metrics"""
+    
+    RUTA = "/metrics"
+    
+    def __init__(self, agregados=None, metodos=None, host="127.0.0.1", puerto=0, intervalo=1.0):
+        """
+        Constructor de ExportadorMetricas
+        agregados: AgregadosFlota conectado; si no se da, se crea uno con los barcos vivos
+        metodos: MetricasMetodos ya instrumentado, o None para no medir latencias
+        intervalo: segundos durante los que se reutiliza el último texto generado
+        """
+        
+        # Validaciones
+        try:
+            local = ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            local = host == "localhost"
+        if not local:
+            raise ValueError(f"El exportador de métricas solo escucha en localhost, no en {host}.")
+        
+        if intervalo < 0:
+            raise ValueError("El intervalo de regeneración no puede ser negativo.")
+        
+        self._propios = agregados is None
+        if agregados is None:
+            agregados = AgregadosFlota(Embarcacion.barcos_vivos()).conectar()
+        
+        self._agregados = agregados
+        self._metodos = metodos
+        self._host = host
+        self._puerto = puerto
+        self._intervalo = intervalo
+        self._servidor = None
+        self._hilo = None
+        
+        # Último texto generado y cuándo
+        self._cerrojo = threading.Lock()
+        self._texto = None
+        self._generado = 0.0
+        self._num_peticiones = 0
+        self._num_generaciones = 0
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_puerto(self):
+        return self._puerto
+    
+    def get_num_peticiones(self):
+        return self._num_peticiones
+    
+    def get_num_generaciones(self):
+        return self._num_generaciones
+    
+    # ========== FORMATO ==========
+    
+    def generar(self):
+        """Texto completo de la exposición (coste proporcional a tipos y rumbos, no a barcos)"""
+        
+        agregados = self._agregados
+        lineas = [
+            "# HELP puerto_barcos_creados_total Embarcaciones creadas desde el arranque.",
+            "# TYPE puerto_barcos_creados_total counter",
+            f'puerto_barcos_creados_total{{tipo="Lancha"}} {Lancha.get_num_lanchas()}',
+            f'puerto_barcos_creados_total{{tipo="Velero"}} {Velero.get_num_veleros()}',
+            "# HELP puerto_barcos_navegando Embarcaciones navegando ahora.",
+            "# TYPE puerto_barcos_navegando gauge",
+            f"puerto_barcos_navegando {Embarcacion.get_num_barcos_navegando()}",
+            "# HELP puerto_barcos_navegando_rumbo Embarcaciones navegando por tipo y rumbo.",
+            "# TYPE puerto_barcos_navegando_rumbo gauge",
+        ]
+        for tipo, rumbo, num in agregados.navegando_por_rumbo():
+            lineas.append(f'puerto_barcos_navegando_rumbo{{tipo="{tipo}",rumbo="{_etiqueta(rumbo)}"}} {num}')
+        
+        lineas.append("# HELP puerto_horas_navegacion_total Horas de navegación acumuladas.")
+        lineas.append("# TYPE puerto_horas_navegacion_total counter")
+        lineas.append(f"puerto_horas_navegacion_total {Embarcacion.get_tiempo_total_navegacion_acumulado()!r}")
+        lineas.append("# HELP puerto_horas_navegacion_tipo_total Horas de navegación acumuladas por tipo.")
+        lineas.append("# TYPE puerto_horas_navegacion_tipo_total counter")
+        for tipo in (Lancha.__name__, Velero.__name__):
+            lineas.append(f'puerto_horas_navegacion_tipo_total{{tipo="{tipo}"}} {agregados.horas_navegadas(tipo)!r}')
+        
+        lineas.append("# HELP puerto_combustible Combustible total en los depósitos de las lanchas (unidades del modelo).")
+        lineas.append("# TYPE puerto_combustible gauge")
+        lineas.append(f"puerto_combustible {agregados.combustible_total()}")
+        
+        if self._metodos is not None:
+            lineas.extend(self._metodos.lineas())
+        
+        self._num_generaciones += 1
+        return "\n".join(lineas) + "\n"
+    
+    def texto(self):
+        """Texto para una petición: el último generado si tiene menos de intervalo segundos"""
+        
+        with self._cerrojo:
+            ahora = time.monotonic()
+            if self._texto is None or ahora - self._generado >= self._intervalo:
+                self._texto = self.generar().encode("utf-8")
+                self._generado = ahora
+            self._num_peticiones += 1
+            return self._texto
+    
+    # ========== CICLO DE VIDA ==========
+    
+    def iniciar(self):
+        """Empieza a servir en un hilo aparte y devuelve el puerto asignado"""
+        
+        exportador = self
+        
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != ExportadorMetricas.RUTA:
+                    self.send_error(404)
+                    return
+                cuerpo = exportador.texto()
+                self.send_response(200)
+                self.send_header("Content-Type", TIPO_CONTENIDO)
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+            
+            def log_message(self, formato, *args):
+                pass
+        
+        self._servidor = ThreadingHTTPServer((self._host, self._puerto), Manejador)
+        self._servidor.daemon_threads = True
+        self._puerto = self._servidor.server_address[1]
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, name="metricas", daemon=True)
+        self._hilo.start()
+        return self._puerto
+    
+    def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._hilo.join()
+            self._servidor = None
+            self._hilo = None
+        if self._propios:
+            self._agregados.desconectar()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=100_000, num_peticiones=200):
+    """Coste de generar el texto y de atender peticiones, y sobrecoste de medir los métodos"""
+    
+    import urllib.request
+    
+    veleros = Velero.crear_lote(num_barcos, 2, 4, prefijo="Métricas")
+    for i, velero in enumerate(veleros[:num_barcos // 2]):
+        velero.iniciar_navegacion(10, Velero.RUMBOS_VELERO[i % len(Velero.RUMBOS_VELERO)], "Métricas", 2)
+    
+    def ciclos(num=20_000):
+        velero = veleros[-1]
+        inicio = time.perf_counter()
+        for _ in range(num):
+            velero.iniciar_navegacion(10, "ceñida", "Métricas", 2)
+            velero.set_rumbo("empopada")
+            velero.parar_navegacion(0.5)
+        return (time.perf_counter() - inicio) / (num * 3)
+    
+    sin_medir = ciclos()
+    metodos = MetricasMetodos().instrumentar()
+    midiendo = ciclos()
+    
+    exportador = ExportadorMetricas(metodos=metodos)
+    
+    inicio = time.perf_counter()
+    for _ in range(num_peticiones):
+        exportador.generar()
+    generacion = (time.perf_counter() - inicio) / num_peticiones
+    
+    generaciones = exportador.get_num_generaciones()
+    puerto = exportador.iniciar()
+    url = f"http://127.0.0.1:{puerto}{ExportadorMetricas.RUTA}"
+    inicio = time.perf_counter()
+    for _ in range(num_peticiones):
+        with urllib.request.urlopen(url) as respuesta:
+            cuerpo = respuesta.read()
+    peticion = (time.perf_counter() - inicio) / num_peticiones
+    exportador.cerrar()
+    metodos.restaurar()
+    
+    for velero in veleros:
+        if velero.is_navegando():
+            velero.parar_navegacion(1)
+    
+    print(f"{num_barcos} barcos: texto generado en {generacion * 1e6:.0f} µs, petición HTTP en {peticion * 1e6:.0f} µs "
+          f"({exportador.get_num_generaciones() - generaciones} generaciones para {exportador.get_num_peticiones()} peticiones, "
+          f"{len(cuerpo)} bytes); medir métodos: {sin_medir * 1e9:.0f} -> {midiendo * 1e9:.0f} ns por llamada")
+    return generacion
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Clase OyenteEmbarcacion
+Base para los objetos que reaccionan a los cambios de estado de las embarcaciones
+"""
+
+
+class OyenteEmbarcacion:
+    """Oyente de cambios de estado; las subclases sobreescriben solo los eventos que les interesan"""
+    
+    def al_crear(self, barco):
+        """Se ha construido una embarcación"""
+        pass
+    
+    def al_iniciar_navegacion(self, barco):
+        """La embarcación ha salido a navegar (su estado ya es el nuevo)"""
+        pass
+    
+    def al_iniciar_navegacion_lote(self, barcos):
+        """Han salido a la vez todos los barcos de un lote; por defecto se trata cada uno por separado"""
+        for barco in barcos:
+            self.al_iniciar_navegacion(barco)
+    
+    def al_cambiar_rumbo(self, barco, rumbo_anterior):
+        """La embarcación navegando ha cambiado de rumbo"""
+        pass
+    
+    def al_cambiar_velocidad(self, barco, velocidad_anterior):
+        """La embarcación navegando ha cambiado de velocidad sin volver a puerto"""
+        pass
+    
+    def al_parar_navegacion(self, barco, tiempo_navegando, velocidad, rumbo, patron, tripulacion, combustible_consumido):
+        """La embarcación ha vuelto a puerto (se recibe el estado que tenía mientras navegaba)"""
+        pass
+    
+    def al_repostar(self, barco, cantidad):
+        """La lancha ha repostado cantidad unidades de combustible"""
+        pass
\ No newline at end of file
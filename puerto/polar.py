@@ -0,0 +1,213 @@
+"""
+Modelo polar de velocidades para veleros
+Velocidad del barco en función del viento y del rumbo, evaluada para flotas completas con NumPy
+"""
+
+import time
+
+import numpy as np
+
+from .embarcacion import Embarcacion
+from .velero import Velero
+
+
+class ModeloPolar:
+    """Tabla polar: velocidad del barco (nudos) según viento real (nudos) y rumbo"""
+    
+    # Rumbos de la tabla, en el mismo orden que sus códigos numéricos
+    RUMBOS = ["ceñida", "empopada"]
+    
+    # Tabla por defecto para un velero de un mástil
+    VIENTOS_POR_DEFECTO = [0, 4, 6, 8, 10, 12, 16, 20, 25, 30]
+    POLAR_POR_DEFECTO = {
+        "ceñida": [0.0, 2.5, 3.6, 4.5, 5.2, 5.6, 6.0, 6.2, 6.1, 5.8],
+        "empopada": [0.0, 3.0, 4.2, 5.3, 6.2, 7.0, 8.2, 9.3, 10.5, 11.0],
+    }
+    
+    # Incremento de velocidad por cada mástil adicional
+    FACTOR_MASTIL = 0.15
+    
+    def __init__(self, vientos=None, polar=None, factor_mastil=None):
+        """Constructor de ModeloPolar"""
+        
+        if vientos is None:
+            vientos = ModeloPolar.VIENTOS_POR_DEFECTO
+        if polar is None:
+            polar = ModeloPolar.POLAR_POR_DEFECTO
+        if factor_mastil is None:
+            factor_mastil = ModeloPolar.FACTOR_MASTIL
+        
+        # Validaciones
+        vientos = np.asarray(vientos, dtype=np.float64)
+        if vientos.ndim != 1 or len(vientos) < 2 or np.any(np.diff(vientos) <= 0):
+            raise ValueError("Los vientos de la tabla polar deben ser al menos dos valores estrictamente crecientes.")
+        
+        for rumbo in ModeloPolar.RUMBOS:
+            if rumbo not in polar:
+                raise ValueError(f"La tabla polar no tiene velocidades para el rumbo {rumbo}.")
+            if len(polar[rumbo]) != len(vientos):
+                raise ValueError(f"La tabla polar del rumbo {rumbo} no tiene una velocidad por cada viento.")
+        
+        if factor_mastil < 0:
+            raise ValueError("El factor por mástil no puede ser negativo.")
+        
+        self._vientos = vientos
+        self._tabla = np.array([polar[rumbo] for rumbo in ModeloPolar.RUMBOS], dtype=np.float64)
+        self._factor_mastil = factor_mastil
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_vientos(self):
+        return self._vientos.copy()
+    
+    def get_factor_mastil(self):
+        return self._factor_mastil
+    
+    # ========== EVALUACIÓN ==========
+    
+    @staticmethod
+    def codigo_rumbo(rumbo):
+        """Código numérico de un rumbo de velero"""
+        if rumbo not in ModeloPolar.RUMBOS:
+            raise ValueError("El rumbo no es correcto, debe ser ceñida o empopada.")
+        return ModeloPolar.RUMBOS.index(rumbo)
+    
+    def velocidad(self, viento, rumbo, num_mastiles):
+        """Velocidad de un único velero"""
+        return float(self.velocidades(viento, [ModeloPolar.codigo_rumbo(rumbo)], [num_mastiles])[0])
+    
+    def velocidades(self, viento, codigos_rumbo, mastiles):
+        """Velocidades de una flota completa (viento escalar o uno por barco)"""
+        
+        codigos_rumbo = np.asarray(codigos_rumbo, dtype=np.intp)
+        mastiles = np.asarray(mastiles, dtype=np.float64)
+        viento = np.broadcast_to(np.asarray(viento, dtype=np.float64), codigos_rumbo.shape)
+        
+        # Interpolación lineal por rumbo (un np.interp por columna de la tabla)
+        resultado = np.empty(codigos_rumbo.shape, dtype=np.float64)
+        for codigo in range(len(ModeloPolar.RUMBOS)):
+            seleccion = codigos_rumbo == codigo
+            resultado[seleccion] = np.interp(viento[seleccion], self._vientos, self._tabla[codigo])
+        
+        # Escalado por número de mástiles y recorte a los límites del Velero
+        resultado *= 1.0 + self._factor_mastil * (mastiles - Velero.MIN_MASTILES)
+        np.clip(resultado, Velero.MIN_VELOCIDAD_VELERO, Velero.MAX_VELOCIDAD_VELERO, out=resultado)
+        return resultado
+
+
+class SimulacionViento:
+    """Simulación paso a paso de una flota de veleros navegando con viento variable"""
+    
+    def __init__(self, veleros, modelo=None):
+        """Constructor de SimulacionViento"""
+        
+        if veleros is None:
+            raise ValueError("La flota a simular no existe.")
+        
+        self._modelo = modelo if modelo is not None else ModeloPolar()
+        self._veleros = []
+        codigos = []
+        mastiles = []
+        
+        # Solo participan los veleros navegando con un rumbo de la tabla
+        for velero in veleros:
+            if velero._navegando and velero._rumbo in ModeloPolar.RUMBOS:
+                self._veleros.append(velero)
+                codigos.append(ModeloPolar.RUMBOS.index(velero._rumbo))
+                mastiles.append(velero._num_mastiles)
+        
+        self._codigos = np.array(codigos, dtype=np.intp)
+        self._mastiles = np.array(mastiles, dtype=np.float64)
+        self._distancias = np.zeros(len(self._veleros), dtype=np.float64)
+        self._activos = np.ones(len(self._veleros), dtype=bool)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_veleros(self):
+        return len(self._veleros)
+    
+    def get_distancias(self):
+        return self._distancias.copy()
+    
+    # ========== SIMULACIÓN ==========
+    
+    def actualizar_rumbos(self):
+        """
+        Vuelve a leer los rumbos de los veleros tras cambios con set_rumbo. Los que han vuelto a
+        puerto o llevan un rumbo fuera de la tabla dejan de avanzar pero conservan su distancia.
+        """
+        
+        for i, velero in enumerate(self._veleros):
+            if velero._navegando and velero._rumbo in ModeloPolar.RUMBOS:
+                self._codigos[i] = ModeloPolar.RUMBOS.index(velero._rumbo)
+                self._activos[i] = True
+            else:
+                self._activos[i] = False
+    
+    def paso(self, viento, horas=0.0):
+        """
+        Avanza un paso: calcula velocidades, las asigna a los veleros y acumula distancia. Un velero
+        que ha vuelto a puerto no avanza ni recibe velocidad aunque no se haya llamado a actualizar_rumbos.
+        """
+        
+        # El estado de navegación se lee en cada paso: parar_navegacion no pasa por la simulación
+        activos = self._activos & np.fromiter((velero._navegando for velero in self._veleros),
+                                              dtype=bool, count=len(self._veleros))
+        
+        velocidades = self._modelo.velocidades(viento, self._codigos, self._mastiles)
+        velocidades[~activos] = 0.0
+        
+        # Los oyentes (agregados, índices) reciben cada cambio de velocidad como cualquier otro cambio de estado
+        notificar = bool(Embarcacion._oyentes)
+        for velero, activo, velocidad in zip(self._veleros, activos.tolist(), velocidades.tolist()):
+            if activo:
+                velocidad_anterior = velero._velocidad
+                velero._velocidad = velocidad
+                if notificar and velocidad != velocidad_anterior:
+                    velero._notificar("al_cambiar_velocidad", velocidad_anterior)
+        
+        if horas:
+            self._distancias += velocidades * horas
+        
+        return velocidades
+    
+    def clasificacion(self):
+        """Veleros ordenados por distancia recorrida (mayor primero)"""
+        return [self._veleros[i] for i in np.argsort(-self._distancias, kind="stable")]
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_veleros=10_000, pasos=100, semilla=1):
+    """Mide el coste por paso de simulación frente al cálculo barco a barco"""
+    
+    generador = np.random.default_rng(semilla)
+    veleros = []
+    for i in range(num_veleros):
+        velero = Velero(f"Polar {i}", 1 + i % Velero.MAX_MASTILES, 2)
+        velero.iniciar_navegacion(10, ModeloPolar.RUMBOS[i % 2], "Bench", 1)
+        veleros.append(velero)
+    
+    modelo = ModeloPolar()
+    simulacion = SimulacionViento(veleros, modelo)
+    
+    inicio = time.perf_counter()
+    for _ in range(pasos):
+        simulacion.paso(generador.uniform(4, 25, num_veleros), horas=0.1)
+    vectorizado = (time.perf_counter() - inicio) / pasos
+    
+    inicio = time.perf_counter()
+    for velero in veleros[:1000]:
+        velero._velocidad = modelo.velocidad(12.0, velero._rumbo, velero._num_mastiles)
+    escalar = (time.perf_counter() - inicio) / 1000 * num_veleros
+    
+    print(f"{num_veleros} veleros: {vectorizado * 1000:.2f} ms/paso vectorizado, {escalar * 1000:.2f} ms/paso barco a barco")
+    
+    for velero in veleros:
+        velero.parar_navegacion(0)
+    
+    return vectorizado, escalar
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
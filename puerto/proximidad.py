@@ -0,0 +1,242 @@
+"""
+Detección de proximidad entre embarcaciones
+Alertas de colisión mediante hash espacial (fase amplia) y distancia exacta (fase fina)
+"""
+
+import math
+import random
+import time
+
+
+class DetectorProximidad:
+    """Detecta parejas de embarcaciones dentro de un radio de seguridad"""
+    
+    # Vecindario de celdas a revisar alrededor de la celda de cada barco
+    VECINOS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    
+    def __init__(self, radio_seguridad, accion=None):
+        """Constructor de DetectorProximidad"""
+        
+        # Validaciones
+        if radio_seguridad is None or radio_seguridad <= 0:
+            raise ValueError("El radio de seguridad debe ser mayor que cero.")
+        
+        self._radio = radio_seguridad
+        self._radio_cuadrado = radio_seguridad * radio_seguridad
+        
+        # Las celdas miden lo mismo que el radio: basta con mirar las 9 celdas vecinas
+        self._tam_celda = radio_seguridad
+        
+        # Acción a ejecutar sobre cada barco alertado (por defecto, su señalización)
+        self._accion = accion if accion is not None else DetectorProximidad._señalizar
+        
+        # Estado por barco: posición y celda actual
+        self._posiciones = {}
+        self._celda_de = {}
+        
+        # Hash espacial: celda -> conjunto de barcos
+        self._celdas = {}
+        
+        # Barcos movidos desde el último tick y parejas actualmente en alerta
+        self._movidos = set()
+        self._alertas = {}
+        self._num_alertas_emitidas = 0
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_radio_seguridad(self):
+        return self._radio
+    
+    def get_num_barcos(self):
+        return len(self._posiciones)
+    
+    def get_parejas_en_alerta(self):
+        return list(self._alertas.values())
+    
+    def get_num_alertas_emitidas(self):
+        return self._num_alertas_emitidas
+    
+    def get_posicion(self, barco):
+        return self._posiciones.get(barco)
+    
+    # ========== ACTUALIZACIÓN INCREMENTAL ==========
+    
+    def actualizar_posicion(self, barco, x, y):
+        """Registra la nueva posición de un barco, moviéndolo de celda solo si cambia"""
+        
+        if barco is None:
+            raise ValueError("El barco cuya posición se actualiza no existe.")
+        
+        celda = (math.floor(x / self._tam_celda), math.floor(y / self._tam_celda))
+        celda_anterior = self._celda_de.get(barco)
+        
+        if celda_anterior != celda:
+            if celda_anterior is not None:
+                self._quitar_de_celda(barco, celda_anterior)
+            
+            ocupantes = self._celdas.get(celda)
+            if ocupantes is None:
+                ocupantes = self._celdas[celda] = set()
+            ocupantes.add(barco)
+            self._celda_de[barco] = celda
+        
+        self._posiciones[barco] = (x, y)
+        self._movidos.add(barco)
+    
+    def eliminar(self, barco):
+        """Retira un barco del detector (por ejemplo, al volver a puerto)"""
+        
+        celda = self._celda_de.pop(barco, None)
+        if celda is None:
+            return
+        
+        self._quitar_de_celda(barco, celda)
+        del self._posiciones[barco]
+        self._movidos.discard(barco)
+        
+        for clave in [clave for clave in self._alertas if barco in self._alertas[clave]]:
+            del self._alertas[clave]
+    
+    def _quitar_de_celda(self, barco, celda):
+        ocupantes = self._celdas[celda]
+        ocupantes.discard(barco)
+        if not ocupantes:
+            del self._celdas[celda]
+    
+    # ========== DETECCIÓN ==========
+    
+    def detectar(self):
+        """Recalcula las alertas de los barcos movidos y devuelve las parejas nuevas"""
+        
+        posiciones = self._posiciones
+        celdas = self._celdas
+        radio_cuadrado = self._radio_cuadrado
+        
+        nuevas = []
+        confirmadas = set()
+        
+        for barco in self._movidos:
+            if not barco._navegando:
+                continue
+            
+            x, y = posiciones[barco]
+            cx, cy = self._celda_de[barco]
+            
+            # Fase amplia: solo los ocupantes de las celdas vecinas
+            for dx, dy in DetectorProximidad.VECINOS:
+                ocupantes = celdas.get((cx + dx, cy + dy))
+                if not ocupantes:
+                    continue
+                
+                for otro in ocupantes:
+                    if otro is barco or not otro._navegando:
+                        continue
+                    
+                    # Fase fina: distancia euclídea exacta
+                    ox, oy = posiciones[otro]
+                    if (x - ox) * (x - ox) + (y - oy) * (y - oy) > radio_cuadrado:
+                        continue
+                    
+                    clave = (id(barco), id(otro)) if id(barco) < id(otro) else (id(otro), id(barco))
+                    if clave in confirmadas:
+                        continue
+                    
+                    confirmadas.add(clave)
+                    if clave not in self._alertas:
+                        self._alertas[clave] = (barco, otro)
+                        nuevas.append((barco, otro))
+        
+        # Las parejas con algún barco movido que ya no se confirman dejan de estar en alerta
+        if self._movidos:
+            ids_movidos = {id(barco) for barco in self._movidos}
+            for clave in list(self._alertas):
+                if clave in confirmadas:
+                    continue
+                if clave[0] in ids_movidos or clave[1] in ids_movidos:
+                    del self._alertas[clave]
+        
+        self._movidos.clear()
+        return nuevas
+    
+    def procesar(self):
+        """Ejecuta un tick: detecta parejas nuevas y señaliza una sola vez a cada barco implicado"""
+        
+        nuevas = self.detectar()
+        
+        # Deduplicar: un barco en varias parejas nuevas solo se señaliza una vez por tick
+        avisados = set()
+        for barco, otro in nuevas:
+            for implicado in (barco, otro):
+                if implicado not in avisados:
+                    avisados.add(implicado)
+                    self._accion(implicado)
+        
+        self._num_alertas_emitidas += len(avisados)
+        return nuevas
+    
+    @staticmethod
+    def _señalizar(barco):
+        barco.señalizar()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(tamanos=(10_000, 100_000, 1_000_000), ticks=3, densidad=0.5, semilla=1):
+    """Mide el tiempo por tick con barcos en movimiento para distintos tamaños de flota"""
+    
+    from .lancha import Lancha
+    from .velero import Velero
+    
+    generador = random.Random(semilla)
+    resultados = []
+    
+    for tamano in tamanos:
+        # Mantener constante el número medio de vecinos por celda
+        radio = 1.0
+        lado = math.sqrt(tamano / densidad) * radio
+        
+        barcos = []
+        for i in range(tamano):
+            if i % 2 == 0:
+                barco = Lancha(f"Bench L{i}", 2, 1, 30)
+                barco.iniciar_navegacion(20, "norte", "Bench", 1)
+            else:
+                barco = Velero(f"Bench V{i}", 1, 2)
+                barco.iniciar_navegacion(10, "ceñida", "Bench", 1)
+            barcos.append(barco)
+        
+        contador = [0]
+        
+        def contar(barco):
+            contador[0] += 1
+        
+        detector = DetectorProximidad(radio, accion=contar)
+        coordenadas = [[generador.uniform(0, lado), generador.uniform(0, lado)] for _ in range(tamano)]
+        
+        for barco, (x, y) in zip(barcos, coordenadas):
+            detector.actualizar_posicion(barco, x, y)
+        detector.procesar()
+        
+        inicio = time.perf_counter()
+        for _ in range(ticks):
+            for barco, posicion in zip(barcos, coordenadas):
+                posicion[0] += generador.uniform(-0.2, 0.2)
+                posicion[1] += generador.uniform(-0.2, 0.2)
+                detector.actualizar_posicion(barco, posicion[0], posicion[1])
+            detector.procesar()
+        segundos = (time.perf_counter() - inicio) / ticks
+        
+        resultados.append((tamano, segundos, len(detector.get_parejas_en_alerta()), contador[0]))
+        print(
+            f"{tamano:>9} barcos: {segundos * 1000:10.1f} ms/tick, "
+            f"{len(detector.get_parejas_en_alerta())} parejas en alerta, {contador[0]} señalizaciones"
+        )
+        
+        for barco in barcos:
+            barco.parar_navegacion(0)
+    
+    return resultados
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Registro de embarcaciones vivas
+Sigue las instancias existentes con referencias débiles, sin impedir que se liberen
+"""
+
+import gc
+import time
+import weakref
+
+
+class RegistroEmbarcaciones:
+    """Conjunto de embarcaciones vivas agrupadas por su clase concreta"""
+    
+    def __init__(self):
+        """Constructor de RegistroEmbarcaciones"""
+        
+        # clase concreta -> WeakSet de sus instancias vivas
+        self._por_clase = {}
+    
+    def añadir(self, barco):
+        """Registra una embarcación recién creada"""
+        
+        instancias = self._por_clase.get(type(barco))
+        if instancias is None:
+            instancias = self._por_clase[type(barco)] = weakref.WeakSet()
+        instancias.add(barco)
+    
+    def añadir_lote(self, clase, barcos):
+        """Registra de una vez muchas embarcaciones de la misma clase"""
+        
+        instancias = self._por_clase.get(clase)
+        if instancias is None:
+            instancias = self._por_clase[clase] = weakref.WeakSet()
+        instancias.update(barcos)
+    
+    def _conjuntos(self, tipo):
+        if tipo is None:
+            return list(self._por_clase.values())
+        return [instancias for clase, instancias in self._por_clase.items() if issubclass(clase, tipo)]
+    
+    def num_vivos(self, tipo=None):
+        """Número de instancias vivas (de tipo o sus subclases; todas si tipo es None)"""
+        return sum(len(instancias) for instancias in self._conjuntos(tipo))
+    
+    def iterar(self, tipo=None):
+        """Recorre las instancias vivas del tipo indicado"""
+        for instancias in self._conjuntos(tipo):
+            yield from instancias
+    
+    def compactar(self):
+        """Reconstruye los conjuntos para devolver la memoria de las instancias ya liberadas"""
+        for clase, instancias in self._por_clase.items():
+            self._por_clase[clase] = weakref.WeakSet(instancias)
+    
+    def vaciar(self):
+        self._por_clase.clear()
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=1_000_000):
+    """Comprueba que los barcos descartados se liberan y mide la iteración del registro"""
+    
+    import tracemalloc
+    
+    from .embarcacion import Embarcacion
+    from .lancha import Lancha
+    from .velero import Velero
+    
+    gc.collect()
+    tracemalloc.start()
+    memoria_inicial = tracemalloc.get_traced_memory()[0]
+    vivos_iniciales = Embarcacion.get_num_barcos_vivos()
+    creados_iniciales = Embarcacion.get_num_barcos()
+    
+    barcos = [Lancha(f"Registro {i}", 2, 1, 30) if i % 2 == 0 else Velero(f"Registro {i}", 1, 2)
+              for i in range(num_barcos)]
+    memoria_con_flota = tracemalloc.get_traced_memory()[0]
+    
+    inicio = time.perf_counter()
+    num_lanchas = sum(1 for _ in Lancha.barcos_vivos())
+    iteracion = time.perf_counter() - inicio
+    
+    print(f"{num_barcos} barcos creados, {Embarcacion.get_num_barcos_vivos() - vivos_iniciales} vivos")
+    print(f"  iteración de {num_lanchas} lanchas vivas: {iteracion * 1000:.1f} ms")
+    print(f"  memoria con la flota: {(memoria_con_flota - memoria_inicial) / 1e6:.1f} MB")
+    
+    del barcos
+    gc.collect()
+    Embarcacion._registro.compactar()
+    memoria_final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    liberados = Embarcacion.get_num_barcos_vivos() == vivos_iniciales
+    print(f"  tras descartarlos: {Embarcacion.get_num_barcos_vivos() - vivos_iniciales} vivos, "
+          f"{Embarcacion.get_num_barcos() - creados_iniciales} creados, "
+          f"memoria retenida {(memoria_final - memoria_inicial) / 1e6:.1f} MB")
+    
+    if not liberados:
+        raise Exception("El registro mantiene vivas embarcaciones descartadas.")
+    
+    return iteracion, memoria_final - memoria_inicial
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
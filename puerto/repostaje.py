@@ -0,0 +1,204 @@
+"""
+Planificador de repostaje
+Ordena las lanchas con poco combustible entre un número limitado de surtidores,
+minimizando la espera acumulada antes de su siguiente salida
+"""
+
+import heapq
+import random
+import time
+
+from .lancha import Lancha
+
+
+class TurnoRepostaje:
+    """Turno asignado a una lancha en un surtidor"""
+    
+    def __init__(self, lancha, surtidor, llegada, inicio, fin, salida_prevista):
+        """Constructor de TurnoRepostaje"""
+        
+        self._lancha = lancha
+        self._surtidor = surtidor
+        self._llegada = llegada
+        self._inicio = inicio
+        self._fin = fin
+        self._salida_prevista = salida_prevista
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_lancha(self):
+        return self._lancha
+    
+    def get_surtidor(self):
+        return self._surtidor
+    
+    def get_inicio(self):
+        return self._inicio
+    
+    def get_fin(self):
+        return self._fin
+    
+    def get_espera(self):
+        """Tiempo en cola antes de empezar a repostar"""
+        return self._inicio - self._llegada
+    
+    def get_retraso(self):
+        """Tiempo que la salida prevista se retrasa por el repostaje"""
+        return max(0.0, self._fin - self._salida_prevista)
+    
+    def __str__(self):
+        return (
+            f"{self._lancha.get_nombre_barco()}: surtidor {self._surtidor}, "
+            f"de {self._inicio:.2f} a {self._fin:.2f} h (retraso {self.get_retraso():.2f} h)"
+        )
+
+
+class PlanificadorRepostaje:
+    """Simulación por eventos discretos de una estación de repostaje con varios surtidores"""
+    
+    # Unidades de combustible por hora de cada surtidor y tiempo fijo de atraque y maniobra
+    CAUDAL_POR_DEFECTO = 60.0
+    MANIOBRA_POR_DEFECTO = 0.1
+    
+    POLITICA_SALIDA = "salida"
+    POLITICA_LLEGADA = "llegada"
+    
+    def __init__(self, num_surtidores, caudal=None, maniobra=None, politica="salida"):
+        """Constructor de PlanificadorRepostaje"""
+        
+        if caudal is None:
+            caudal = PlanificadorRepostaje.CAUDAL_POR_DEFECTO
+        if maniobra is None:
+            maniobra = PlanificadorRepostaje.MANIOBRA_POR_DEFECTO
+        
+        # Validaciones
+        if num_surtidores < 1:
+            raise ValueError("La estación necesita al menos un surtidor.")
+        
+        if caudal <= 0:
+            raise ValueError("El caudal de los surtidores debe ser mayor que cero.")
+        
+        if maniobra < 0:
+            raise ValueError("El tiempo de maniobra no puede ser negativo.")
+        
+        if politica not in (PlanificadorRepostaje.POLITICA_SALIDA, PlanificadorRepostaje.POLITICA_LLEGADA):
+            raise ValueError("La política debe ser por salida prevista o por orden de llegada.")
+        
+        self._num_surtidores = num_surtidores
+        self._caudal = caudal
+        self._maniobra = maniobra
+        self._politica = politica
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_num_surtidores(self):
+        return self._num_surtidores
+    
+    def duracion(self, lancha):
+        """Horas de surtidor necesarias para llenar el depósito de la lancha"""
+        return self._maniobra + (Lancha.MAX_COMBUSTIBLE - lancha.get_cantidad_combustible()) / self._caudal
+    
+    # ========== PLANIFICACIÓN ==========
+    
+    @staticmethod
+    def necesitan_repostar(lanchas, umbral=None):
+        """Lanchas en puerto por debajo del umbral (por defecto, las que no pueden salir)"""
+        
+        if umbral is None:
+            umbral = Lancha.MIN_COMBUSTIBLE
+        return [lancha for lancha in lanchas
+                if not lancha.is_navegando() and lancha.get_cantidad_combustible() < umbral]
+    
+    def planificar(self, solicitudes):
+        """solicitudes: (lancha, llegada al muelle, salida prevista) en horas. Devuelve los turnos."""
+        
+        # Eventos de llegada ordenados por tiempo
+        llegadas = sorted(
+            ((llegada, salida_prevista, i, lancha) for i, (lancha, llegada, salida_prevista) in enumerate(solicitudes)),
+            key=lambda solicitud: (solicitud[0], solicitud[2]),
+        )
+        
+        # Surtidores libres: (instante en que quedan libres, número)
+        surtidores = [(0.0, numero) for numero in range(self._num_surtidores)]
+        heapq.heapify(surtidores)
+        
+        # Cola de espera con prioridad según la política
+        cola = []
+        turnos = []
+        siguiente = 0
+        
+        while siguiente < len(llegadas) or cola:
+            libre, numero = heapq.heappop(surtidores)
+            
+            # Si no espera nadie, el surtidor salta a la próxima llegada
+            if not cola and llegadas[siguiente][0] > libre:
+                libre = llegadas[siguiente][0]
+            
+            # Pasan a la cola todas las lanchas llegadas hasta que el surtidor queda libre
+            while siguiente < len(llegadas) and llegadas[siguiente][0] <= libre:
+                llegada, salida_prevista, i, lancha = llegadas[siguiente]
+                duracion = self.duracion(lancha)
+                if self._politica == PlanificadorRepostaje.POLITICA_SALIDA:
+                    # Primero la salida más próxima; a igualdad, el repostaje más corto
+                    prioridad = (salida_prevista, duracion, i)
+                else:
+                    prioridad = (llegada, i)
+                heapq.heappush(cola, (prioridad, llegada, salida_prevista, duracion, lancha))
+                siguiente += 1
+            
+            _, llegada, salida_prevista, duracion, lancha = heapq.heappop(cola)
+            fin = libre + duracion
+            turnos.append(TurnoRepostaje(lancha, numero, llegada, libre, fin, salida_prevista))
+            heapq.heappush(surtidores, (fin, numero))
+        
+        return turnos
+    
+    @staticmethod
+    def ejecutar(turnos):
+        """Reposta las lanchas en el orden de los turnos"""
+        for turno in sorted(turnos, key=TurnoRepostaje.get_inicio):
+            turno.get_lancha().repostar()
+    
+    @staticmethod
+    def resumen(turnos):
+        """Espera total, retraso total y número de salidas retrasadas"""
+        return {
+            "turnos": len(turnos),
+            "espera_total": sum(turno.get_espera() for turno in turnos),
+            "retraso_total": sum(turno.get_retraso() for turno in turnos),
+            "salidas_retrasadas": sum(1 for turno in turnos if turno.get_retraso() > 0),
+        }
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_lanchas=2_000, num_surtidores=70, semilla=1):
+    """Compara la política por salida prevista con el orden de llegada en una jornada simulada"""
+    
+    generador = random.Random(semilla)
+    solicitudes = []
+    for i in range(num_lanchas):
+        lancha = Lancha(f"Repostaje {i}", 2, 1, Lancha.MIN_COMBUSTIBLE)
+        lancha.iniciar_navegacion(Lancha.MAX_VELOCIDAD_LANCHA, "norte", "Bench", 0)
+        lancha.parar_navegacion(generador.uniform(0, 6))
+        llegada = generador.uniform(0, 24)
+        solicitudes.append((lancha, llegada, llegada + generador.uniform(0.5, 6)))
+    
+    resultados = {}
+    for politica in (PlanificadorRepostaje.POLITICA_LLEGADA, PlanificadorRepostaje.POLITICA_SALIDA):
+        planificador = PlanificadorRepostaje(num_surtidores, politica=politica)
+        inicio = time.perf_counter()
+        turnos = planificador.planificar(solicitudes)
+        segundos = time.perf_counter() - inicio
+        resultados[politica] = PlanificadorRepostaje.resumen(turnos)
+        print(f"política {politica:>8}: {segundos * 1000:7.1f} ms, "
+              f"espera total {resultados[politica]['espera_total']:9.1f} h, "
+              f"retraso total {resultados[politica]['retraso_total']:9.1f} h, "
+              f"{resultados[politica]['salidas_retrasadas']} salidas retrasadas")
+    
+    PlanificadorRepostaje.ejecutar(turnos)
+    return resultados
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,380 @@
+"""
+Planificación de rutas de lanchas
+Grafo de puntos de paso con límites de velocidad por tramo. Para cada velocidad de crucero se
+calculan (y se guardan) los tiempos mínimos desde el puerto; con ellos se elige, para cada lancha,
+la velocidad más rápida cuyo consumo cabe en su depósito, con el mismo modelo que
+Lancha._consumir_combustible: int(velocidad * horas * FACTOR_COMBUSTIBLE)
+"""
+
+import heapq
+import math
+import time
+from bisect import bisect_right
+
+from .lancha import Lancha
+
+
+class PlanRuta:
+    """Ruta elegida para una lancha: velocidad de crucero, puntos de paso, tiempo y consumo"""
+    
+    def __init__(self, lancha, velocidad, ruta, distancia, horas, combustible_ida, combustible_vuelta, rumbo):
+        """Constructor de PlanRuta (combustible_vuelta es None si el plan es solo de ida)"""
+        
+        self._lancha = lancha
+        
+        # Combustible al planificar: el de la lancha cambia en cuanto se ejecuta el plan
+        self._combustible_inicial = lancha._cantidad_combustible
+        self._velocidad = velocidad
+        self._ruta = ruta
+        self._distancia = distancia
+        self._horas = horas
+        self._combustible_ida = combustible_ida
+        self._combustible_vuelta = combustible_vuelta
+        self._rumbo = rumbo
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_lancha(self):
+        return self._lancha
+    
+    def get_velocidad(self):
+        return self._velocidad
+    
+    def get_ruta(self):
+        return list(self._ruta)
+    
+    def get_distancia(self):
+        return self._distancia
+    
+    def get_horas(self):
+        """Horas de la ida (la vuelta, por el mismo camino, tarda lo mismo)"""
+        return self._horas
+    
+    def get_combustible_ida(self):
+        return self._combustible_ida
+    
+    def get_combustible_vuelta(self):
+        return self._combustible_vuelta
+    
+    def get_combustible_inicial(self):
+        return self._combustible_inicial
+    
+    def get_combustible_restante(self):
+        """Combustible que quedará al terminar el plan, calculado con el que tenía la lancha al planificar"""
+        restante = self._combustible_inicial - self._combustible_ida
+        return restante - (self._combustible_vuelta or 0)
+    
+    def get_rumbo(self):
+        """Rumbo del primer tramo, para iniciar_navegacion"""
+        return self._rumbo
+    
+    def get_eta(self, salida=None):
+        """Instante de llegada al destino saliendo en salida (por defecto, ahora)"""
+        salida = salida if salida is not None else time.time()
+        return salida + self._horas * 3600
+    
+    # ========== EJECUCIÓN ==========
+    
+    def iniciar(self, patron, num_tripulantes):
+        """Pone en marcha la lancha con la velocidad y el rumbo del plan"""
+        self._lancha.iniciar_navegacion(self._velocidad, self._rumbo, patron, num_tripulantes)
+    
+    def __repr__(self):
+        return (f"PlanRuta({self._lancha.get_nombre_barco()}, {self._velocidad} nudos, {len(self._ruta) - 1} tramos, "
+                f"{self._horas:.2f} h, combustible {self._combustible_ida}+{self._combustible_vuelta or 0})")
+
+
+class PlanificadorRutas:
+    """Grafo de puntos de paso y planificación de rutas con restricción de combustible"""
+    
+    def __init__(self, puerto="Puerto", x=0.0, y=0.0, velocidades=None):
+        """Constructor de PlanificadorRutas (puerto: punto de partida por defecto, en la posición x, y)"""
+        
+        velocidades = sorted(set(velocidades if velocidades is not None else
+                                 range(Lancha.MIN_VELOCIDAD_LANCHA, Lancha.MAX_VELOCIDAD_LANCHA + 1)))
+        
+        # Validaciones
+        if not velocidades:
+            raise ValueError("Se necesita al menos una velocidad de crucero.")
+        
+        if velocidades[0] < Lancha.MIN_VELOCIDAD_LANCHA or velocidades[-1] > Lancha.MAX_VELOCIDAD_LANCHA:
+            raise ValueError(
+                f"Las velocidades deben estar entre {Lancha.MIN_VELOCIDAD_LANCHA} y {Lancha.MAX_VELOCIDAD_LANCHA} nudos."
+            )
+        
+        self._velocidades = velocidades
+        self._puerto = puerto
+        
+        # Punto -> (x, y) en millas; punto -> [(vecino, distancia, velocidad máxima o None)]
+        self._posiciones = {}
+        self._tramos = {}
+        
+        # Cachés: (origen, velocidad) -> (horas, predecesor); (origen, destino) -> consumos por velocidad
+        self._tiempos = {}
+        self._consumos = {}
+        
+        self.añadir_punto(puerto, x, y)
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_puerto(self):
+        return self._puerto
+    
+    def get_num_puntos(self):
+        return len(self._posiciones)
+    
+    def get_velocidades(self):
+        return list(self._velocidades)
+    
+    # ========== GRAFO ==========
+    
+    def añadir_punto(self, nombre, x, y):
+        if nombre in self._posiciones:
+            raise ValueError(f"El punto de paso {nombre} ya existe.")
+        self._posiciones[nombre] = (x, y)
+        self._tramos[nombre] = []
+        self._invalidar()
+    
+    def conectar(self, a, b, velocidad_maxima=None):
+        """Tramo navegable en los dos sentidos; la distancia se calcula una vez con las posiciones"""
+        
+        for punto in (a, b):
+            if punto not in self._posiciones:
+                raise ValueError(f"El punto de paso {punto} no existe.")
+        
+        if a == b:
+            raise ValueError("Un tramo debe unir dos puntos distintos.")
+        
+        if velocidad_maxima is not None and velocidad_maxima <= 0:
+            raise ValueError("La velocidad máxima de un tramo debe ser mayor que cero.")
+        
+        (xa, ya), (xb, yb) = self._posiciones[a], self._posiciones[b]
+        distancia = math.hypot(xb - xa, yb - ya)
+        self._tramos[a].append((b, distancia, velocidad_maxima))
+        self._tramos[b].append((a, distancia, velocidad_maxima))
+        self._invalidar()
+    
+    def _invalidar(self):
+        self._tiempos.clear()
+        self._consumos.clear()
+    
+    # ========== CAMINOS MÍNIMOS ==========
+    
+    def _tiempos_desde(self, origen, velocidad):
+        """Dijkstra en horas a la velocidad de crucero dada (más lenta en los tramos limitados)"""
+        
+        clave = (origen, velocidad)
+        resultado = self._tiempos.get(clave)
+        if resultado is not None:
+            return resultado
+        
+        horas = {origen: 0.0}
+        predecesor = {origen: None}
+        pendientes = [(0.0, origen)]
+        while pendientes:
+            hasta_aqui, punto = heapq.heappop(pendientes)
+            if hasta_aqui > horas[punto]:
+                continue
+            for vecino, distancia, maxima in self._tramos[punto]:
+                nuevo = hasta_aqui + distancia / (velocidad if maxima is None or velocidad <= maxima else maxima)
+                if nuevo < horas.get(vecino, math.inf):
+                    horas[vecino] = nuevo
+                    predecesor[vecino] = punto
+                    heapq.heappush(pendientes, (nuevo, vecino))
+        
+        resultado = self._tiempos[clave] = (horas, predecesor)
+        return resultado
+    
+    def precalcular(self, origen=None):
+        """Calcula de antemano los tiempos desde origen (el puerto) a todas las velocidades"""
+        
+        origen = origen if origen is not None else self._puerto
+        self._validar_punto(origen)
+        for velocidad in self._velocidades:
+            self._tiempos_desde(origen, velocidad)
+    
+    def _consumos_hasta(self, origen, destino):
+        """
+        Horas y consumo de ida a cada velocidad. A velocidad fija, el camino más rápido es también
+        el de menor consumo (consumo = velocidad * horas * factor), y el consumo no baja al subir la
+        velocidad: la lista de consumos está ordenada y admite búsqueda binaria.
+        """
+        
+        clave = (origen, destino)
+        resultado = self._consumos.get(clave)
+        if resultado is not None:
+            return resultado
+        
+        horas = []
+        consumos = []
+        for velocidad in self._velocidades:
+            tiempo = self._tiempos_desde(origen, velocidad)[0].get(destino)
+            if tiempo is None:
+                horas = consumos = None
+                break
+            horas.append(tiempo)
+            consumos.append(int(velocidad * tiempo * Lancha.FACTOR_COMBUSTIBLE))
+        
+        resultado = self._consumos[clave] = (horas, consumos)
+        return resultado
+    
+    def ruta(self, destino, velocidad, origen=None):
+        """Puntos de paso del camino más rápido a esa velocidad, o None si el destino es inalcanzable"""
+        
+        origen = origen if origen is not None else self._puerto
+        self._validar_punto(origen)
+        self._validar_punto(destino)
+        
+        predecesor = self._tiempos_desde(origen, velocidad)[1]
+        if destino not in predecesor:
+            return None
+        ruta = [destino]
+        while ruta[-1] != origen:
+            ruta.append(predecesor[ruta[-1]])
+        ruta.reverse()
+        return ruta
+    
+    def _validar_punto(self, punto):
+        if punto not in self._posiciones:
+            raise ValueError(f"El punto de paso {punto} no existe.")
+    
+    # ========== PLANIFICACIÓN ==========
+    
+    def _combustible_maximo(self, combustible, ida_y_vuelta):
+        """Mayor consumo de ida que se puede permitir una lancha con ese combustible"""
+        
+        if combustible < Lancha.MIN_COMBUSTIBLE:
+            return -1
+        if not ida_y_vuelta:
+            return combustible
+        
+        # Al llegar debe quedar un nivel válido para volver a salir y el consumo de la vuelta,
+        # que por el mismo camino es igual al de la ida
+        return min(combustible - Lancha.MIN_COMBUSTIBLE, combustible // 2)
+    
+    def planificar(self, lancha, destino, origen=None, ida_y_vuelta=True):
+        """Plan más rápido que cabe en el depósito, o None si la lancha no puede llegar (y volver)"""
+        
+        if lancha is None:
+            raise ValueError("La lancha a planificar no existe.")
+        
+        # Como en planificar_lote, una lancha que navega no está disponible
+        if lancha._navegando:
+            raise Exception(f"La embarcación {lancha._nombre} ya está navegando y se encuentra fuera de puerto.")
+        
+        origen = origen if origen is not None else self._puerto
+        self._validar_punto(origen)
+        self._validar_punto(destino)
+        return self._plan(lancha, origen, destino, ida_y_vuelta, *self._consumos_hasta(origen, destino))
+    
+    def _plan(self, lancha, origen, destino, ida_y_vuelta, horas, consumos):
+        if consumos is None:
+            return None
+        
+        # La velocidad más alta cuyo consumo no supera el máximo permitido
+        indice = bisect_right(consumos, self._combustible_maximo(lancha._cantidad_combustible, ida_y_vuelta)) - 1
+        if indice < 0:
+            return None
+        
+        velocidad = self._velocidades[indice]
+        ruta = self.ruta(destino, velocidad, origen)
+        distancia = sum(math.dist(self._posiciones[a], self._posiciones[b]) for a, b in zip(ruta, ruta[1:]))
+        combustible = consumos[indice]
+        return PlanRuta(lancha, velocidad, ruta, distancia, horas[indice], combustible,
+                        combustible if ida_y_vuelta else None, self._rumbo(ruta))
+    
+    def _rumbo(self, ruta):
+        """Rumbo de Lancha más cercano a la dirección del primer tramo"""
+        
+        if len(ruta) < 2:
+            return Lancha.RUMBOS_LANCHA[0]
+        (xa, ya), (xb, yb) = self._posiciones[ruta[0]], self._posiciones[ruta[1]]
+        if abs(yb - ya) >= abs(xb - xa):
+            return "norte" if yb >= ya else "sur"
+        return "este" if xb >= xa else "oeste"
+    
+    def planificar_lote(self, solicitudes, origen=None, ida_y_vuelta=True):
+        """
+        Planes para varias lanchas (pares lancha, destino) desde el mismo origen. Las lanchas que
+        navegan no están disponibles; para ellas, y para las que no llegan, el plan es None.
+        """
+        
+        origen = origen if origen is not None else self._puerto
+        self._validar_punto(origen)
+        self.precalcular(origen)
+        
+        planes = []
+        for lancha, destino in solicitudes:
+            if lancha._navegando:
+                planes.append(None)
+                continue
+            consumos = self._consumos.get((origen, destino))
+            if consumos is None:
+                self._validar_punto(destino)
+                consumos = self._consumos_hasta(origen, destino)
+            planes.append(self._plan(lancha, origen, destino, ida_y_vuelta, *consumos))
+        return planes
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(lado=40, num_lanchas=5_000, semilla=1):
+    """Rejilla de lado x lado puntos con zona lenta junto al puerto; planes por segundo"""
+    
+    import random
+    
+    generador = random.Random(semilla)
+    planificador = PlanificadorRutas("Puerto", 0, 0)
+    for i in range(lado):
+        for j in range(lado):
+            if (i, j) != (0, 0):
+                planificador.añadir_punto((i, j), i * 2.0, j * 2.0)
+    
+    def punto(i, j):
+        return "Puerto" if (i, j) == (0, 0) else (i, j)
+    
+    for i in range(lado):
+        for j in range(lado):
+            # Zona portuaria limitada a 5 nudos y canales a 20
+            limite = 5 if i < 3 and j < 3 else (20 if i % 10 == 0 else None)
+            if i + 1 < lado:
+                planificador.conectar(punto(i, j), punto(i + 1, j), limite)
+            if j + 1 < lado:
+                planificador.conectar(punto(i, j), punto(i, j + 1), limite)
+    
+    inicio = time.perf_counter()
+    planificador.precalcular()
+    precalculo = time.perf_counter() - inicio
+    
+    lanchas = Lancha.crear_lote(num_lanchas, 4, 2, Lancha.MAX_COMBUSTIBLE, prefijo="Ruta")
+    for lancha in lanchas:
+        lancha._cantidad_combustible = generador.randint(Lancha.MIN_COMBUSTIBLE, Lancha.MAX_COMBUSTIBLE)
+    destinos = [punto(generador.randrange(lado), generador.randrange(lado)) for _ in range(num_lanchas)]
+    solicitudes = list(zip(lanchas, destinos))
+    
+    inicio = time.perf_counter()
+    planes = planificador.planificar_lote(solicitudes)
+    lote = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for lancha, destino in solicitudes[:500]:
+        planificador.planificar(lancha, destino)
+    individual = (time.perf_counter() - inicio) / 500
+    
+    # Comprobación: ejecutar un plan con el modelo de consumo de Lancha
+    lancha, plan = next((lancha, plan) for lancha, plan in zip(lanchas, planes) if plan and plan.get_horas() > 0)
+    combustible = lancha.get_cantidad_combustible()
+    plan.iniciar("Ruta", 1)
+    lancha.parar_navegacion(plan.get_horas())
+    assert combustible - lancha.get_cantidad_combustible() == plan.get_combustible_ida()
+    
+    alcanzables = sum(plan is not None for plan in planes)
+    print(f"{planificador.get_num_puntos()} puntos, {len(planificador.get_velocidades())} velocidades: "
+          f"precálculo {precalculo * 1000:.0f} ms")
+    print(f"  lote de {num_lanchas} lanchas en {lote * 1000:.1f} ms ({num_lanchas / lote:,.0f} planes/s), "
+          f"{alcanzables} con ida y vuelta posibles; plan individual {individual * 1e6:.0f} µs")
+    return num_lanchas / lote
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+Serialización de flotas por columnas
+Empaqueta los campos de los barcos en buffers contiguos y los transfiere fuera de banda
+con pickle protocolo 5 (PickleBuffer), sin copias por campo
+"""
+
+import json
+import pickle
+import time
+from array import array
+from itertools import accumulate
+
+from .embarcacion import Embarcacion
+from .lancha import Lancha
+from .velero import Velero
+
+
+TIPO_LANCHA = 1
+TIPO_VELERO = 2
+
+# Columnas numéricas (nombre, código de tipo de array)
+COLUMNAS = [
+    ("tipo", "b"),
+    ("num_max_tripulantes", "q"),
+    ("navegando", "b"),
+    ("velocidad", "d"),
+    ("rumbo", "i"),
+    ("patron", "i"),
+    ("tripulacion", "q"),
+    ("tiempo_total", "d"),
+    ("num_motores", "b"),
+    ("combustible", "d"),
+    ("num_mastiles", "b"),
+    ("fin_nombre", "q"),
+]
+
+
+def _numero(valor):
+    """Devuelve un entero si el valor almacenado como double lo era"""
+    return int(valor) if valor.is_integer() else valor
+
+
+def _codificar(valores, tabla, indices):
+    """Codifica cadenas con un diccionario (tabla de valores únicos + código por barco)"""
+    codigos = []
+    for valor in valores:
+        codigo = indices.get(valor)
+        if codigo is None:
+            codigo = indices[valor] = len(tabla)
+            tabla.append(valor)
+        codigos.append(codigo)
+    return array("i", codigos)
+
+
+class FlotaEmpaquetada:
+    """Flota almacenada por columnas en buffers contiguos"""
+    
+    def __init__(self, columnas, nombres, rumbos, patrones):
+        """Constructor de FlotaEmpaquetada (usar desde_barcos para empaquetar una flota)"""
+        
+        # Validaciones
+        for columna, _ in COLUMNAS:
+            if columna not in columnas:
+                raise ValueError(f"Falta la columna {columna} en la flota empaquetada.")
+        
+        self._columnas = columnas
+        self._nombres = nombres
+        self._rumbos = rumbos
+        self._patrones = patrones
+    
+    # ========== EMPAQUETADO ==========
+    
+    @classmethod
+    def desde_barcos(cls, barcos):
+        """Empaqueta una secuencia de lanchas y veleros"""
+        
+        if barcos is None:
+            raise ValueError("La flota a empaquetar no existe.")
+        
+        barcos = list(barcos)
+        for barco in barcos:
+            if not isinstance(barco, (Lancha, Velero)):
+                raise ValueError(f"Solo se pueden empaquetar lanchas y veleros, no {type(barco).__name__}.")
+        
+        es_lancha = [isinstance(barco, Lancha) for barco in barcos]
+        
+        nombres = bytearray()
+        fines = []
+        for barco in barcos:
+            nombres += barco._nombre.encode("utf-8")
+            fines.append(len(nombres))
+        
+        rumbos = []
+        patrones = []
+        columnas = {
+            "tipo": array("b", [TIPO_LANCHA if lancha else TIPO_VELERO for lancha in es_lancha]),
+            "num_max_tripulantes": array("q", [barco._num_max_tripulantes for barco in barcos]),
+            "navegando": array("b", [barco._navegando for barco in barcos]),
+            "velocidad": array("d", [barco._velocidad for barco in barcos]),
+            "rumbo": _codificar([barco._rumbo for barco in barcos], rumbos, {}),
+            "patron": _codificar([barco._patron for barco in barcos], patrones, {}),
+            "tripulacion": array("q", [barco._tripulacion for barco in barcos]),
+            "tiempo_total": array("d", [barco._tiempo_total_navegacion for barco in barcos]),
+            "num_motores": array("b", [barco._num_motores if lancha else 0 for barco, lancha in zip(barcos, es_lancha)]),
+            "combustible": array("d", [barco._cantidad_combustible if lancha else 0 for barco, lancha in zip(barcos, es_lancha)]),
+            "num_mastiles": array("b", [0 if lancha else barco._num_mastiles for barco, lancha in zip(barcos, es_lancha)]),
+            "fin_nombre": array("q", fines),
+        }
+        
+        return cls(columnas, nombres, rumbos, patrones)
+    
+    @classmethod
+    def uniforme(cls, nombres, tipo, num_max_tripulantes, num_motores=0, combustible=0, num_mastiles=0):
+        """Flota de barcos iguales en puerto, construida directamente por columnas (ver crear_lote)"""
+        
+        cantidad = len(nombres)
+        
+        texto = "".join(nombres)
+        nombres_codificados = bytearray(texto.encode("utf-8"))
+        longitudes = map(len, nombres) if texto.isascii() else (len(nombre.encode("utf-8")) for nombre in nombres)
+        
+        columnas = {
+            "tipo": array("b", [tipo]) * cantidad,
+            "num_max_tripulantes": array("q", [num_max_tripulantes]) * cantidad,
+            "navegando": array("b", [0]) * cantidad,
+            "velocidad": array("d", [0]) * cantidad,
+            "rumbo": array("i", [0]) * cantidad,
+            "patron": array("i", [0]) * cantidad,
+            "tripulacion": array("q", [0]) * cantidad,
+            "tiempo_total": array("d", [0]) * cantidad,
+            "num_motores": array("b", [num_motores]) * cantidad,
+            "combustible": array("d", [combustible]) * cantidad,
+            "num_mastiles": array("b", [num_mastiles]) * cantidad,
+            "fin_nombre": array("q", accumulate(longitudes)),
+        }
+        
+        return cls(columnas, nombres_codificados, [Embarcacion.RUMBO_POR_DEFECTO], [Embarcacion.PATRON_POR_DEFECTO])
+    
+    # ========== PICKLE PROTOCOLO 5 ==========
+    
+    def __reduce_ex__(self, protocolo):
+        """Con protocolo >= 5 cada columna viaja como un PickleBuffer (fuera de banda si se pide)"""
+        
+        if protocolo >= 5:
+            buffers = [pickle.PickleBuffer(self._columnas[columna]) for columna, _ in COLUMNAS]
+            buffers.append(pickle.PickleBuffer(self._nombres))
+            return (_reconstruir, (self._rumbos, self._patrones, *buffers))
+        
+        columnas = {columna: bytes(self._columnas[columna]) for columna, _ in COLUMNAS}
+        return (_reconstruir_copia, (self._rumbos, self._patrones, columnas, bytes(self._nombres)))
+    
+    def volcar(self):
+        """Serializa la flota: devuelve la cabecera pickle y la lista de buffers fuera de banda"""
+        buffers = []
+        cabecera = pickle.dumps(self, protocol=5, buffer_callback=buffers.append)
+        return cabecera, buffers
+    
+    @staticmethod
+    def cargar(cabecera, buffers):
+        """Reconstruye una flota a partir de volcar(), como vistas sobre los buffers recibidos"""
+        return pickle.loads(cabecera, buffers=buffers)
+    
+    # ========== VISTAS ==========
+    
+    def __len__(self):
+        return len(self._columnas["tipo"])
+    
+    def get_columna(self, columna):
+        """Vista sin copia de una columna"""
+        if columna not in self._columnas:
+            raise ValueError(f"La columna {columna} no existe.")
+        return self._columnas[columna]
+    
+    def get_rumbos(self):
+        return list(self._rumbos)
+    
+    def get_patrones(self):
+        return list(self._patrones)
+    
+    def get_nombre(self, i):
+        fines = self._columnas["fin_nombre"]
+        inicio = fines[i - 1] if i > 0 else 0
+        return bytes(self._nombres[inicio:fines[i]]).decode("utf-8")
+    
+    # ========== RECONSTRUCCIÓN DE BARCOS ==========
+    
+    def barco(self, i):
+        """Reconstruye el barco i (sin pasar por el constructor ni tocar los contadores de creados)"""
+        
+        c = self._columnas
+        lancha = c["tipo"][i] == TIPO_LANCHA
+        barco = object.__new__(Lancha if lancha else Velero)
+        
+        barco.__dict__.update(
+            _nombre=self.get_nombre(i),
+            _num_max_tripulantes=c["num_max_tripulantes"][i],
+            _navegando=bool(c["navegando"][i]),
+            _velocidad=_numero(c["velocidad"][i]),
+            _patron=self._patrones[c["patron"][i]],
+            _rumbo=self._rumbos[c["rumbo"][i]],
+            _tripulacion=c["tripulacion"][i],
+            _tiempo_total_navegacion=c["tiempo_total"][i],
+        )
+        barco._codigo_rumbo, barco._rumbo = Embarcacion._rumbos.internar(barco._rumbo)
+        barco._codigo_patron, barco._patron = Embarcacion._patrones.internar(barco._patron)
+        
+        if lancha:
+            barco._num_motores = c["num_motores"][i]
+            barco._cantidad_combustible = _numero(c["combustible"][i])
+        else:
+            barco._num_mastiles = c["num_mastiles"][i]
+        
+        Embarcacion._registro.añadir(barco)
+        return barco
+    
+    def barcos(self):
+        """Reconstruye todos los barcos"""
+        return [self.barco(i) for i in range(len(self))]
+
+
+def _reconstruir(rumbos, patrones, *buffers):
+    """Reconstrucción sin copia: cada columna es una vista tipada sobre su buffer"""
+    
+    columnas = {}
+    for (columna, formato), buffer in zip(COLUMNAS, buffers):
+        columnas[columna] = memoryview(buffer).cast("B").cast(formato)
+    
+    return FlotaEmpaquetada(columnas, memoryview(buffers[-1]).cast("B"), rumbos, patrones)
+
+
+def _reconstruir_copia(rumbos, patrones, columnas, nombres):
+    """Reconstrucción para protocolos anteriores al 5"""
+    
+    for columna, formato in COLUMNAS:
+        valores = array(formato)
+        valores.frombytes(columnas[columna])
+        columnas[columna] = valores
+    
+    return FlotaEmpaquetada(columnas, bytearray(nombres), rumbos, patrones)
+
+
+# ========== FICHEROS DE FLOTA (JSON POR LÍNEAS) ==========
+
+def registro_barco(barco):
+    """Datos de construcción de un barco como diccionario (una línea del fichero de flota)"""
+    
+    if isinstance(barco, Lancha):
+        return {"tipo": "Lancha", "nombre": barco._nombre, "num_max_tripulantes": barco._num_max_tripulantes,
+                "num_motores": barco._num_motores, "combustible": barco._cantidad_combustible}
+    if isinstance(barco, Velero):
+        return {"tipo": "Velero", "nombre": barco._nombre, "num_mastiles": barco._num_mastiles,
+                "num_max_tripulantes": barco._num_max_tripulantes}
+    raise ValueError(f"Solo se pueden guardar lanchas y veleros, no {type(barco).__name__}.")
+
+
+def barco_desde_registro(registro):
+    """Construye el barco (con todas las validaciones del constructor)"""
+    
+    tipo = registro.get("tipo")
+    if tipo == "Lancha":
+        return Lancha(registro["nombre"], registro["num_max_tripulantes"], registro["num_motores"], registro["combustible"])
+    if tipo == "Velero":
+        return Velero(registro["nombre"], registro["num_mastiles"], registro["num_max_tripulantes"])
+    raise ValueError(f"Tipo de embarcación desconocido: {tipo}.")
+
+
+def escribir_flota(registros, ruta):
+    """Escribe barcos o diccionarios de registro_barco, uno por línea; devuelve cuántos"""
+    
+    num = 0
+    with open(ruta, "w", encoding="utf-8") as fichero:
+        for registro in registros:
+            if not isinstance(registro, dict):
+                registro = registro_barco(registro)
+            fichero.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            num += 1
+    return num
+
+
+def leer_registros(ruta):
+    """Diccionarios de un fichero de flota, de uno en uno"""
+    
+    with open(ruta, encoding="utf-8") as fichero:
+        for linea in fichero:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def leer_flota(ruta):
+    """Construye los barcos de un fichero de flota, de uno en uno"""
+    
+    for numero, registro in enumerate(leer_registros(ruta), 1):
+        try:
+            yield barco_desde_registro(registro)
+        except KeyError as e:
+            raise ValueError(f"{ruta}: al barco {numero} le falta el campo {e.args[0]}.")
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=200_000):
+    """Compara la serialización por columnas con pickle.dumps(lista_de_barcos)"""
+    
+    barcos = []
+    for i in range(num_barcos):
+        if i % 2 == 0:
+            barco = Lancha(f"Bench L{i}", 4, 2, 40)
+            barco.iniciar_navegacion(20, "norte", f"Patrón {i % 100}", 2)
+        else:
+            barco = Velero(f"Bench V{i}", 2, 4)
+        barcos.append(barco)
+    
+    inicio = time.perf_counter()
+    datos = pickle.dumps(barcos, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(datos)
+    plano = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    empaquetada = FlotaEmpaquetada.desde_barcos(barcos)
+    empaquetado = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    cabecera, buffers = empaquetada.volcar()
+    vistas = FlotaEmpaquetada.cargar(cabecera, [buffer.raw() for buffer in buffers])
+    transferencia = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    vistas.barcos()
+    reconstruccion = time.perf_counter() - inicio
+    
+    tam_columnas = len(cabecera) + sum(buffer.raw().nbytes for buffer in buffers)
+    print(f"{num_barcos} barcos")
+    print(f"  pickle de la lista:        {plano * 1000:9.1f} ms, {len(datos) / 1e6:7.2f} MB")
+    print(f"  empaquetado por columnas:  {empaquetado * 1000:9.1f} ms")
+    print(f"  volcado + carga (vistas):  {transferencia * 1000:9.1f} ms, {tam_columnas / 1e6:7.2f} MB")
+    print(f"  reconstrucción de barcos:  {reconstruccion * 1000:9.1f} ms")
+    
+    for barco in barcos:
+        if barco.is_navegando():
+            barco.parar_navegacion(0)
+    
+    return plano, empaquetado, transferencia, reconstruccion
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Tablas de símbolos
+Asignan un código entero pequeño a cada rumbo y patrón distinto y guardan una única copia
+de cada cadena, compartida por todas las embarcaciones
+"""
+
+
+class TablaSimbolos:
+    """Correspondencia cadena <-> código entero, con códigos consecutivos desde 0"""
+    
+    def __init__(self, simbolos=(), max_simbolos=None):
+        """Constructor de TablaSimbolos (simbolos: los que reciben los primeros códigos; max_simbolos: None sin límite)"""
+        
+        if max_simbolos is not None and max_simbolos < len(simbolos):
+            raise ValueError("El límite de la tabla de símbolos no deja sitio para los símbolos iniciales.")
+        
+        self._codigos = {}
+        self._simbolos = []
+        self._max_simbolos = max_simbolos
+        for simbolo in simbolos:
+            self.codigo(simbolo)
+    
+    def __len__(self):
+        return len(self._simbolos)
+    
+    def __contains__(self, simbolo):
+        return simbolo in self._codigos
+    
+    def admite(self, simbolo):
+        """Si el símbolo ya está en la tabla o aún cabe uno nuevo"""
+        return simbolo in self._codigos or self._max_simbolos is None or len(self._simbolos) < self._max_simbolos
+    
+    def codigo(self, simbolo):
+        """Código del símbolo; si es nuevo se le asigna el siguiente"""
+        
+        codigo = self._codigos.get(simbolo)
+        if codigo is None:
+            if not isinstance(simbolo, str):
+                raise ValueError(f"Solo se pueden registrar cadenas en la tabla de símbolos, no {type(simbolo).__name__}.")
+            if not self.admite(simbolo):
+                raise ValueError(f"La tabla de símbolos está llena, admite como máximo {self._max_simbolos} símbolos.")
+            codigo = self._codigos[simbolo] = len(self._simbolos)
+            self._simbolos.append(simbolo)
+        return codigo
+    
+    def buscar(self, simbolo):
+        """Código del símbolo o None si no está en la tabla (no lo registra)"""
+        return self._codigos.get(simbolo)
+    
+    def simbolo(self, codigo):
+        return self._simbolos[codigo]
+    
+    def internar(self, simbolo):
+        """Código y copia compartida del símbolo"""
+        
+        codigo = self.codigo(simbolo)
+        return codigo, self._simbolos[codigo]
+    
+    def codigos(self, simbolos):
+        """Conjunto de códigos de varios símbolos, para validar con operaciones enteras"""
+        return frozenset(self.codigo(simbolo) for simbolo in simbolos)
+    
+    def get_simbolos(self):
+        return list(self._simbolos)
+    
+    def get_max_simbolos(self):
+        return self._max_simbolos
\ No newline at end of file
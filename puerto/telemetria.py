@@ -0,0 +1,328 @@
+"""
+Servidor de telemetría
+Recibe por red salidas, cambios de rumbo, regatas, llegadas y repostajes en formato JSON por líneas,
+los aplica a la flota en microlotes y confirma cada mensaje con su estado
+"""
+
+import asyncio
+import json
+import time
+
+from .velero import Velero
+
+
+class ServidorTelemetria:
+    """Servidor asyncio que aplica a la flota los comandos de navegación recibidos"""
+    
+    TAM_LECTURA = 64 * 1024
+    MAX_LOTES_PENDIENTES = 32
+    MAX_LONGITUD_LINEA = 1024 * 1024
+    
+    def __init__(self, barcos, host="127.0.0.1", puerto=0):
+        """Constructor de ServidorTelemetria"""
+        
+        if barcos is None:
+            raise ValueError("La flota del servidor de telemetría no existe.")
+        
+        self._flota = {barco.get_nombre_barco(): barco for barco in barcos}
+        self._host = host
+        self._puerto = puerto
+        self._servidor = None
+        self._conexiones = set()
+        
+        # Instante del último mensaje que lo traía (tiempo de los eventos, no de llegada)
+        self._instante = None
+        
+        # Estadísticas
+        self._num_mensajes = 0
+        self._num_errores = 0
+        self._num_lotes = 0
+    
+    # ========== MÉTODOS GETTERS ==========
+    
+    def get_puerto(self):
+        return self._puerto
+    
+    def get_num_mensajes(self):
+        return self._num_mensajes
+    
+    def get_num_errores(self):
+        return self._num_errores
+    
+    def get_num_lotes(self):
+        return self._num_lotes
+    
+    def reloj(self):
+        """Instante del último mensaje aplicado que lo indicaba, o la hora actual si ninguno lo hizo"""
+        return self._instante if self._instante is not None else time.time()
+    
+    # ========== CICLO DE VIDA ==========
+    
+    async def iniciar(self):
+        """Empieza a escuchar y devuelve el puerto asignado"""
+        
+        self._servidor = await asyncio.start_server(self._atender, self._host, self._puerto)
+        self._puerto = self._servidor.sockets[0].getsockname()[1]
+        return self._puerto
+    
+    async def cerrar(self):
+        """Deja de aceptar conexiones y espera a que terminen las existentes"""
+        
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        
+        if self._conexiones:
+            await asyncio.gather(*self._conexiones, return_exceptions=True)
+    
+    # ========== APLICACIÓN DE COMANDOS ==========
+    
+    def aplicar(self, lineas):
+        """Aplica un microlote de líneas JSON y devuelve la confirmación de cada una"""
+        
+        confirmaciones = []
+        flota = self._flota
+        
+        for linea in lineas:
+            identificador = None
+            try:
+                mensaje = json.loads(linea)
+                identificador = mensaje.get("id")
+                barco = flota.get(mensaje.get("barco"))
+                if barco is None:
+                    raise ValueError(f"La embarcación {mensaje.get('barco')} no existe.")
+                
+                instante = mensaje.get("instante")
+                if instante is not None:
+                    if type(instante) not in (int, float):
+                        raise ValueError("El instante del mensaje debe ser un número de segundos.")
+                    self._instante = instante
+                
+                operacion = mensaje.get("op")
+                if operacion == "iniciar_navegacion":
+                    barco.iniciar_navegacion(
+                        mensaje["velocidad"], mensaje["rumbo"], mensaje["patron"], mensaje["tripulantes"]
+                    )
+                elif operacion == "set_rumbo":
+                    barco.set_rumbo(mensaje["rumbo"])
+                elif operacion == "parar_navegacion":
+                    barco.parar_navegacion(mensaje["tiempo"])
+                elif operacion == "iniciar_regata":
+                    otro_barco = flota.get(mensaje["otro"])
+                    if otro_barco is None:
+                        raise ValueError(f"La embarcación {mensaje['otro']} no existe.")
+                    barco.iniciar_regata(otro_barco)
+                elif operacion == "repostar":
+                    barco.repostar(mensaje.get("cantidad"))
+                else:
+                    raise ValueError(f"Operación desconocida: {operacion}.")
+                
+                if type(identificador) is int:
+                    confirmaciones.append(f'{{"id":{identificador},"ok":true}}\n')
+                else:
+                    confirmaciones.append(f'{{"id":{json.dumps(identificador)},"ok":true}}\n')
+            except KeyError as e:
+                self._num_errores += 1
+                confirmaciones.append(self._error(identificador, f"Falta el campo {e.args[0]}."))
+            except Exception as e:
+                self._num_errores += 1
+                confirmaciones.append(self._error(identificador, str(e)))
+        
+        self._num_mensajes += len(lineas)
+        self._num_lotes += 1
+        return confirmaciones
+    
+    @staticmethod
+    def _error(identificador, mensaje):
+        return json.dumps({"id": identificador, "ok": False, "error": mensaje}, ensure_ascii=False) + "\n"
+    
+    # ========== CONEXIONES ==========
+    
+    async def _atender(self, lector, escritor):
+        """Una tarea lee y trocea en líneas; otra aplica los lotes y confirma"""
+        
+        tarea = asyncio.current_task()
+        self._conexiones.add(tarea)
+        
+        # Cola acotada: si el procesado se retrasa, se deja de leer del socket (contrapresión)
+        cola = asyncio.Queue(maxsize=ServidorTelemetria.MAX_LOTES_PENDIENTES)
+        procesador = asyncio.create_task(self._procesar(cola, escritor))
+        
+        resto = b""
+        try:
+            while True:
+                datos = await lector.read(ServidorTelemetria.TAM_LECTURA)
+                if not datos:
+                    break
+                
+                lineas = (resto + datos).split(b"\n")
+                resto = lineas.pop()
+                
+                # Un cliente que no envía saltos de línea no puede hacer crecer el búfer sin límite
+                if len(resto) > ServidorTelemetria.MAX_LONGITUD_LINEA:
+                    self._num_errores += 1
+                    resto = b""
+                    break
+                
+                lineas = [linea for linea in lineas if linea.strip()]
+                if lineas and not await self._encolar(cola, lineas, procesador):
+                    resto = b""
+                    break
+            
+            if resto.strip():
+                await self._encolar(cola, [resto], procesador)
+        except ConnectionError:
+            pass
+        finally:
+            await self._encolar(cola, None, procesador)
+            await procesador
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+            self._conexiones.discard(tarea)
+    
+    @staticmethod
+    async def _encolar(cola, elemento, procesador):
+        """Espera hueco en la cola salvo que el procesador ya haya terminado; devuelve si se encoló"""
+        
+        if procesador.done():
+            return False
+        
+        try:
+            cola.put_nowait(elemento)
+            return True
+        except asyncio.QueueFull:
+            pass
+        
+        espera = asyncio.ensure_future(cola.put(elemento))
+        await asyncio.wait((espera, procesador), return_when=asyncio.FIRST_COMPLETED)
+        if espera.done():
+            return True
+        
+        espera.cancel()
+        return False
+    
+    async def _procesar(self, cola, escritor):
+        while True:
+            lote = await cola.get()
+            if lote is None:
+                return
+            
+            # Agrupar todo lo que ya esté esperando en un único microlote
+            fin = False
+            while not cola.empty():
+                siguiente = cola.get_nowait()
+                if siguiente is None:
+                    fin = True
+                    break
+                lote.extend(siguiente)
+            
+            confirmaciones = self.aplicar(lote)
+            try:
+                escritor.write("".join(confirmaciones).encode("utf-8"))
+                await escritor.drain()
+            except ConnectionError:
+                fin = True
+            
+            if fin:
+                # Vaciar la cola para no bloquear al lector
+                while not cola.empty():
+                    cola.get_nowait()
+                return
+
+
+# ========== GENERADOR DE CARGA ==========
+
+def _mensajes(barcos, num_mensajes):
+    """Secuencia válida por barco: salida, cambio de rumbo y llegada"""
+    
+    ciclos = []
+    for barco in barcos:
+        nombre = barco.get_nombre_barco()
+        if isinstance(barco, Velero):
+            salida, cambio, velocidad = "ceñida", "empopada", 10
+        else:
+            salida, cambio, velocidad = "norte", "sur", 20
+        plantillas = [
+            {"op": "iniciar_navegacion", "barco": nombre, "velocidad": velocidad,
+             "rumbo": salida, "patron": "Carga", "tripulantes": 0},
+            {"op": "set_rumbo", "barco": nombre, "rumbo": cambio},
+            {"op": "parar_navegacion", "barco": nombre, "tiempo": 0.01},
+        ]
+        # Se serializa una sola vez; el id se antepone a cada mensaje
+        ciclos.append([json.dumps(plantilla, ensure_ascii=False)[1:] for plantilla in plantillas])
+    
+    for i in range(num_mensajes):
+        # Ronda de fases: todos los barcos avanzan una fase antes de pasar a la siguiente
+        ronda, j = divmod(i, len(ciclos))
+        yield f'{{"id":{i},' + ciclos[j][ronda % 3]
+
+
+async def generar_carga(host, puerto, barcos, num_mensajes, tam_bloque=2_000):
+    """Cliente local que envía num_mensajes y espera todas las confirmaciones"""
+    
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    resultado = {"ok": 0, "errores": 0}
+    
+    async def enviar():
+        bloque = []
+        for mensaje in _mensajes(barcos, num_mensajes):
+            bloque.append(mensaje)
+            if len(bloque) >= tam_bloque:
+                escritor.write(("\n".join(bloque) + "\n").encode("utf-8"))
+                bloque = []
+                await escritor.drain()
+        if bloque:
+            escritor.write(("\n".join(bloque) + "\n").encode("utf-8"))
+            await escritor.drain()
+    
+    async def recibir():
+        pendientes = num_mensajes
+        while pendientes > 0:
+            linea = await lector.readline()
+            if not linea:
+                break
+            pendientes -= 1
+            if b'"ok":true' in linea:
+                resultado["ok"] += 1
+            else:
+                resultado["errores"] += 1
+    
+    await asyncio.gather(enviar(), recibir())
+    escritor.close()
+    await escritor.wait_closed()
+    return resultado
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_mensajes=100_000, num_barcos=1_000):
+    """Mide mensajes por segundo con servidor y generador de carga en local"""
+    
+    from .lancha import Lancha
+    
+    barcos = [Lancha(f"Telemetría {i}", 2, 1, 50) if i % 2 == 0 else Velero(f"Telemetría {i}", 1, 2)
+              for i in range(num_barcos)]
+    
+    async def ejecutar():
+        servidor = ServidorTelemetria(barcos)
+        puerto = await servidor.iniciar()
+        inicio = time.perf_counter()
+        resultado = await generar_carga("127.0.0.1", puerto, barcos, num_mensajes)
+        segundos = time.perf_counter() - inicio
+        await servidor.cerrar()
+        return servidor, resultado, segundos
+    
+    servidor, resultado, segundos = asyncio.run(ejecutar())
+    print(
+        f"{num_mensajes} mensajes en {segundos:.2f} s: {num_mensajes / segundos:,.0f} mensajes/s, "
+        f"{resultado['errores']} errores, {servidor.get_num_lotes()} microlotes"
+    )
+    return num_mensajes / segundos
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""
+Salidas en lote
+Inicia la navegación de muchos barcos a la vez con semántica todo o nada: se valida el lote
+completo antes de tocar ningún barco y los contadores se actualizan una sola vez
+"""
+
+import time
+
+from .embarcacion import Embarcacion
+from .velero import Velero
+
+
+class TransaccionSalidas:
+    """Acumula salidas y las aplica juntas al confirmar; se puede usar con with"""
+    
+    def __init__(self):
+        """Constructor de TransaccionSalidas"""
+        
+        self._salidas = []
+        self._confirmada = False
+    
+    def __len__(self):
+        return len(self._salidas)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        # Si el bloque falla no se aplica nada; si termina bien se confirma
+        if tipo is None and not self._confirmada:
+            self.confirmar()
+        return False
+    
+    def iniciar_navegacion(self, barco, velocidad, rumbo, patron, num_tripulantes):
+        """Añade una salida a la transacción (no se aplica hasta confirmar)"""
+        
+        if self._confirmada:
+            raise Exception("La transacción ya está confirmada, no se pueden añadir más salidas.")
+        self._salidas.append((barco, velocidad, rumbo, patron, num_tripulantes))
+    
+    def confirmar(self):
+        """Aplica todas las salidas o ninguna"""
+        
+        if self._confirmada:
+            raise Exception("La transacción ya está confirmada.")
+        iniciar_navegacion_lote(self._salidas)
+        self._confirmada = True
+
+
+def iniciar_navegacion_lote(salidas):
+    """
+    salidas: (barco, velocidad, rumbo, patrón, tripulantes) por barco.
+    Si alguna salida no es válida se lanza su excepción y ningún barco sale.
+    """
+    
+    salidas = list(salidas)
+    
+    # 1. Validar el lote completo sin modificar nada
+    vistos = set()
+    for posicion, (barco, velocidad, rumbo, patron, num_tripulantes) in enumerate(salidas):
+        if barco is None:
+            raise ValueError(f"La embarcación de la salida {posicion} no existe.")
+        
+        if id(barco) in vistos:
+            raise Exception(f"La embarcación {barco._nombre} aparece más de una vez en el lote de salidas.")
+        vistos.add(id(barco))
+        
+        barco._validar_salida(velocidad, rumbo, patron, num_tripulantes)
+    
+    # 2. Aplicar en una pasada, guardando el estado anterior por si algo falla a mitad
+    aplicados = []
+    rumbos = Embarcacion._rumbos
+    patrones = Embarcacion._patrones
+    try:
+        for barco, velocidad, rumbo, patron, num_tripulantes in salidas:
+            aplicados.append((barco, barco._velocidad, barco._rumbo, barco._patron, barco._tripulacion))
+            barco._navegando = True
+            barco._velocidad = velocidad
+            barco._codigo_rumbo, barco._rumbo = rumbos.internar(rumbo)
+            barco._codigo_patron, barco._patron = patrones.internar(patron)
+            barco._tripulacion = num_tripulantes
+    except BaseException:
+        for barco, velocidad, rumbo, patron, tripulacion in aplicados:
+            barco._navegando = False
+            barco._velocidad = velocidad
+            barco._codigo_rumbo, barco._rumbo = rumbos.internar(rumbo)
+            barco._codigo_patron, barco._patron = patrones.internar(patron)
+            barco._tripulacion = tripulacion
+        raise
+    
+    # 3. Contador de clase y oyentes, una vez por lote
+    Embarcacion._num_barcos_navegando += len(salidas)
+    
+    if Embarcacion._oyentes and salidas:
+        barcos = [salida[0] for salida in salidas]
+        for oyente in list(Embarcacion._oyentes):
+            oyente.al_iniciar_navegacion_lote(barcos)
+    
+    return len(salidas)
+
+
+# ========== BENCHMARK ==========
+
+def benchmark(num_barcos=200, repeticiones=500):
+    """Salida de una regata de num_barcos veleros: llamada a llamada frente a lote"""
+    
+    from .agregados import AgregadosFlota
+    
+    veleros = [Velero(f"Salida {i}", 2, 4) for i in range(num_barcos)]
+    salidas = [(velero, 10, "ceñida", f"Patrón {i}", 2) for i, velero in enumerate(veleros)]
+    agregados = AgregadosFlota().conectar()
+    
+    def parar():
+        for velero in veleros:
+            velero.parar_navegacion(0)
+    
+    individual = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for velero, velocidad, rumbo, patron, tripulantes in salidas:
+            velero.iniciar_navegacion(velocidad, rumbo, patron, tripulantes)
+        individual += time.perf_counter() - inicio
+        parar()
+    
+    lote = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        iniciar_navegacion_lote(salidas)
+        lote += time.perf_counter() - inicio
+        parar()
+    
+    # Un lote con una salida inválida al final no deja ningún barco en el mar
+    navegando = Embarcacion.get_num_barcos_navegando()
+    try:
+        iniciar_navegacion_lote(salidas[:-1] + [(veleros[-1], 99, "ceñida", "Patrón", 2)])
+    except ValueError:
+        pass
+    assert Embarcacion.get_num_barcos_navegando() == navegando
+    assert not any(velero.is_navegando() for velero in veleros)
+    
+    agregados.desconectar()
+    print(f"{repeticiones} salidas de {num_barcos} veleros: "
+          f"llamada a llamada {individual * 1000:.1f} ms, en lote {lote * 1000:.1f} ms")
+    return individual / lote
+
+
+if __name__ == "__main__":
+    benchmark()
\ No newline at end of file
@@ -3,9 +3,9 @@ Clase Velero
 Embarcación a vela que puede participar en regatas
 """
 
-from embarcacion import Embarcacion
-from i_regateable import IRegateable
-from excepciones import IllegalArgumentException
+from .embarcacion import Embarcacion
+from .i_regateable import IRegateable
+from .excepciones import IllegalArgumentException
 
 
 class Velero(Embarcacion, IRegateable):
@@ -16,9 +16,11 @@ class Velero(Embarcacion, IRegateable):
     MAX_MASTILES = 4
     MIN_VELOCIDAD_VELERO = 2
     MAX_VELOCIDAD_VELERO = 30
+    RUMBOS_VELERO = ("ceñida", "empopada")
     
     # Atributos de clase
     _num_veleros = 0
+    _codigos_rumbo = Embarcacion._rumbos.codigos(RUMBOS_VELERO)
     
     def __init__(self, nombre=None, num_mastiles=None, num_max_tripulantes=None):
         """Constructor de Velero"""
@@ -31,10 +33,7 @@ class Velero(Embarcacion, IRegateable):
             num_max_tripulantes = Embarcacion.MIN_TRIPULANTES
         else:
             # Validación para constructor con parámetros
-            if num_mastiles < Velero.MIN_MASTILES or num_mastiles > Velero.MAX_MASTILES:
-                raise IllegalArgumentException(
-                    f"El número de mástiles debe estar entre {Velero.MIN_MASTILES} y {Velero.MAX_MASTILES}."
-                )
+            Velero._validar_num_mastiles(num_mastiles)
             
             Velero._num_veleros += 1
         
@@ -43,6 +42,50 @@ class Velero(Embarcacion, IRegateable):
         
         # Atributo constante propio de Velero
         self._num_mastiles = num_mastiles
+        
+        if Embarcacion._oyentes:
+            self._notificar("al_crear")
+    
+    @staticmethod
+    def _validar_num_mastiles(num_mastiles):
+        if num_mastiles < Velero.MIN_MASTILES or num_mastiles > Velero.MAX_MASTILES:
+            raise IllegalArgumentException(
+                f"El número de mástiles debe estar entre {Velero.MIN_MASTILES} y {Velero.MAX_MASTILES}."
+            )
+    
+    @classmethod
+    def crear_lote(cls, cantidad, num_mastiles=None, num_max_tripulantes=None, prefijo="Velero", vista=False):
+        """
+        Crea cantidad veleros iguales con nombres "prefijo n" consecutivos. Los parámetros se validan
+        una vez y el contador se reserva en bloque. Con vista=True devuelve una FlotaEmpaquetada:
+        no se crean embarcaciones, así que no cuentan en get_num_barcos, no entran en el registro de
+        vivas ni se notifican a los oyentes; solo reservan sus nombres en el contador de veleros.
+        """
+        
+        if cantidad < 0:
+            raise ValueError("El número de veleros a crear no puede ser negativo.")
+        
+        # Valores del constructor sin parámetros para lo que no se indique
+        if num_mastiles is None:
+            num_mastiles = Velero.MIN_MASTILES
+        if num_max_tripulantes is None:
+            num_max_tripulantes = Embarcacion.MIN_TRIPULANTES
+        
+        Embarcacion._validar_num_max_tripulantes(num_max_tripulantes)
+        Velero._validar_num_mastiles(num_mastiles)
+        nombres = Embarcacion._nombres_lote(prefijo, Velero._num_veleros + 1, cantidad)
+        
+        # Reservar el bloque de valores del contador
+        Velero._num_veleros += cantidad
+        
+        if vista:
+            from .serializacion import FlotaEmpaquetada, TIPO_VELERO
+            return FlotaEmpaquetada.uniforme(nombres, TIPO_VELERO, num_max_tripulantes, num_mastiles=num_mastiles)
+        
+        return cls._crear_lote(nombres, {
+            "_num_max_tripulantes": num_max_tripulantes,
+            "_num_mastiles": num_mastiles,
+        })
     
     # ========== MÉTODOS GETTERS ==========
     
@@ -62,25 +105,38 @@ class Velero(Embarcacion, IRegateable):
         if rumbo is None:
             raise ValueError("El rumbo no puede ser nulo, debes indicar el rumbo (ceñida o empopada) para poder modificarlo.")
         
-        if rumbo not in ["ceñida", "empopada"]:
+        if Embarcacion._rumbos.buscar(rumbo) not in Velero._codigos_rumbo:
             raise ValueError("El rumbo no es correcto, debes indicar el rumbo (ceñida o empopada) para poder modificarlo.")
         
         # Llamar al método de la clase base
         super().set_rumbo(rumbo)
     
-    def iniciar_navegacion(self, velocidad, rumbo, patron, num_tripulantes):
-        """Inicia la navegación del velero"""
+    def _validar_salida(self, velocidad, rumbo, patron, num_tripulantes):
+        """Validaciones de salida del velero"""
         
         # Validación específica de Velero
         if velocidad < Velero.MIN_VELOCIDAD_VELERO or velocidad > Velero.MAX_VELOCIDAD_VELERO:
             raise ValueError(f"La velocidad de navegación de {velocidad} nudos es incorrecta.")
         
         # Llamar al método de la clase base
-        super().iniciar_navegacion(velocidad, rumbo, patron, num_tripulantes)
+        super()._validar_salida(velocidad, rumbo, patron, num_tripulantes)
+        
+        # El rumbo se comprueba antes de internarlo, así la tabla solo guarda rumbos válidos
+        if Embarcacion._rumbos.buscar(rumbo) not in Velero._codigos_rumbo:
+            raise ValueError("El rumbo no es correcto, debes indicar el rumbo (ceñida o empopada) para iniciar la navegación.")
     
     def iniciar_regata(self, otro_barco):
         """Inicia una regata con otro velero"""
         
+        clasificacion = self.resultado_regata(otro_barco)
+        
+        if len(clasificacion) == 1:
+            return f"Los barcos {self._nombre} y {otro_barco._nombre} han llegado a la vez a la línea de llegada."
+        return f"El barco {clasificacion[0][0]._nombre} ha llegado antes a la línea de llegada."
+    
+    def resultado_regata(self, otro_barco):
+        """Clasificación de la regata por orden de llegada: lista de grupos, empatados en el mismo grupo"""
+        
         # Validaciones
         if otro_barco is None:
             raise ValueError("El barco con el que se intenta regatear no existe")
@@ -91,7 +147,7 @@ class Velero(Embarcacion, IRegateable):
         if not otro_barco._navegando:
             raise Exception(f"No se puede iniciar la regata, el barco {otro_barco._nombre} no está navegando.")
         
-        if self._rumbo != otro_barco._rumbo:
+        if self._codigo_rumbo != otro_barco._codigo_rumbo:
             raise Exception(
                 f"No se puede iniciar la regata, los barcos {self._nombre} y {otro_barco._nombre} "
                 "deben navegar con el mismo rumbo."
@@ -105,11 +161,11 @@ class Velero(Embarcacion, IRegateable):
         
         # Determinar ganador
         if self._velocidad > otro_barco._velocidad:
-            return f"El barco {self._nombre} ha llegado antes a la línea de llegada."
+            return [[self], [otro_barco]]
         elif self._velocidad < otro_barco._velocidad:
-            return f"El barco {otro_barco._nombre} ha llegado antes a la línea de llegada."
+            return [[otro_barco], [self]]
         else:
-            return f"Los barcos {self._nombre} y {otro_barco._nombre} han llegado a la vez a la línea de llegada."
+            return [[self, otro_barco]]
     
     def señalizar(self):
         """Señalización del velero"""